@@ -2,6 +2,8 @@
 # 📦 Standard Library
 import sys
 import threading
+import time
+from contextlib import contextmanager
 from datetime import datetime
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -10,47 +12,228 @@ import mariadb
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 📊 Data Handling & Visualization
-import numpy as np
-import pandas as pd
-import matplotlib.pyplot as plt
-from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+# ✅ numpy / matplotlib / xlsxwriter are imported where they are used (dashboard, Excel export)
+#    so starting the app doesn't pay for loading them
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🎨 PyQt5 Core & GUI
-from PyQt5.QtCore import QDate, QDateTime, Qt
+from PyQt5.QtCore import QDate, QDateTime, Qt, QTimer
 from PyQt5.QtWidgets import (
     QAction, QApplication, QCheckBox, QComboBox, QDialog, QFileDialog,
     QFormLayout, QHBoxLayout, QHeaderView, QInputDialog,
     QLabel, QLineEdit, QMainWindow, QMessageBox, QPushButton,
     QScrollArea, QSizePolicy, QSpacerItem, QStackedWidget,
-    QStyle, QTableWidget, QTableWidgetItem, QTextEdit,
+    QStyle, QTableView, QTableWidget, QTableWidgetItem, QTextEdit,
     QVBoxLayout, QWidget
 )
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🧩 Project Modules
 from FILE_OPS.file_ops import (
-    load_schedule_on_startup, load_settings,
-    run_scheduled_backups, schedule_backup
+    SCHEDULE_FILE_PATH, load_schedule_from_json, load_schedule_on_startup, load_settings,
+    run_scheduled_backups, schedule_backup, wake_scheduler
 )
 
 from UI.ui import (
     create_login_page, create_settings_page, display_tables_ui,
     edit_selected_job, event_filter, keyPressEvent, main_menu_page,
-    refresh_page, reset_window_size, save_settings, handle_login, 
-    handle_logout, load_table, populate_table, update_table_offset_ui
+    reset_window_size, save_settings, handle_login, 
+    handle_logout, populate_table, append_table_rows, update_table_offset_ui,
+    fetch_table_page, fill_table_page, insert_table_row
 )
 
 from UI.splashscreen import SplashScreen
-from UI.initthread import InitializationThread
+from UI.initthread import run_startup_tasks
+from UI.dbworker import run_in_background, run_task_in_background
+from UI.tablemodels import RowsTableModel, ButtonDelegate, rows_table_view
 
-from data_access import fetch_tables, connect_to_database, fetch_data,  get_primary_key_column, check_primary_key_exists, check_duplicate_primary_key, update_column, update_primary_key, update_auto_increment_if_needed, insert_record
+from data_access import fetch_tables, check_primary_key_exists, check_duplicate_primary_key, update_column, update_primary_key, update_auto_increment_if_needed, insert_record
 
 from error_utils import handle_db_error, log_error
-from data_access import update_status, fetch_primary_key_column
+from data_access import update_status, fetch_primary_key_column, ensure_start_date_index, fetch_column_types
+from data_access import create_connection_pool, pooled_cursor, transaction
 from data_access import fetch_table_data_with_columns
+from data_access import fetch_fulltext_indexes, build_search_query, fulltext_searchable
+from data_access import build_insert_query, insert_records, build_table_sql, update_columns_bulk
+from data_access import fetch_job_rows, run_aggregates_parallel, write_excel_sheets
 from UI.ui import create_table_view_dialog, add_record_dialog  # You’ll create this in ui.py
 
+# ✅ Hour-of-day x-axis for the job start time chart (constant, built once)
+_HOUR_TICKS = list(range(0, 1440, 60))
+_HOUR_LABELS = [f'{i//60:02}:{i%60:02}' for i in range(0, 1440, 60)]
+
+# ✅ Dashboard charts drawn straight from a (label, value) aggregate, keyed by query name (see render_chart).
+# "axes" is applied with one ax.set(); "suptitle" goes above the figure; "rotate" tilts the x labels.
+_DASHBOARD_CHARTS = {
+    "acquisition": {"kind": "pie", "figsize": (6, 4), "axes": {},
+                    "suptitle": "Customer Acquisition by Referral Source"},
+    "top_customers": {"kind": "bar", "figsize": (8, 4), "color": "blue", "rotate": True, "str_labels": True,
+                      "axes": {"xlabel": "Customer ID", "ylabel": "Job Count"},
+                      "suptitle": "Top Customers by Job Count"},
+    "device_brands": {"kind": "barh", "figsize": (8, 4), "color": "orange",
+                      "axes": {"xlabel": "Count", "ylabel": "Device Brand"},
+                      "suptitle": "Most Frequent Device Brands"},
+    "device_types": {"kind": "bar", "figsize": (8, 4), "color": "orange", "rotate": True,
+                     "axes": {"xlabel": "Device Type", "ylabel": "Job Count", "title": "Most Common Device Types"}},
+    "job_status": {"kind": "bar", "figsize": (6, 4), "color": ["blue", "green", "red", "purple", "yellow"],
+                   "axes": {"xlabel": "Job Status", "ylabel": "Count"},
+                   "suptitle": "Job Status Distribution"},
+    "technician_durations": {"kind": "bar", "figsize": (8, 4), "color": "purple", "rotate": True,
+                             "axes": {"xlabel": "Technician", "ylabel": "Average Duration (Days)",
+                                      "title": "Average Job Duration by Technician (in Days)"}},
+    "issues": {"kind": "barh", "figsize": (8, 4), "color": "blue",
+               "axes": {"xlabel": "Count", "ylabel": "Device Issue", "title": "Most Frequent Device Issues"}},
+    "workload": {"kind": "bar", "figsize": (8, 4), "color": "cyan", "rotate": True,
+                 "axes": {"xlabel": "Technician", "ylabel": "Job Count", "title": "Technician Workload Distribution"}},
+    "walkin_services": {"kind": "barh", "figsize": (8, 4), "color": "pink",
+                        "axes": {"xlabel": "Count", "ylabel": "Walk-In Service Description",
+                                 "title": "Most Common Walk-In Services"}},
+}
+
+# ✅ Search results are streamed in batches and capped so a loose filter can't flood the table
+_SEARCH_BATCH_SIZE = 200
+_SEARCH_ROW_CAP = 5000
+
+# ✅ Dashboard aggregates change slowly; reopening the dashboard within this window reuses them
+_DASHBOARD_CACHE_SECONDS = 60
+
+# ✅ Job costs/payments/communications are loaded this many rows at a time as the view scrolls
+_JOB_ROWS_BATCH_SIZE = 200
+
+# ✅ Orders are stamped with the server's time; one statement text for single and batched inserts
+_INSERT_ORDER_SQL = "INSERT INTO orders (JobID, OrderDate, Description, Quantity, TotalCost) VALUES (%s, NOW(), %s, %s, %s)"
+
+# ✅ Cell edits made within this window are written together in one transaction
+_EDIT_DEBOUNCE_MS = 200
+
+# ✅ Job dialog stylesheets, shared by every open instead of rebuilt per dialog
+_NOTES_DIALOG_CSS = """
+QDialog {
+    background-color: #1E1E1E;
+    color: white;
+    border-radius: 8px;
+}
+QLabel {
+    font-size: 14px;
+    font-weight: bold;
+    color: #3A9EF5;
+}
+"""
+
+_NOTES_COMBO_CSS = """
+QComboBox {
+    background-color: #333;
+    color: white;
+    border: 1px solid #3A9EF5;
+    padding: 5px;
+    border-radius: 5px;
+}
+QComboBox QAbstractItemView {
+    background-color: #2A2A2A;
+    selection-background-color: #3A9EF5;
+    color: white;
+}
+"""
+
+_NOTES_LINE_EDIT_CSS = """
+QLineEdit {
+    background-color: #333;
+    color: white;
+    border: 1px solid #3A9EF5;
+    padding: 6px;
+    border-radius: 5px;
+}
+"""
+
+_NOTES_TEXT_CSS = """
+QTextEdit {
+    background-color: #333;
+    color: white;
+    border: 1px solid #3A9EF5;
+    padding: 6px;
+    border-radius: 5px;
+}
+"""
+
+_SAVE_BUTTON_CSS = """
+QPushButton {
+    background-color: #4CAF50;
+    color: white;
+    padding: 10px;
+    font-weight: bold;
+    border-radius: 5px;
+}
+QPushButton:hover {
+    background-color: #45A049;
+}
+"""
+
+_CLOSE_BUTTON_CSS = """
+QPushButton {
+    background-color: #D9534F;
+    color: white;
+    padding: 10px;
+    font-weight: bold;
+    border-radius: 5px;
+}
+QPushButton:hover {
+    background-color: #C9302C;
+}
+"""
+
+_JOB_DETAILS_DIALOG_CSS = """
+QDialog {
+    background-color: #1E1E1E;
+    color: white;
+    border-radius: 8px;
+}
+QLabel {
+    font-size: 14px;
+    font-weight: bold;
+    color: #3A9EF5;
+}
+QLineEdit, QTextEdit, QComboBox {
+    background-color: #333;
+    color: white;
+    border: 1px solid #3A9EF5;
+    padding: 6px;
+    border-radius: 5px;
+}
+QComboBox QAbstractItemView {
+    background-color: #2A2A2A;
+    selection-background-color: #3A9EF5;
+    color: white;
+}
+QCheckBox {
+    color: white;
+}
+QPushButton {
+    background-color: #3A9EF5;
+    color: white;
+    border-radius: 5px;
+    padding: 8px;
+}
+QPushButton:hover {
+    background-color: #307ACC;
+}
+"""
+
+_LIGHT_TABLE_CSS = "background-color: white; color: black;"
+
+_TOTAL_LABEL_CSS = "font-weight: bold; font-size: 14px; color: #3A9EF5; padding-top: 10px;"
+
+_SMALL_ADD_BUTTON_CSS = "background-color: #4CAF50; color: white; padding: 8px; border-radius: 5px;"
+
+_SMALL_CLOSE_BUTTON_CSS = "background-color: #D9534F; color: white; padding: 8px; border-radius: 5px;"
+
+_FLAT_SAVE_BUTTON_CSS = "background-color: #4CAF50; color: white; padding: 10px; font-weight: bold; border-radius: 5px;"
+
+_FLAT_CANCEL_BUTTON_CSS = "background-color: #D9534F; color: white; padding: 10px; font-weight: bold; border-radius: 5px;"
+
+
+def _now_hms():
+    """ Current wall-clock time as HH:MM:SS for status messages """
+    return time.strftime("%H:%M:%S")
 
 
 class DatabaseApp(QMainWindow):
@@ -67,6 +250,32 @@ class DatabaseApp(QMainWindow):
         self.is_refreshing = False
         self.is_backup_running = False
         self.is_adding_new_record = False
+
+        # ✅ Per-table schema lookups, filled on first use (cleared on login and by forget_schema)
+        self._pk_cache = {}
+        self._schema_cache = {}
+        self._prepared = {}  # (table, operation, ...) -> prepared cursor on the table view's edit connection
+        self._search_sql_cache = {}
+        self._fulltext_cache = {}
+        self._insert_sql = {}
+        self._sql = {}  # ✅ Statement templates of the open table (see build_table_sql)
+        self._search_active = False  # True while the table shows search results instead of a page
+        self._search_generation = 0  # ✅ Bumped by every search / page fill; stale search batches are dropped
+        self._last_insert_id = None
+        self._dash_canvases = []  # ✅ Dashboard chart canvases, reused by every dashboard open
+        self._dash_cache = {}  # aggregate SQL -> (monotonic time read, rows), see _DASHBOARD_CACHE_SECONDS
+        self._dash_drawn = (None, 0)  # (aggregates, chart count) currently drawn on the pooled canvases
+        self._notes_loading = False
+        self.has_start_date_index = False  # ✅ jobs.StartDateDate is indexed; checked after each login
+        self._add_dialogs = {}  # table -> cached "Add Record" dialog, kept while the table view is open
+        self._job_rows_cache = {}  # (table, job id) -> totals + first batch shown by the job dialogs (see _forget_job_rows)
+
+        # ✅ Non-key cell edits waiting to be flushed, keyed by (pk value, column)
+        self._pending_edits = {}
+        self._edit_timer = QTimer(self)
+        self._edit_timer.setSingleShot(True)
+        self._edit_timer.setInterval(_EDIT_DEBOUNCE_MS)
+        self._edit_timer.timeout.connect(self._flush_edits)
         
 
         self.setWindowTitle("The Laptop Doctor")
@@ -104,121 +313,266 @@ class DatabaseApp(QMainWindow):
             daemon=True
         )
         self.scheduler_thread.start()
+
+    def closeEvent(self, event): #MAIN
+        """ Stops the backup scheduler thread, which otherwise sleeps until its next job """
+        self.scheduler_stop_event.set()
+        wake_scheduler()
+        super().closeEvent(event)
     
     def view_tables(self): #MAIN
-        try:
-            tables = fetch_tables(self.cursor)
-            display_tables_ui(tables, self.view_table_data)
-        except Exception as e:
-            QMessageBox.critical(None, "Error", str(e))
+        # ✅ The table list is fetched on a worker thread; the picker opens once it arrives
+        run_in_background(
+            self.pool, lambda cursor, conn: fetch_tables(cursor),
+            lambda tables: display_tables_ui(tables, self.view_table_data),
+            lambda message: QMessageBox.critical(None, "Error", message)
+        )
 
     def keyPressEvent(self, event): #MAIN
         keyPressEvent(self, event)  # Calls the one from ui.py
 
     def login(self): #MAIN
+        self._pk_cache.clear()
+        self._schema_cache.clear()
+        self._search_sql_cache.clear()
+        self._fulltext_cache.clear()
+        self._job_rows_cache.clear()
+        self._dash_cache.clear()
+        self._dash_drawn = (None, 0)
+        self.has_start_date_index = False
         handle_login(
             ui_instance=self,
             database_config=self.database_config,
-            connect_func=connect_to_database,
+            pool_func=create_connection_pool,
             on_success_callback=main_menu_page
         )
 
-    def fetch_data(self, table_name, limit=50, offset=0): #MAIN
-        return fetch_data(self.cursor, table_name, limit, offset)
+        pool = getattr(self, "pool", None)
+        if pool is not None:
+            # ✅ The one-off StartDateDate migration may rebuild jobs, so it runs on a worker right
+            # after login; the dashboard groups on DATE(StartDate) until it reports back
+            def index_checked(available):
+                if pool is self.pool:  # Not logged out or into another database meanwhile
+                    self.has_start_date_index = available
+
+            run_in_background(
+                pool, ensure_start_date_index, index_checked,
+                lambda message: print(f"⚠️ StartDateDate migration skipped: {message}")
+            )
 
     def logout(self): #MAIN
         handle_logout(self)
 
+    @contextmanager
+    def _conn(self):
+        """Borrows a connection from the pool; closing it hands it back to the pool."""
+        conn = self.pool.get_connection()
+        try:
+            yield conn
+        finally:
+            conn.close()
+
+    @contextmanager
+    def _edit_conn(self):
+        """The open table view's edit connection, or a freshly borrowed one if no view is open."""
+        if getattr(self, "edit_conn", None) is not None:
+            yield self.edit_conn
+        else:
+            with self._conn() as conn:
+                yield conn
+
+    def _prepared_cursor(self, conn, *key):
+        """
+        Returns a prepared cursor for (current table, *key) on the edit connection.
+        Re-executing the same statement on it skips the server-side parse.
+        """
+        if conn is not getattr(self, "edit_conn", None):
+            return conn.cursor(prepared=True)
+
+        key = (self.current_table_name, *key)
+        if key not in self._prepared:
+            self._prepared[key] = conn.cursor(prepared=True)
+        return self._prepared[key]
+
+    def _close_prepared(self):
+        """Closes the cached prepared cursors before the edit connection goes back to the pool."""
+        for cursor in self._prepared.values():
+            try:
+                cursor.close()
+            except mariadb.Error:
+                pass
+        self._prepared.clear()
+
     def eventFilter(self, source, event): #MAIN
             return event_filter(self, source, event)
 
     def update_table_offset(self, change, prev_button, next_button):
+        self._flush_edits()
+
         # ✅ Compute new offset safely
         new_offset = max(0, self.table_offset + change)
-        self.table_offset = new_offset  # ✅ Store for future pages
 
-        print(f"🔄 Current offset is now: {self.table_offset}")  # Debug log
+        # ✅ Keyset pagination: "Next" pushes the last key of this page, "Prev" pops back to the previous page's key
+        if change > 0:
+            page_keys = self.page_keys + [self.page_last_pk]
+        else:
+            page_keys = self.page_keys[:-1] or [None]
 
-        # ✅ Refresh the table with the correct offset
-        update_table_offset_ui(
+        print(f"🔄 Moving to offset {new_offset} (after key {page_keys[-1]})")  # Debug log
+
+        # ✅ Refresh the table with the new page
+        shown = update_table_offset_ui(
             table_widget=self.table_widget,
             pagination_label=self.pagination_label,
             prev_button=prev_button,
             next_button=next_button,
-            fetch_function=self.fetch_data,  # Must reflect the new offset!
+            fetch_function=lambda table_name, limit, offset: self.fetch_page(table_name, limit, offset, page_keys[-1]),
             table_name=self.table_name,
-            current_offset=self.table_offset,
+            current_offset=new_offset,
             limit=self.table_limit,
             change=0,  # We've already applied it
-            refresh_callback=lambda: refresh_page(self),
+            refresh_callback=self.show_table_page,
             parent=self
         )
 
-    def update_database(self, item):  # MAIN
+        if shown:
+            self.table_offset = new_offset  # ✅ Store for future pages
+            self.page_keys = page_keys
+
+    def fetch_page(self, table_name, limit=50, offset=0, after_pk=None): #MAIN
+        """Fetches a (rows, primary key column) page on a pooled connection."""
+        with self._conn() as conn:
+            return fetch_table_page(conn.cursor(), table_name, offset, limit, after_pk, self._pk_cache.get(table_name))
+
+    def show_table_page(self, page):
+        """Fills the table widget with a fetched page and remembers its last key for "Next"."""
+        data, primary_key_column = page
+
         self.table_widget.blockSignals(True)
+        self.table_widget.setRowCount(0)
+        fill_table_page(
+            table_widget=self.table_widget,
+            table_name=self.current_table_name,
+            data=data,
+            primary_key_column=primary_key_column,
+            update_status_callback=self.update_status_and_database,
+            event_filter=self
+        )
+        self.table_widget.blockSignals(False)
+        self._search_active = False
+        self._search_generation += 1  # ✅ A search still streaming must not append to this page
+
+        pk_index = self._col_index.get(primary_key_column)
+        self.page_last_pk = data[-1][pk_index] if data and pk_index is not None else None
 
+    def _queue_edit(self, item):  # MAIN
+        """ Buffers a non-key cell edit for _flush_edits(); key edits still go straight to update_database """
+        pk_index = self._col_index.get(self._pk_cache.get(self.current_table_name))
+        pk_item = self.table_widget.item(item.row(), pk_index) if pk_index is not None else None
+
+        if item.column() == pk_index or pk_item is None:
+            self._flush_edits()  # Pending edits still refer to the old key
+            self.update_database(item)
+            return
+
+        pk_value = pk_item.data(Qt.UserRole) or pk_item.text().strip()
+        self._pending_edits[(pk_value, self.columns[item.column()])] = item.text().strip() or None
+        self._edit_timer.start()  # (Re)starts the debounce window
+
+    def _flush_edits(self):  # MAIN
+        """ Writes all buffered cell edits with one UPDATE per column, in one transaction """
+        self._edit_timer.stop()
+        if not self._pending_edits:
+            return
+
+        edits, self._pending_edits = self._pending_edits, {}
+        changes = {}
+        for (pk_value, col_name), new_value in edits.items():
+            changes.setdefault(col_name, []).append((pk_value, new_value))
+
+        table_name = self.current_table_name
         try:
-            row = item.row()
-            column = item.column()
-            new_value = item.text().strip() or None
-
-            pk_column = get_primary_key_column(self.cursor, self.current_table_name)
-            if not pk_column:
-                print("❌ ERROR: No primary key found.")
-                self._update_status("❌ No primary key found.")
-                return
+            with self._edit_conn() as conn:
+                update_columns_bulk(conn.cursor(), conn, table_name, self._pk_cache.get(table_name), changes)
 
-            pk_index = next(
-                (i for i in range(self.table_widget.columnCount())
-                if self.table_widget.horizontalHeaderItem(i).text() == pk_column),
-                None
-            )
-            if pk_index is None:
-                print(f"❌ ERROR: ID column '{pk_column}' not found in UI.")
-                self._update_status(f"❌ ID column '{pk_column}' not found.")
-                return
+            if len(edits) == 1:
+                ((pk_value, col_name), new_value), = edits.items()
+                self._update_status(f"✅ Updated '{col_name}' to '{new_value}' for ID {pk_value}")
+            else:
+                self._update_status(f"✅ Updated {len(edits)} cells")
 
-            pk_item = self.table_widget.item(row, pk_index)
-            if not pk_item:
-                print(f"❌ ERROR: No ID item found in row {row}.")
-                self._update_status(f"❌ No ID item found in row {row}.")
-                return
+        except Exception as e:
+            print(f"❌ ERROR updating database: {e}")
+            self._update_status("❌ Error occurred while updating.")
 
-            old_pk = pk_item.data(Qt.UserRole) or pk_item.text().strip()
-            db_old_pk = check_primary_key_exists(self.cursor, self.current_table_name, pk_column, old_pk)
+        self._forget_job_rows(table_name)
 
-            if db_old_pk is None:
-                print(f"❌ ERROR: Old ID {old_pk} not found in DB.")
-                self._update_status(f"❌ ID {old_pk} not found in database.")
-                return
+    def _forget_job_rows(self, table_name, job_id=None):  # MAIN
+        """ Drops the cached job-dialog rows of `table_name` (for one job, or all) after a write to it """
+        table_name = table_name.lower()
+        for key in [key for key in self._job_rows_cache if key[0] == table_name and job_id in (None, key[1])]:
+            del self._job_rows_cache[key]
 
-            if new_value == str(db_old_pk):
-                self._update_status("ℹ️ Value unchanged.")
-                return
+    def update_database(self, item):  # MAIN
+        self.table_widget.blockSignals(True)
 
-            now = datetime.now().strftime("%H:%M:%S")
+        try:
+            with self._edit_conn() as conn:
+                cursor = conn.cursor()
+                row = item.row()
+                column = item.column()
+                new_value = item.text().strip() or None
+
+                pk_column = self._primary_key_for(cursor, self.current_table_name)
+                if not pk_column:
+                    print("❌ ERROR: No primary key found.")
+                    self._update_status("❌ No primary key found.")
+                    return
 
-            if column == pk_index:
-                # Updating PK
-                if check_duplicate_primary_key(self.cursor, self.current_table_name, pk_column, new_value):
-                    print(f"❌ PK {new_value} already exists.")
-                    self._update_status(f"❌ Duplicate PK: {new_value}")
-                    pk_item.setText(str(db_old_pk))  # revert
+                pk_index = self._col_index.get(pk_column)
+                if pk_index is None:
+                    print(f"❌ ERROR: ID column '{pk_column}' not found in UI.")
+                    self._update_status(f"❌ ID column '{pk_column}' not found.")
                     return
 
-                update_primary_key(self.cursor, self.conn, self.current_table_name, pk_column, db_old_pk, new_value)
-                pk_item.setData(Qt.UserRole, new_value)
-                pk_item.setText(str(new_value))
-                print(f"✅ ID updated from {db_old_pk} → {new_value}")
-                self._update_status(f"🔑 ID updated from {db_old_pk} to {new_value}")
+                pk_item = self.table_widget.item(row, pk_index)
+                if not pk_item:
+                    print(f"❌ ERROR: No ID item found in row {row}.")
+                    self._update_status(f"❌ No ID item found in row {row}.")
+                    return
 
-            else:
-                col_name = self.table_widget.horizontalHeaderItem(column).text()
-                update_column(self.cursor, self.conn, self.current_table_name, col_name, new_value, pk_column, db_old_pk)
-                self._update_status(f"✅ Updated '{col_name}' to '{new_value}' for ID {db_old_pk}")
+                old_pk = pk_item.data(Qt.UserRole) or pk_item.text().strip()
+                db_old_pk = check_primary_key_exists(cursor, self.current_table_name, pk_column, old_pk, self._sql.get("select_pk"))
+
+                if db_old_pk is None:
+                    print(f"❌ ERROR: Old ID {old_pk} not found in DB.")
+                    self._update_status(f"❌ ID {old_pk} not found in database.")
+                    return
+
+                if new_value == str(db_old_pk):
+                    self._update_status("ℹ️ Value unchanged.")
+                    return
+
+                if column == pk_index:
+                    # Updating PK
+                    if check_duplicate_primary_key(cursor, self.current_table_name, pk_column, new_value, self._sql.get("count_pk")):
+                        print(f"❌ PK {new_value} already exists.")
+                        self._update_status(f"❌ Duplicate PK: {new_value}")
+                        pk_item.setText(str(db_old_pk))  # revert
+                        return
 
+                    update_primary_key(self._prepared_cursor(conn, "update_pk"), conn, self.current_table_name, pk_column, db_old_pk, new_value, self._sql.get("update_pk"))
+                    # ✅ Only a PK change can move MAX(pk), so AUTO_INCREMENT is re-synced here alone
+                    update_auto_increment_if_needed(cursor, conn, self.current_table_name, pk_column)
+                    pk_item.setData(Qt.UserRole, new_value)
+                    pk_item.setText(str(new_value))
+                    print(f"✅ ID updated from {db_old_pk} → {new_value}")
+                    self._update_status(f"🔑 ID updated from {db_old_pk} to {new_value}")
 
-            update_auto_increment_if_needed(self.cursor, self.conn, self.current_table_name, pk_column)
+                else:
+                    col_name = self.columns[column]
+                    update_column(self._prepared_cursor(conn, "update", col_name), conn, self.current_table_name, col_name, new_value, pk_column, db_old_pk, self._sql.get("update_col", {}).get(col_name))
+                    self._update_status(f"✅ Updated '{col_name}' to '{new_value}' for ID {db_old_pk}")
 
         except Exception as e:
             print(f"❌ ERROR updating database: {e}")
@@ -228,55 +582,151 @@ class DatabaseApp(QMainWindow):
 
         finally:
             self.table_widget.blockSignals(False)
+            self._forget_job_rows(self.current_table_name)
 
     def update_status_and_database(self, row_idx, new_status):  # MAIN
         try:
-            primary_key_item = self.table_widget.item(row_idx, 0)
-            if not primary_key_item:
-                print(f"❌ ERROR: No primary key item found in row {row_idx}.")
-                self._update_status(f"❌ No primary key item in row {row_idx}")
-                return
+            with self._edit_conn() as conn:
+                cursor = conn.cursor()
+                primary_key_item = self.table_widget.item(row_idx, 0)
+                if not primary_key_item:
+                    print(f"❌ ERROR: No primary key item found in row {row_idx}.")
+                    self._update_status(f"❌ No primary key item in row {row_idx}")
+                    return
 
-            pk_value = primary_key_item.data(Qt.UserRole) or primary_key_item.text().strip()
+                pk_value = primary_key_item.data(Qt.UserRole) or primary_key_item.text().strip()
 
-            pk_column = fetch_primary_key_column(self.cursor, self.current_table_name)
-            if not pk_column:
-                print(f"❌ ERROR: No primary key column found for {self.current_table_name}")
-                self._update_status(f"❌ No PK column for '{self.current_table_name}'")
-                return
+                pk_column = self._primary_key_for(cursor, self.current_table_name)
+                if not pk_column:
+                    print(f"❌ ERROR: No primary key column found for {self.current_table_name}")
+                    self._update_status(f"❌ No PK column for '{self.current_table_name}'")
+                    return
 
-            success = update_status(
-                cursor=self.cursor,
-                conn=self.conn,
-                table_name=self.current_table_name,
-                pk_column=pk_column,
-                pk_value=pk_value,
-                new_status=new_status
-            )
+                success = update_status(
+                    cursor=self._prepared_cursor(conn, "status"),
+                    conn=conn,
+                    table_name=self.current_table_name,
+                    pk_column=pk_column,
+                    pk_value=pk_value,
+                    new_status=new_status
+                )
 
-            if success:
-                print(f"✅ Status updated to '{new_status}' for {pk_column} = {pk_value}")
-                self._update_status(f"✅ Status updated to '{new_status}' for {pk_value}")
-                #self.refresh_table(suppress_status=True)
-            else:
-                print(f"❌ Failed to update status.")
-                self._update_status(f"❌ Failed to update status for ID {pk_value}")
+                if success:
+                    print(f"✅ Status updated to '{new_status}' for {pk_column} = {pk_value}")
+                    self._update_status(f"✅ Status updated to '{new_status}' for {pk_value}")
+                    #self.refresh_table(suppress_status=True)
+                else:
+                    print(f"❌ Failed to update status.")
+                    self._update_status(f"❌ Failed to update status for ID {pk_value}")
 
         except Exception as e:
             print(f"❌ ERROR in update_status_and_database: {e}")
             self._update_status(f"❌ Error: {str(e)}")
 
+    def _primary_key_for(self, cursor, table_name):
+        """Primary key column of `table_name`, looked up once per table."""
+        if table_name not in self._pk_cache:
+            self._pk_cache[table_name] = fetch_primary_key_column(cursor, table_name)
+        return self._pk_cache[table_name]
+
     def _update_status(self, message: str):
         if hasattr(self, "status_bar"):
-            now = datetime.now().strftime("%H:%M:%S")
+            now = _now_hms()
             self.status_bar.setText(f"{now} : {message}.")
 
     def get_column_types(self):
         """
         Fetches a dictionary of column_name: column_type for the current table.
+        The DESCRIBE runs once per table; later calls reuse the cached result.
         """
-        self.cursor.execute(f"DESCRIBE {self.current_table_name}")
-        return {col[0]: col[1] for col in self.cursor.fetchall()}
+        if self.current_table_name not in self._schema_cache:
+            with self._conn() as conn:
+                self._column_types_for(conn.cursor(), self.current_table_name)
+        return self._schema_cache[self.current_table_name]
+
+    def _column_types_for(self, cursor, table_name):
+        """
+        column_name -> column_type of `table_name` in table order. The first lookup reads every
+        table's columns in one information_schema query; DESCRIBE is only the fallback for a
+        table missing from it (e.g. a different name case).
+        """
+        if not self._schema_cache:
+            self._schema_cache.update(fetch_column_types(cursor))
+        if table_name not in self._schema_cache:
+            cursor.execute(f"DESCRIBE {table_name}")
+            self._schema_cache[table_name] = {col[0]: col[1] for col in cursor.fetchall()}
+        return self._schema_cache[table_name]
+
+    def forget_schema(self):
+        """Drops the cached schema lookups after a schema change (e.g. CREATE/ALTER from the query window)."""
+        self._pk_cache.clear()
+        self._schema_cache.clear()
+        self._search_sql_cache.clear()
+        self._fulltext_cache.clear()
+        self._insert_sql.clear()
+
+    def _insert_query(self, table_name, columns):
+        """INSERT statement for (table, columns), built once and reused."""
+        key = (table_name, tuple(columns))
+        if key not in self._insert_sql:
+            self._insert_sql[key] = build_insert_query(table_name, columns)
+        return self._insert_sql[key]
+
+    def _insert_record(self, table_name, columns, values):
+        """Inserts one record on the edit connection."""
+        with self._edit_conn() as conn:
+            cursor = self._prepared_cursor(conn, "insert", *columns)
+            inserted = insert_record(cursor, conn, table_name, columns, values, self._insert_query(table_name, columns))
+            self._last_insert_id = cursor.lastrowid if inserted else None
+        self._forget_job_rows(table_name)
+        return inserted
+
+    def _show_inserted_record(self):
+        """Shows the record just added by _insert_record() without re-fetching the whole page."""
+        table_name = self.current_table_name
+        primary_key_column = self._pk_cache.get(table_name)
+        new_pk = self._last_insert_id
+        select_row = self._sql.get("select_row")
+
+        if self._search_active or not new_pk or not select_row:
+            self.refresh_table()
+            return
+
+        # ✅ Pages are newest-first, so a new auto-increment record only ever lands on the first page
+        if self.page_keys[-1] is not None:
+            self._update_status(f"➕ Record {new_pk} added")
+            return
+
+        try:
+            with self._conn() as conn:
+                cursor = conn.cursor()
+                cursor.execute(select_row, (new_pk,))
+                row = cursor.fetchone()
+        except mariadb.Error as e:
+            print(f"❌ ERROR fetching new record {new_pk}: {e}")
+            row = None
+
+        if row is None:
+            self.refresh_table()
+            return
+
+        insert_table_row(self.table_widget, table_name, 0, row, primary_key_column,
+                         self.update_status_and_database, event_filter=self)
+
+        # Keep the page at its size; "Next" then starts after the new last row
+        last_row = self.table_widget.rowCount() - 1
+        if last_row >= self.table_limit:
+            self.table_widget.removeRow(last_row)
+            pk_item = self.table_widget.item(last_row - 1, self._col_index.get(primary_key_column))
+            if pk_item:
+                self.page_last_pk = pk_item.data(Qt.UserRole)
+
+        self._update_status(f"➕ Record {new_pk} added")
+
+    def add_records_bulk(self, table_name, columns, rows):
+        """Inserts many records (e.g. a paste or import) in one bulk request and one commit."""
+        with self._conn() as conn:
+            return insert_records(conn.cursor(), conn, table_name, columns, rows, self._insert_query(table_name, columns))
 
 
     def view_table_data(self, table_name): #MAIN
@@ -284,33 +734,32 @@ class DatabaseApp(QMainWindow):
         self.current_table_name = table_name
         self.table_offset = 0
         self.table_limit = 50
+        self.page_keys = [None]  # Keyset boundary of each page visited; the last one is the current page
+        self.page_last_pk = None
 
         try:
-            data, columns = fetch_table_data_with_columns(
-                self.cursor,
-                table_name,
-                limit=self.table_limit,
-                offset=self.table_offset
-            )
+            with self._conn() as conn:
+                data, columns = fetch_table_data_with_columns(
+                    conn.cursor(),
+                    table_name,
+                    limit=self.table_limit,
+                    offset=self.table_offset
+                )
+                primary_key_column = self._primary_key_for(conn.cursor(), table_name)
             self.columns = columns
+            # ✅ Edit/delete statements for this table, built once and reused for every cell edit
+            self._sql = build_table_sql(table_name, primary_key_column, columns) if primary_key_column else {}
 
 
             self.table_widget = QTableWidget()
             self.table_widget.setColumnCount(len(columns))
             self.table_widget.setHorizontalHeaderLabels(columns)
+            self._col_index = {name: i for i, name in enumerate(columns)}  # ✅ Column name → index, built once per table
             self.table_widget.setAlternatingRowColors(True)
-            self.table_widget.itemChanged.connect(self.update_database)
+            self.table_widget.itemChanged.connect(self._queue_edit)
 
             # ✅ Load table data
-            load_table(
-                table_widget=self.table_widget,
-                cursor=self.cursor,
-                table_name=table_name,
-                update_status_callback=self.update_status_and_database,
-                table_offset=self.table_offset,
-                limit=self.table_limit,
-                event_filter=self
-            )
+            self.show_table_page(self.fetch_page(table_name, self.table_limit, self.table_offset))
 
             self.pagination_label = QLabel()
             current_page = (self.table_offset // self.table_limit) + 1
@@ -323,7 +772,7 @@ class DatabaseApp(QMainWindow):
             table_widget=self.table_widget,
             pagination_label=self.pagination_label,
             refresh_handler=self.refresh_table,
-            search_handler=lambda col, val: self.search_table(col, val),
+            search_handler=lambda col, val, word_prefix: self.search_table(col, val, word_prefix),
             prev_handler=lambda: self.update_table_offset(
                 -self.table_limit,
                 prev_button=prev_btn,
@@ -338,9 +787,10 @@ class DatabaseApp(QMainWindow):
                 table_name=self.current_table_name,
                 columns=self.columns,
                 column_types=self.get_column_types(),  # You might need a helper
-                db_insert_func=lambda t, c, v: insert_record(self.cursor, self.conn, t, c, v),
-                refresh_callback=self.refresh_table,
-                parent=self.dialog  # or self if you’re using QWidget
+                db_insert_func=self._insert_record,
+                refresh_callback=self._show_inserted_record,
+                parent=self.dialog,  # or self if you’re using QWidget
+                cache=self._add_dialogs
             ),
 
             edit_handler=lambda: edit_selected_job(self),
@@ -349,13 +799,27 @@ class DatabaseApp(QMainWindow):
         )
 
 
-            self.dialog.exec_()
+            # ✅ Cell edits reuse prepared statements on one pooled connection while the table is open
+            with self._conn() as conn:
+                self.edit_conn = conn
+                try:
+                    self.dialog.exec_()
+                finally:
+                    self._flush_edits()
+                    self._close_prepared()
+                    self._add_dialogs.clear()  # Their parent, the table view, is gone
+                    self.edit_conn = None
+                    self._search_generation += 1  # ✅ Stops a search still streaming into the closed view
 
         except Exception as e:
             QMessageBox.critical(None, "Error", f"Failed to load data for {table_name}: {e}")
 
-    def search_table(self, selected_columns, search_text):
-        """Search using multiple tokens across selected columns."""
+    def search_table(self, selected_columns, search_text, word_prefix=False):
+        """
+        Search using multiple tokens across selected columns; tokens match anywhere in a value.
+        With `word_prefix`, a FULLTEXT index covering exactly the columns is used when there is one,
+        which is faster but matches word starts only.
+        """
 
         if not selected_columns or not search_text.strip():
             self.status_bar.setText("ℹ️ Select column(s) and enter search text.")
@@ -367,36 +831,88 @@ class DatabaseApp(QMainWindow):
                 self.status_bar.setText("ℹ️ No valid keywords entered.")
                 return
 
-            now = datetime.now().strftime("%H:%M:%S")
+            now = _now_hms()
 
-            # Build WHERE clause: each token must match at least one column
-            conditions = []
-            params = []
+            self._search_generation += 1
+            generation = self._search_generation
 
-            for token in tokens:
-                token_conditions = [f"`{col}` LIKE %s" for col in selected_columns]
-                conditions.append(f"({' OR '.join(token_conditions)})")
-                params.extend([f"%{token}%"] * len(selected_columns))
+            table_name = self.current_table_name
+            columns = tuple(selected_columns)
+            # FULLTEXT can only stand in for word-start matching, and only for 3+ character non-stopwords
+            fulltext_tokens = word_prefix and fulltext_searchable(tokens)
 
-            where_clause = " AND ".join(conditions)
-            query = f"""
-                SELECT * FROM `{self.current_table_name}`
-                WHERE {where_clause};
-            """
+            def start_search():
+                # ✅ Use a FULLTEXT index when one covers exactly the selected columns, else LIKE
+                fulltext = fulltext_tokens and frozenset(columns) in self._fulltext_cache.get(table_name, ())
 
-            self.cursor.execute(query, tuple(params))
-            results = self.cursor.fetchall()
+                # ✅ The SQL template is built once per (table, columns, token count, mode)
+                key = (table_name, columns, len(tokens), fulltext)
+                if key not in self._search_sql_cache:
+                    self._search_sql_cache[key] = build_search_query(table_name, columns, len(tokens), fulltext)
+                sql = self._search_sql_cache[key]
 
-            if not results:
-                self.table_widget.setRowCount(0)
-                self.status_bar.setText(
-                    f"⚠ No matches for '{search_text.strip()}' in {', '.join(selected_columns)}"
+                if fulltext:
+                    params = (" ".join(f"+{token}*" for token in tokens),)
+                else:
+                    params = tuple(f"%{token}%" for token in tokens for _ in columns)
+
+                run_in_background(
+                    self.pool, lambda cursor, conn: run_search(cursor, sql, params + (_SEARCH_ROW_CAP,)),
+                    show_results, show_error, on_batch=show_batch, buffered=False
                 )
-            else:
-                populate_table(self.table_widget, self.current_table_name, results, self.update_status_and_database)
-                self.status_bar.setText(
-                    f"🔍 {len(results)} result(s) for '{search_text.strip()}' in {', '.join(selected_columns)} at {now}"
+
+            def run_search(cursor, sql, params):
+                # ✅ Unbuffered cursor: rows reach the table in batches as the server sends them
+                cursor.execute(sql, params)
+                while generation == self._search_generation:  # ✅ A newer search or page replaced this one
+                    rows = cursor.fetchmany(_SEARCH_BATCH_SIZE)
+                    if not rows:
+                        break
+                    yield rows
+
+            def show_batch(rows):
+                if generation != self._search_generation:
+                    return
+                append_table_rows(self.table_widget, table_name, rows, self.update_status_and_database)
+                self.status_bar.setText(f"🔍 {self.table_widget.rowCount()} result(s) so far...")
+
+            def show_results(_):
+                if generation != self._search_generation:
+                    return
+                found = self.table_widget.rowCount()
+                if not found:
+                    self.status_bar.setText(
+                        f"⚠ No matches for '{search_text.strip()}' in {', '.join(selected_columns)}"
+                    )
+                else:
+                    capped = f" (showing the first {_SEARCH_ROW_CAP})" if found >= _SEARCH_ROW_CAP else ""
+                    self.status_bar.setText(
+                        f"🔍 {found} result(s){capped} for '{search_text.strip()}' in {', '.join(selected_columns)} at {now}"
+                    )
+
+            def show_error(message):
+                if generation != self._search_generation:
+                    return
+                QMessageBox.critical(self, "Database Error", f"❌ Database Error: {message}")
+                self.status_bar.setText("❌ Search failed.")
+
+            def indexes_loaded(indexes):
+                self._fulltext_cache[table_name] = indexes
+                if generation == self._search_generation:
+                    start_search()
+
+            # ✅ The query runs on a pooled connection in the background; the UI stays responsive
+            self.status_bar.setText("🔍 Searching...")
+            populate_table(self.table_widget, table_name, [], self.update_status_and_database)
+            self._search_active = True
+            if fulltext_tokens and table_name not in self._fulltext_cache:
+                # ✅ The table's FULLTEXT indexes are looked up once, in their own job
+                run_in_background(
+                    self.pool, lambda cursor, conn: fetch_fulltext_indexes(cursor, table_name),
+                    indexes_loaded, show_error
                 )
+            else:
+                start_search()
 
         except mariadb.Error as e:
             QMessageBox.critical(self, "Database Error", f"❌ Database Error: {e}")
@@ -409,52 +925,65 @@ class DatabaseApp(QMainWindow):
             self.status_bar.setText("⏳ Refresh already in progress...")
             return
         
+        self._flush_edits()  # ✅ Write buffered edits before re-reading the page
+        self.is_refreshing = True
         if not suppress_status:
-            self.is_refreshing = True
             self.refresh_button.setEnabled(False)
             self.status_bar.setText("🔄 Refreshing table...")
 
-        try:
-            self.table_widget.itemChanged.disconnect(self.update_database)
-            self.table_widget.setRowCount(0)
+        table_name = self.current_table_name
+        table_offset = self.table_offset
+        after_pk = self.page_keys[-1]
 
-            load_table(
-                table_widget=self.table_widget,
-                cursor=self.cursor,
-                table_name=self.current_table_name,
-                update_status_callback=self.update_status_and_database,
-                table_offset=self.table_offset,
-                limit=50,
-                event_filter=self
-            )
+        def show_page(page):
+            try:
+                self.table_widget.itemChanged.disconnect(self._queue_edit)
+                self.show_table_page(page)
 
-            print(f"✅ Table {self.current_table_name} refreshed successfully.")
-            if not suppress_status:
-                now = datetime.now().strftime("%H:%M:%S")
-                self.status_bar.setText(f"✅ Refreshed '{self.current_table_name}' at {now}")
+                print(f"✅ Table {table_name} refreshed successfully.")
+                if not suppress_status:
+                    now = _now_hms()
+                    self.status_bar.setText(f"✅ Refreshed '{table_name}' at {now}")
 
+            except Exception as e:
+                show_error(e)
 
-        except Exception as e:
-            print(f"❌ ERROR: Failed to refresh table {self.current_table_name}: {e}")
-            QMessageBox.critical(self, "Database Error", f"Failed to refresh table: {e}")
+            finally:
+                self.table_widget.itemChanged.connect(self._queue_edit)
+                finish_refresh()
+
+        def show_error(error):
+            print(f"❌ ERROR: Failed to refresh table {table_name}: {error}")
+            QMessageBox.critical(self, "Database Error", f"Failed to refresh table: {error}")
             self.status_bar.setText("❌ Failed to refresh table.")
 
-        finally:
-            self.table_widget.itemChanged.connect(self.update_database)
+        def fetch_failed(message):
+            show_error(message)
+            finish_refresh()
+
+        def finish_refresh():
             self.is_refreshing = False
             self.refresh_button.setEnabled(True)
 
+        # ✅ Fetch on a pooled connection in the background, fill the widget back on the GUI thread
+        run_in_background(
+            self.pool,
+            lambda cursor, conn: fetch_table_page(cursor, table_name, table_offset, 50, after_pk, self._pk_cache.get(table_name)),
+            show_page,
+            fetch_failed
+        )
+
     def add_record_controller(self):
-        self.cursor.execute(f"DESCRIBE {self.current_table_name}")
-        column_details = {col[0]: col[1] for col in self.cursor.fetchall()}
+        column_details = self.get_column_types()
 
         add_record_dialog(
             table_name=self.current_table_name,
             columns=self.columns,
             column_types=column_details,
-            db_insert_func=lambda t, c, v: insert_record(self.cursor, self.conn, t, c, v),
-            refresh_callback=self.refresh_table,
-            parent=self.dialog  # or main window
+            db_insert_func=self._insert_record,
+            refresh_callback=self._show_inserted_record,
+            parent=self.dialog,  # or main window
+            cache=self._add_dialogs
         )
 
     def delete_record(self, table_name, table_widget, primary_key_column):  # UI + DATA_ACCESS
@@ -480,58 +1009,117 @@ class DatabaseApp(QMainWindow):
             QMessageBox.No
         )
 
-        if confirm == QMessageBox.Yes:
+        if confirm != QMessageBox.Yes:
+            is_deletion = False
+            return
+
+        delete_query = (
+            self._sql.get("delete") if self._pk_cache.get(table_name) == primary_key_column else None
+        ) or f"DELETE FROM {table_name} WHERE {primary_key_column} = %s"
+
+        def run_delete(cursor, conn):
             try:
-                # 🔍 Check if record exists
-                self.cursor.execute(
-                    f"SELECT COUNT(*) FROM {table_name} WHERE {primary_key_column} = %s;",
-                    (primary_key_value,)
+                # ✅ Delete the record; rowcount tells us whether it still existed
+                cursor.execute(delete_query, (primary_key_value,))
+                if cursor.rowcount == 0:
+                    conn.rollback()
+                    return False
+
+                # 🔄 AUTO_INCREMENT only needs pulling back when the newest record was deleted
+                cursor.execute(
+                    "SELECT AUTO_INCREMENT FROM information_schema.tables "
+                    "WHERE table_schema = DATABASE() AND table_name = %s;",
+                    (table_name,)
                 )
-                record_count = self.cursor.fetchone()[0]
+                row = cursor.fetchone()
+                current_ai = row[0] if row else None
+
+                next_id = None
+                if current_ai is not None and str(current_ai - 1) == str(primary_key_value):
+                    # MAX() on the primary key is answered from the index end, not a scan
+                    cursor.execute(f"SELECT COALESCE(MAX({primary_key_column}), 0) + 1 FROM {table_name};")
+                    next_id = cursor.fetchone()[0]
+                conn.commit()
+            except mariadb.Error:
+                conn.rollback()
+                raise
+
+            # ALTER TABLE commits implicitly, so it runs after the delete is committed
+            if next_id is not None and next_id != current_ai:
+                cursor.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = {next_id};")
+            return True
+
+        def show_deleted(deleted):
+            global is_deletion
+            is_deletion = False
 
-                if record_count == 0:
-                    QMessageBox.warning(self, "Warning", "⚠ Record not found. It may have already been deleted.")
-                    self._update_status(f"⚠ Record {primary_key_value} not found.")
-                    is_deletion = False
-                    return
+            if not deleted:
+                QMessageBox.warning(self, "Warning", "⚠ Record not found. It may have already been deleted.")
+                self._update_status(f"⚠ Record {primary_key_value} not found.")
+                return
 
-                # ✅ Delete the record
-                self.cursor.execute(
-                    f"DELETE FROM {table_name} WHERE {primary_key_column} = %s;",
-                    (primary_key_value,)
-                )
-                self.conn.commit()
+            self._forget_job_rows(table_name)
 
-                # 🔄 Handle auto-increment
-                self.cursor.execute(f"SELECT COUNT(*) FROM {table_name};")
-                remaining_records = self.cursor.fetchone()[0]
+            # ✅ Drop the row in place rather than re-fetching the page
+            for row in range(table_widget.rowCount()):
+                pk_item = table_widget.item(row, 0)
+                if pk_item and pk_item.text() == primary_key_value:
+                    table_widget.removeRow(row)
+                    break
+            else:
+                self.refresh_table(suppress_status=True)
 
-                if remaining_records > 0:
-                    self.cursor.execute(f"SELECT MAX({primary_key_column}) FROM {table_name};")
-                    highest_primary_key = self.cursor.fetchone()[0]
+            # ✅ Show dialog and update status bar
+            QMessageBox.information(self, "Success", f"✅ Record {primary_key_value} deleted successfully.")
+            self._update_status(f"🗑 Record {primary_key_value} deleted")
 
-                    if highest_primary_key is not None:
-                        self.cursor.execute(
-                            f"ALTER TABLE {table_name} AUTO_INCREMENT = {highest_primary_key + 1};"
-                        )
-                        self.conn.commit()
-                else:
-                    self.cursor.execute(f"ALTER TABLE {table_name} AUTO_INCREMENT = 1;")
-                    self.conn.commit()
+        def show_error(message):
+            global is_deletion
+            is_deletion = False
+            handle_db_error(message, f"Failed to delete record from {table_name}")
+            self._update_status(f"❌ Failed to delete record: {message}")
 
-                # ✅ Refresh the UI
-                self.refresh_table(suppress_status=True)
+        # ✅ DELETE / AUTO_INCREMENT run together on a pooled connection in the background
+        self._update_status(f"🗑 Deleting record {primary_key_value}...")
+        run_in_background(self.pool, run_delete, show_deleted, show_error)
 
-                # ✅ Show dialog and update status bar
-                QMessageBox.information(self, "Success", f"✅ Record {primary_key_value} deleted successfully.")
-                self._update_status(f"🗑 Record {primary_key_value} deleted")
+    def _batch_form(self, input_dialog, input_layout, submit_button, read_row, is_blank, clear_form, insert_rows, on_saved): #UI
+        """
+        Lets an "Add ..." form save several records at once.
+        "➕ Add Another" validates the form with `read_row()`, queues the row and clears the fields;
+        `submit_button` then inserts the queued rows (plus the current one, if filled in) through
+        `insert_rows(rows)` - one executemany() and one commit - and calls `on_saved(rows)`.
+        """
+        queued = []
+        queued_label = QLabel("")
+        add_another_button = QPushButton("➕ Add Another")
 
-            except mariadb.Error as e:
-                handle_db_error(e, f"Failed to delete record from {table_name}")
-                self._update_status(f"❌ Failed to delete record: {e}")
+        def queue_row():
+            row = read_row()
+            if row is None:
+                return
+            queued.append(row)
+            clear_form()
+            queued_label.setText(f"🧾 {len(queued)} queued")
+
+        def submit_rows():
+            rows = list(queued)
+            if not (rows and is_blank()):
+                row = read_row()
+                if row is None:
+                    return
+                rows.append(row)
 
-            finally:
-                is_deletion = False
+            if insert_rows(rows):
+                input_dialog.close()
+                on_saved(rows)
+            else:
+                QMessageBox.critical(input_dialog, "❌ Database Error", "Failed to save the record(s).")
+
+        add_another_button.clicked.connect(queue_row)
+        submit_button.clicked.connect(submit_rows)
+        input_layout.addWidget(queued_label)
+        input_layout.addWidget(add_another_button)
 
     def view_notes(self, job_id=None): #UI + DATA_ACCESS
         """Displays and edits job notes for a given Job ID."""
@@ -552,18 +1140,90 @@ class DatabaseApp(QMainWindow):
             QMessageBox.warning(None, "⚠ Invalid Input", "Job ID must be a number.")
             return
         
-        # ✅ Step 4: Query the database for job details
-        self.cursor.execute("SELECT notes, status, technician FROM jobs WHERE JOBID = %s", (job_id,))
-        result = self.cursor.fetchone()
+        if self._notes_loading:
+            return  # A lookup is already on its way; its dialog will open shortly
+        self._notes_loading = True
+        QApplication.setOverrideCursor(Qt.WaitCursor)
 
-        if not result:
-            QMessageBox.critical(None, "❌ Job Not Found", f"No job found with ID {job_id}.")
-            return
+        def fetch_job(cursor, conn):
+            cursor.execute("SELECT notes, status, technician FROM jobs WHERE JOBID = %s", (job_id,))
+            return cursor.fetchone()
 
-        # ✅ Proceed with opening the edit dialog...
+        def show_job(result):
+            self._notes_loading = False
+            QApplication.restoreOverrideCursor()
 
+            if not result:
+                QMessageBox.critical(None, "❌ Job Not Found", f"No job found with ID {job_id}.")
+                return
 
+            # ✅ The notes dialog and all of its sub-dialogs share one pooled connection while it is open
+            with self._conn() as conn:
+                self._open_notes_dialog(job_id, result, conn, conn.cursor())
 
+        def show_error(message):
+            self._notes_loading = False
+            QApplication.restoreOverrideCursor()
+            handle_db_error(message, f"Failed to load job {job_id}")
+
+        # ✅ The job lookup runs on a pooled connection in the background; the dialog opens when it returns
+        run_in_background(self.pool, fetch_job, show_job, show_error)
+
+    def _open_notes_dialog(self, job_id, result, conn, cursor): #UI + DATA_ACCESS
+        """Builds and runs the notes dialog for `job_id` from its fetched (notes, status, technician) row."""
+
+        # ✅ One prepared cursor per hot statement while the dialog is open; re-running it skips the server-side parse
+        prepared = {}
+
+        def prepared_cursor(*key):
+            if key not in prepared:
+                prepared[key] = conn.cursor(prepared=True)
+            return prepared[key]
+
+        def load_in_background(view, fetch, show, table, fresh=False):
+            """
+            Runs `fetch(cursor, conn)` on a pooled connection off the GUI thread and hands the
+            result to `show(result)`; `view` is disabled meanwhile as a busy indicator.
+            Results are cached per (table, job); pass fresh=True after writing to `table`.
+            """
+            cache_key = (table, job_id)
+            if fresh:
+                self._forget_job_rows(table, job_id)
+            elif cache_key in self._job_rows_cache:
+                show(self._job_rows_cache[cache_key])
+                return
+
+            view.setEnabled(False)
+
+            def done(result):
+                self._job_rows_cache[cache_key] = result
+                try:
+                    show(result)
+                    view.setEnabled(True)
+                except RuntimeError:
+                    pass  # The dialog was closed before the rows arrived
+
+            def failed(message):
+                try:
+                    view.setEnabled(True)
+                except RuntimeError:
+                    return
+                handle_db_error(message, f"Failed to load {table} for job {job_id}")
+
+            run_in_background(self.pool, fetch, done, failed)
+
+        def append_saved(model, table, count):
+            """
+            Shows `count` rows just inserted into `table` by extending the loaded model (one keyset read
+            after its last row) rather than reloading it. Returns False when a full reload is needed.
+            """
+            self._forget_job_rows(table, job_id)
+            return model.rows_added(count)
+
+        def remove_deleted(model, table, row):
+            """Drops a row just deleted from `table` out of the model in place instead of reloading it."""
+            self._forget_job_rows(table, job_id)
+            model.remove_row(row)
 
         existing_notes, existing_status, existing_technician = result
         existing_notes = existing_notes if existing_notes else ""
@@ -575,18 +1235,7 @@ class DatabaseApp(QMainWindow):
         edit_dialog.setWindowFlags(Qt.Window)
         edit_dialog.setWindowTitle(f"📝 Edit Notes for Job {job_id}")
         edit_dialog.setGeometry(100, 100, 450, 550)
-        edit_dialog.setStyleSheet("""
-            QDialog {
-                background-color: #1E1E1E;
-                color: white;
-                border-radius: 8px;
-            }
-            QLabel {
-                font-size: 14px;
-                font-weight: bold;
-                color: #3A9EF5;
-            }
-        """)
+        edit_dialog.setStyleSheet(_NOTES_DIALOG_CSS)
 
         main_layout = QVBoxLayout()
 
@@ -596,20 +1245,7 @@ class DatabaseApp(QMainWindow):
         status_options = ["Waiting for parts", "In Progress", "Completed", "Picked Up"]
         status_combobox.addItems(status_options)
         status_combobox.setCurrentText(existing_status)
-        status_combobox.setStyleSheet("""
-            QComboBox {
-                background-color: #333;
-                color: white;
-                border: 1px solid #3A9EF5;
-                padding: 5px;
-                border-radius: 5px;
-            }
-            QComboBox QAbstractItemView {
-                background-color: #2A2A2A;
-                selection-background-color: #3A9EF5;
-                color: white;
-            }
-        """)
+        status_combobox.setStyleSheet(_NOTES_COMBO_CSS)
         main_layout.addWidget(status_label)
         main_layout.addWidget(status_combobox)
 
@@ -617,15 +1253,7 @@ class DatabaseApp(QMainWindow):
         technician_label = QLabel("👨‍🔧 Technician:")
         technician_entry = QLineEdit()
         technician_entry.setText(existing_technician)
-        technician_entry.setStyleSheet("""
-            QLineEdit {
-                background-color: #333;
-                color: white;
-                border: 1px solid #3A9EF5;
-                padding: 6px;
-                border-radius: 5px;
-            }
-        """)
+        technician_entry.setStyleSheet(_NOTES_LINE_EDIT_CSS)
         main_layout.addWidget(technician_label)
         main_layout.addWidget(technician_entry)
 
@@ -633,20 +1261,13 @@ class DatabaseApp(QMainWindow):
         notes_label = QLabel("📝 Edit Notes:")
         notes_text = QTextEdit()
         notes_text.setText(existing_notes)
-        notes_text.setStyleSheet("""
-            QTextEdit {
-                background-color: #333;
-                color: white;
-                border: 1px solid #3A9EF5;
-                padding: 6px;
-                border-radius: 5px;
-            }
-        """)
+        notes_text.setStyleSheet(_NOTES_TEXT_CSS)
         main_layout.addWidget(notes_label)
         main_layout.addWidget(notes_text)
 
         # **Save Function**
         def save_notes():
+            nonlocal existing_notes, existing_status, existing_technician
             new_notes = notes_text.toPlainText().strip()
             new_status = status_combobox.currentText().strip()
             new_technician = technician_entry.text().strip()
@@ -658,17 +1279,15 @@ class DatabaseApp(QMainWindow):
             end_date = datetime.now().strftime('%Y-%m-%d %H:%M:%S') if new_status == "Completed" else None
 
             try:
-                if end_date:
-                    self.cursor.execute(
-                        "UPDATE jobs SET notes = %s, status = %s, technician = %s, EndDate = %s WHERE JOBID = %s",
+                # ✅ One statement for both cases: EndDate is only overwritten when a completion time is passed
+                with transaction(conn):
+                    prepared_cursor("save_notes").execute(
+                        "UPDATE jobs SET notes = %s, status = %s, technician = %s, EndDate = COALESCE(%s, EndDate) WHERE JOBID = %s",
                         (new_notes, new_status, new_technician, end_date, job_id)
                     )
-                else:
-                    self.cursor.execute(
-                        "UPDATE jobs SET notes = %s, status = %s, technician = %s WHERE JOBID = %s",
-                        (new_notes, new_status, new_technician, job_id)
-                    )
-                self.conn.commit()
+
+                # ✅ Saving again without further edits is a no-op
+                existing_notes, existing_status, existing_technician = new_notes, new_status, new_technician
                 QMessageBox.information(edit_dialog, "✅ Success", f"Job ID {job_id} has been updated.")
             except mariadb.Error as e:
                 QMessageBox.critical(edit_dialog, "❌ Database Error", f"An error occurred: {e}")
@@ -678,34 +1297,12 @@ class DatabaseApp(QMainWindow):
         button_layout = QHBoxLayout()
 
         save_button = QPushButton("💾 Save Changes")
-        save_button.setStyleSheet("""
-            QPushButton {
-                background-color: #4CAF50;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #45A049;
-            }
-        """)
+        save_button.setStyleSheet(_SAVE_BUTTON_CSS)
         save_button.clicked.connect(save_notes)
         button_layout.addWidget(save_button)
 
         cancel_button = QPushButton("❌ Close")
-        cancel_button.setStyleSheet("""
-            QPushButton {
-                background-color: #D9534F;
-                color: white;
-                padding: 10px;
-                font-weight: bold;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #C9302C;
-            }
-        """)
+        cancel_button.setStyleSheet(_CLOSE_BUTTON_CSS)
         
         
 
@@ -718,118 +1315,122 @@ class DatabaseApp(QMainWindow):
 
             costs_layout = QVBoxLayout()
 
-            # ✅ **Step 1: Get column names dynamically**
-            self.cursor.execute(f"SHOW COLUMNS FROM costs")
-            columns = [col[0] for col in self.cursor.fetchall()]  # Extract column names
+            # ✅ **Step 1: Get column names dynamically** (cached after the first open)
+            columns = list(self._column_types_for(cursor, "costs"))
+            column_index = {column_name: i for i, column_name in enumerate(columns)}
 
             # ✅ **Remove costID & JobID from displayed columns but keep for internal use**
             display_columns = [col for col in columns if col.lower() not in ["costid", "jobid"]]
             all_columns = columns  # Keep all columns for querying (including costID & JobID)
 
-            # ✅ **Step 2: Create a TableWidget with dynamic columns (+2 for delete & add-to-orders buttons)**
-            costs_table = QTableWidget()
-            costs_table.setColumnCount(len(display_columns) + 2)  # Extra columns for delete and add buttons
-            costs_table.setHorizontalHeaderLabels(display_columns + ["➕ Add to Orders", "🗑 Delete"])
-            costs_table.setStyleSheet("background-color: white; color: black;")
+            def cost_cell(column_name):
+                """Money is shown to 2 places, numbers/text go to Qt as-is, anything else (dates) as text."""
+                i = column_index[column_name]
+                column_type = self._schema_cache["costs"][column_name].lower()
+                if column_type.startswith("decimal"):
+                    return lambda row: "" if row[i] is None else f"{row[i]:.2f}"
+                if column_type.startswith(("int", "bigint", "smallint", "tinyint", "float", "double", "char", "varchar", "text")):
+                    return i
+                return lambda row: str(row[i])
+
+            # ✅ **Step 2: Create a model-backed table with dynamic columns (+2 for delete & add-to-orders buttons)**
+            costs_model = RowsTableModel(
+                [(column_name, cost_cell(column_name)) for column_name in display_columns],
+                ["➕ Add to Orders", "🗑 Delete"]
+            )
+            costs_table = QTableView()
+            costs_table.setModel(costs_model)
+            costs_table.setStyleSheet(_LIGHT_TABLE_CSS)
 
             costs_layout.addWidget(costs_table)
 
             # ✅ **Step 3: Display Total Cost**
             total_label = QLabel("💰 Total Cost: £0.00")
             total_label.setAlignment(Qt.AlignRight)
-            total_label.setStyleSheet("font-weight: bold; font-size: 14px; color: #3A9EF5; padding-top: 10px;")
+            total_label.setStyleSheet(_TOTAL_LABEL_CSS)
             costs_layout.addWidget(total_label)
 
-            from functools import partial  # ✅ Import this at the top of your file
-
-            def load_costs():
-                """Loads costs dynamically, updates total amount, and adds delete/add-to-orders buttons."""
-                self.cursor.execute(f"SELECT {', '.join(all_columns)} FROM costs WHERE JOBID = %s", (job_id,))
-                costs = self.cursor.fetchall()
-
-                # ✅ Clear table before updating to prevent duplicate entries
-                costs_table.clearContents()
-                costs_table.setRowCount(len(costs))
+            # ✅ **Find correct index mapping for Amount and Description**
+            try:
+                amount_index = column_index["Amount"]
+                description_index = column_index["Description"]
+            except KeyError as e:
+                QMessageBox.critical(None, "❌ Column Error", f"Missing required column: {e}")
+                return
 
-                total_amount = 0  # Store total cost
+            # ✅ **One delegate paints both action columns; clicks go to a single dispatcher** (the first column is always CostID)
+            add_button_col = len(display_columns)  # "Add to Orders" column index
+            delete_button_col = add_button_col + 1  # "Delete" column index
+            actions_delegate = ButtonDelegate(
+                {add_button_col: "➕ Add to Orders", delete_button_col: "🗑"},
+                {add_button_col: "#4CAF50", delete_button_col: "#D9534F"},
+                parent=costs_table
+            )
+            costs_table.setItemDelegateForColumn(add_button_col, actions_delegate)
+            costs_table.setItemDelegateForColumn(delete_button_col, actions_delegate)
 
-                # ✅ **Find correct index mapping for CostType, Amount, and Description**
-                try:
-                    cost_type_index = all_columns.index("CostType")  # ✅ Use `all_columns` instead of `display_columns`
-                    amount_index = all_columns.index("Amount")
-                    description_index = all_columns.index("Description")
-                except ValueError as e:
-                    QMessageBox.critical(None, "❌ Column Error", f"Missing required column: {e}")
+            def on_cost_action(index):
+                row = costs_model.row_data(index.row())
+                if index.column() == delete_button_col:
+                    delete_cost(index.row())
+                else:
+                    add_to_orders_dialog(row[description_index])
+
+            actions_delegate.clicked.connect(on_cost_action)
+
+            def fetch_costs(last_row, limit):
+                key = last_row[0] if last_row else None
+                return fetch_job_rows(prepared_cursor("costs", key is None), "costs", all_columns, all_columns[0], job_id, key, limit)
+
+            def load_costs(fresh=False):
+                """Loads costs lazily (one batch now, more on scroll) and updates the total amount."""
+                def fetch(worker_cursor, _):
+                    # ✅ The total is summed by the server, so it stays right however few rows are loaded
+                    worker_cursor.execute("SELECT COUNT(*), COALESCE(SUM(Amount), 0) FROM costs WHERE JOBID = %s", (job_id,))
+                    total_rows, total_amount = worker_cursor.fetchone()
+                    first_rows = fetch_job_rows(
+                        worker_cursor, "costs", all_columns, all_columns[0], job_id, None, _JOB_ROWS_BATCH_SIZE
+                    ) if total_rows else []
+                    return total_rows, total_amount, first_rows
+
+                def show(result):
+                    nonlocal cost_total
+                    total_rows, total_amount, first_rows = result
+                    cost_total = float(total_amount)
+                    costs_model.set_source(fetch_costs, total_rows, _JOB_ROWS_BATCH_SIZE, first_rows)
+                    total_label.setText(f"💰 Total Cost: £{cost_total:.2f}")  # ✅ Update total cost label
+
+                total_label.setText("⏳ Loading costs...")
+                load_in_background(costs_table, fetch, show, "costs", fresh)
+
+            cost_total = 0.0
+
+            def costs_saved(rows):
+                """Appends the new costs and adds their amounts to the total without re-reading the job."""
+                nonlocal cost_total
+                if not append_saved(costs_model, "costs", len(rows)):
+                    load_costs(fresh=True)
                     return
-
-                for row_idx, row_data in enumerate(costs):
-                    cost_id = row_data[0]  # ✅ The first column in row_data is always CostID (PK)
-
-                    # ✅ Map `display_columns` correctly, skipping CostID
-                    for col_idx, column_name in enumerate(display_columns):  
-                        try:
-                            value = row_data[all_columns.index(column_name)]  # ✅ Correct alignment by using `all_columns`
-                            costs_table.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))  # ✅ Proper column alignment
-
-                            # ✅ Fix: Check "Amount" column using correct index
-                            if column_name.lower() == "amount":
-                                try:
-                                    total_amount += float(value)
-                                except ValueError:
-                                    pass  # Skip non-numeric values
-
-                        except IndexError:
-                            QMessageBox.critical(None, "❌ Index Error", f"Column index {col_idx} is out of range for row {row_idx}.")
-                            return
-
-                    # ✅ **Find Correct Column for Buttons**
-                    add_button_col = len(display_columns)  # "Add to Orders" column index
-                    delete_button_col = add_button_col + 1  # "Delete" column index
-
-                    # ✅ **Show "➕ Add to Orders" Button for All Records**
-                    add_button = QPushButton("➕ Add to Orders")
-                    add_button.setStyleSheet("background-color: #4CAF50; color: white; border-radius: 5px; padding: 5px;")
-
-                    # ✅ Use `partial()` to correctly pass arguments
-                    add_button.clicked.connect(partial(add_to_orders_dialog, row_data[description_index]))  # ✅ Corrected Description Mapping
-
-                    # ✅ Ensure button appears by wrapping it inside a `QWidget`
-                    button_container = QWidget()
-                    button_layout = QHBoxLayout(button_container)
-                    button_layout.addWidget(add_button)
-                    button_layout.setContentsMargins(0, 0, 0, 0)  # ✅ Remove spacing
-                    button_layout.setAlignment(Qt.AlignCenter)
-                    
-                    costs_table.setCellWidget(row_idx, add_button_col, button_container)  # ✅ Button now appears for all records
-
-                    # ✅ **Add Delete Button**
-                    delete_button = QPushButton("🗑")
-                    delete_button.setStyleSheet("background-color: #D9534F; color: white; border-radius: 5px; padding: 5px;")
-                    delete_button.clicked.connect(partial(delete_cost, cost_id))
-
-                    button_container_del = QWidget()
-                    button_layout_del = QHBoxLayout(button_container_del)
-                    button_layout_del.addWidget(delete_button)
-                    button_layout_del.setContentsMargins(0, 0, 0, 0)  # ✅ Remove spacing
-                    button_layout_del.setAlignment(Qt.AlignCenter)
-
-                    costs_table.setCellWidget(row_idx, delete_button_col, button_container_del)  # ✅ Delete button properly placed
-
-                total_label.setText(f"💰 Total Cost: £{total_amount:.2f}")  # ✅ Update total cost label
+                cost_total += sum(row[2] for row in rows)  # (JobID, CostType, Amount, Description)
+                total_label.setText(f"💰 Total Cost: £{cost_total:.2f}")
 
 
             # ✅ **Step 5: Function to Delete a Cost**
-            def delete_cost(cost_id):
-                """Deletes a cost entry and refreshes the table."""
+            def delete_cost(row):
+                """Deletes the cost shown in model row `row` and removes just that row from the table."""
+                nonlocal cost_total
+                cost = costs_model.row_data(row)
                 confirmation = QMessageBox.question(costs_dialog, "🗑 Confirm Deletion",
                                                     "Are you sure you want to delete this cost?",
                                                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No)
                 if confirmation == QMessageBox.Yes:
                     try:
-                        self.cursor.execute("DELETE FROM costs WHERE CostID = %s", (cost_id,))
-                        self.conn.commit()
+                        with transaction(conn):
+                            prepared_cursor("delete_cost").execute("DELETE FROM costs WHERE CostID = %s", (cost[0],))
+                        remove_deleted(costs_model, "costs", row)
+                        cost_total -= float(cost[amount_index] or 0)
+                        total_label.setText(f"💰 Total Cost: £{cost_total:.2f}")
                         QMessageBox.information(costs_dialog, "✅ Success", "Cost deleted successfully.")
-                        load_costs()  # Refresh table after deletion
                     except mariadb.Error as e:
                         QMessageBox.critical(costs_dialog, "❌ Database Error", f"An error occurred: {e}")
 
@@ -861,29 +1462,34 @@ class DatabaseApp(QMainWindow):
                 # ✅ Submit Button
                 add_button = QPushButton("✅ Add Cost")
 
-                def submit_cost():
-                    """Validates and inserts the cost record into the database."""
+                def read_cost():
+                    """Validates the form and returns the cost row to insert (None if invalid)."""
                     cost_type = cost_type_dropdown.currentText().strip()  # Get selected value from dropdown
                     amount = amount_entry.text().strip()
                     description = description_entry.toPlainText().strip()
 
                     if not amount or not description:
                         QMessageBox.warning(input_dialog, "⚠ Input Error", "All fields must be filled.")
-                        return
+                        return None
 
                     try:
                         amount = float(amount)  # Ensure amount is numeric
-                        self.cursor.execute(
-                            "INSERT INTO costs (JobID, CostType, Amount, Description) VALUES (%s, %s, %s, %s)",
-                            (job_id, cost_type, amount, description)
-                        )
-                        self.conn.commit()
-                        input_dialog.close()
-                        load_costs()
                     except ValueError:
                         QMessageBox.warning(input_dialog, "⚠ Input Error", "Amount must be a number.")
-
-                add_button.clicked.connect(submit_cost)
+                        return None
+                    return (job_id, cost_type, amount, description)
+
+                def clear_cost():
+                    amount_entry.clear()
+                    description_entry.clear()
+
+                self._batch_form(
+                    input_dialog, input_layout, add_button, read_cost,
+                    is_blank=lambda: not amount_entry.text().strip() and not description_entry.toPlainText().strip(),
+                    clear_form=clear_cost,
+                    insert_rows=lambda rows: insert_records(prepared_cursor("insert_cost"), conn, "costs", ["JobID", "CostType", "Amount", "Description"], rows),
+                    on_saved=costs_saved
+                )
                 input_layout.addWidget(add_button)
 
                 input_dialog.setLayout(input_layout)
@@ -928,11 +1534,12 @@ class DatabaseApp(QMainWindow):
                     total_cost = float(total_cost)  # Ensure cost is a valid number
                     quantity = 1  # ✅ Always set quantity to 1
 
-                    self.cursor.execute(
-                        "INSERT INTO orders (JobID, OrderDate, Description, Quantity, TotalCost) VALUES (%s, NOW(), %s, %s, %s)",
-                        (job_id, part_description, quantity, total_cost)
-                    )
-                    self.conn.commit()
+                    if not insert_records(
+                        prepared_cursor("insert_order"), conn, "orders", ["JobID", "Description", "Quantity", "TotalCost"],
+                        [(job_id, part_description, quantity, total_cost)], _INSERT_ORDER_SQL
+                    ):
+                        QMessageBox.critical(order_dialog, "❌ Database Error", "Failed to add the part to orders.")
+                        return
 
                     QMessageBox.information(order_dialog, "✅ Success", "Part added to orders successfully.")
                     order_dialog.close()
@@ -952,9 +1559,17 @@ class DatabaseApp(QMainWindow):
             payments_dialog.setGeometry(600, 100, 600, 500)
 
             payments_layout = QVBoxLayout()
-            payments_table = QTableWidget()
-            payments_table.setColumnCount(5)
-            payments_table.setHorizontalHeaderLabels(["Payment ID", "Amount", "Payment Type", "Date", "🗑 Delete"])
+            payments_model = RowsTableModel([
+                ("Payment ID", 0),
+                ("Amount", lambda row: f"£{row[1]:.2f}"),
+                ("Payment Type", 2),
+                ("Date", lambda row: str(row[3])),
+            ], ["🗑 Delete"])
+            payments_table = QTableView()
+            payments_table.setModel(payments_model)
+            payments_table.setItemDelegateForColumn(4, ButtonDelegate(
+                "🗑", "#3A9EF5", lambda row: delete_payment(row), payments_table
+            ))
             payments_layout.addWidget(payments_table)
 
             total_label = QLabel("💰 Total Payments: £0.00")
@@ -962,32 +1577,50 @@ class DatabaseApp(QMainWindow):
             payments_layout.addWidget(total_label)
 
             # **Load Payments**
-            def load_payments():
-                self.cursor.execute("SELECT PaymentID, Amount, PaymentType, Date FROM payments WHERE JOBID = %s", (job_id,))
-                payments = self.cursor.fetchall()
-                payments_table.setRowCount(len(payments))
-
-                total_amount = 0
-                for row_idx, row_data in enumerate(payments):
-                    payment_id, amount, payment_type, payment_date = row_data
-                    total_amount += float(amount)
-
-                    payments_table.setItem(row_idx, 0, QTableWidgetItem(str(payment_id)))
-                    payments_table.setItem(row_idx, 1, QTableWidgetItem(f"£{amount:.2f}"))
-                    payments_table.setItem(row_idx, 2, QTableWidgetItem(payment_type))
-                    payments_table.setItem(row_idx, 3, QTableWidgetItem(str(payment_date)))
-
-                    delete_button = QPushButton("🗑")
-                    delete_button.clicked.connect(lambda _, p_id=payment_id: delete_payment(p_id))
-                    payments_table.setCellWidget(row_idx, 4, delete_button)
-
-                total_label.setText(f"💰 Total Payments: £{total_amount:.2f}")
+            def fetch_payments(last_row, limit):
+                key = last_row[0] if last_row else None
+                return fetch_job_rows(prepared_cursor("payments", key is None), "payments", ["PaymentID", "Amount", "PaymentType", "Date"], "PaymentID", job_id, key, limit)
+
+            def load_payments(fresh=False):
+                def fetch(worker_cursor, _):
+                    worker_cursor.execute("SELECT COUNT(*), COALESCE(SUM(Amount), 0) FROM payments WHERE JOBID = %s", (job_id,))
+                    total_rows, total_amount = worker_cursor.fetchone()
+                    first_rows = fetch_job_rows(
+                        worker_cursor, "payments", ["PaymentID", "Amount", "PaymentType", "Date"], "PaymentID",
+                        job_id, None, _JOB_ROWS_BATCH_SIZE
+                    ) if total_rows else []
+                    return total_rows, total_amount, first_rows
+
+                def show(result):
+                    nonlocal payment_total
+                    total_rows, total_amount, first_rows = result
+                    payment_total = float(total_amount)
+                    payments_model.set_source(fetch_payments, total_rows, _JOB_ROWS_BATCH_SIZE, first_rows)
+                    total_label.setText(f"💰 Total Payments: £{payment_total:.2f}")
+
+                total_label.setText("⏳ Loading payments...")
+                load_in_background(payments_table, fetch, show, "payments", fresh)
+
+            payment_total = 0.0
+
+            def payments_saved(rows):
+                """Appends the new payments and adds them to the total without re-reading the job."""
+                nonlocal payment_total
+                if not append_saved(payments_model, "payments", len(rows)):
+                    load_payments(fresh=True)
+                    return
+                payment_total += sum(row[1] for row in rows)  # (JobID, Amount, PaymentType, Date)
+                total_label.setText(f"💰 Total Payments: £{payment_total:.2f}")
 
             # **Delete Payment**
-            def delete_payment(payment_id):
-                self.cursor.execute("DELETE FROM payments WHERE PaymentID = %s", (payment_id,))
-                self.conn.commit()
-                load_payments()
+            def delete_payment(row):
+                nonlocal payment_total
+                payment = payments_model.row_data(row)
+                with transaction(conn):
+                    prepared_cursor("delete_payment").execute("DELETE FROM payments WHERE PaymentID = %s", (payment[0],))
+                remove_deleted(payments_model, "payments", row)
+                payment_total -= float(payment[1] or 0)
+                total_label.setText(f"💰 Total Payments: £{payment_total:.2f}")
 
             def add_payment():
                 input_dialog = QDialog(payments_dialog)
@@ -1013,30 +1646,29 @@ class DatabaseApp(QMainWindow):
                 # Add Payment Button
                 add_button = QPushButton("✅ Add Payment")
 
-                def submit_payment():
+                def read_payment():
                     amount = amount_entry.text().strip()
                     payment_type = payment_type_dropdown.currentText()  # Get selected payment type
                     payment_date = date_entry.date().toString("yyyy-MM-dd")  # Get selected date
 
                     if not amount:
                         QMessageBox.warning(input_dialog, "⚠ Input Error", "Amount field must be filled.")
-                        return
+                        return None
 
                     try:
                         amount = float(amount)  # Ensure amount is numeric
-
-                        # Insert with selected date
-                        self.cursor.execute(
-                            "INSERT INTO payments (JobID, Amount, PaymentType, Date) VALUES (%s, %s, %s, %s)",
-                            (job_id, amount, payment_type, payment_date)
-                        )
-                        self.conn.commit()
-                        input_dialog.close()
-                        load_payments()
                     except ValueError:
                         QMessageBox.warning(input_dialog, "⚠ Input Error", "Amount must be a number.")
-
-                add_button.clicked.connect(submit_payment)
+                        return None
+                    return (job_id, amount, payment_type, payment_date)  # Insert with selected date
+
+                self._batch_form(
+                    input_dialog, input_layout, add_button, read_payment,
+                    is_blank=lambda: not amount_entry.text().strip(),
+                    clear_form=amount_entry.clear,
+                    insert_rows=lambda rows: insert_records(prepared_cursor("insert_payment"), conn, "payments", ["JobID", "Amount", "PaymentType", "Date"], rows),
+                    on_saved=payments_saved
+                )
                 input_layout.addWidget(add_button)
 
                 input_dialog.setLayout(input_layout)
@@ -1061,14 +1693,14 @@ class DatabaseApp(QMainWindow):
             comms_layout = QVBoxLayout()
 
             # ✅ **Step 1: Fetch Customer Contact Information**
-            self.cursor.execute("""
+            cursor.execute("""
                 SELECT customers.FirstName, customers.SurName, customers.Phone, customers.Email 
                 FROM customers 
                 JOIN jobs ON customers.CustomerID = jobs.CustomerID 
                 WHERE jobs.JOBID = %s
             """, (job_id,))
             
-            customer_data = self.cursor.fetchone()
+            customer_data = cursor.fetchone()
 
             if customer_data:
                 customer_firstname, customer_surname, customer_phone, customer_email = customer_data
@@ -1091,7 +1723,7 @@ class DatabaseApp(QMainWindow):
             customer_table.setItem(3, 1, QTableWidgetItem(customer_email))
 
             customer_table.setEditTriggers(QTableWidget.NoEditTriggers)  # Disable editing
-            customer_table.setStyleSheet("background-color: white; color: black;")
+            customer_table.setStyleSheet(_LIGHT_TABLE_CSS)
 
             # ✅ **Auto-resizing columns and rows to fit content**
             customer_table.horizontalHeader().setStretchLastSection(True)  
@@ -1101,43 +1733,67 @@ class DatabaseApp(QMainWindow):
             comms_layout.addWidget(customer_table)
 
             # ✅ **Step 3: Setup Communications Table with Auto-Resizing**
-            comms_table = QTableWidget()
-            comms_table.setColumnCount(5)  # Adding a delete column
-            comms_table.setHorizontalHeaderLabels(["Communication ID", "Date", "Type", "Message", "🗑 Delete"])
+            comms_model = RowsTableModel([
+                ("Communication ID", 0),
+                ("Date", lambda row: str(row[1])),
+                ("Type", 2),
+                ("Message", 3),
+            ], ["🗑 Delete"])  # Adding a delete column
+            comms_table = QTableView()
+            comms_table.setModel(comms_model)
+            comms_table.setItemDelegateForColumn(4, ButtonDelegate(
+                "🗑", "#D9534F", lambda row: delete_comm(row), comms_table
+            ))
 
             # ✅ **Auto-resizing columns to fit text**
             comms_table.horizontalHeader().setStretchLastSection(True)
             comms_table.horizontalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
-            comms_table.verticalHeader().setSectionResizeMode(QHeaderView.ResizeToContents)
+
+            # ✅ **Fixed row height**: measuring every row's wrapped text on each load is quadratic in
+            # the row count, so only the selected row grows to show its full message
+            comms_table.verticalHeader().setSectionResizeMode(QHeaderView.Fixed)
+            comms_table.verticalHeader().setDefaultSectionSize(24)
+
+            def fit_current_comm(current, previous):
+                if previous.isValid():
+                    comms_table.verticalHeader().resizeSection(previous.row(), 24)
+                if current.isValid():
+                    comms_table.resizeRowToContents(current.row())
+
+            comms_table.selectionModel().currentRowChanged.connect(fit_current_comm)
 
             comms_layout.addWidget(comms_table)
 
             # ✅ **Step 4: Load Communications**
-            def load_comms():
-                self.cursor.execute("SELECT CommunicationID, DateTime, CommunicationType, Note FROM communications WHERE JOBID = %s", (job_id,))
-                comms = self.cursor.fetchall()
-                comms_table.setRowCount(len(comms))
-
-                for row_idx, row_data in enumerate(comms):
-                    comm_id, date_time, comm_type, message = row_data
-                    comms_table.setItem(row_idx, 0, QTableWidgetItem(str(comm_id)))
-                    comms_table.setItem(row_idx, 1, QTableWidgetItem(str(date_time)))
-                    comms_table.setItem(row_idx, 2, QTableWidgetItem(comm_type))
-                    comms_table.setItem(row_idx, 3, QTableWidgetItem(message))
-
-                    delete_button = QPushButton("🗑")
-                    delete_button.setStyleSheet("background-color: #D9534F; color: white; border-radius: 5px; padding: 5px;")
-                    delete_button.clicked.connect(lambda _, c_id=comm_id: delete_comm(c_id))
-                    comms_table.setCellWidget(row_idx, 4, delete_button)
-
-                # ✅ **Auto-resize rows after adding data**
-                comms_table.resizeRowsToContents()
+            def fetch_comms(last_row, limit):
+                key = last_row[0] if last_row else None
+                return fetch_job_rows(
+                    prepared_cursor("communications", key is None), "communications", ["CommunicationID", "DateTime", "CommunicationType", "Note"],
+                    "CommunicationID", job_id, key, limit
+                )
+
+            def load_comms(fresh=False):
+                def fetch(worker_cursor, _):
+                    worker_cursor.execute("SELECT COUNT(*) FROM communications WHERE JOBID = %s", (job_id,))
+                    total_rows = worker_cursor.fetchone()[0]
+                    first_rows = fetch_job_rows(
+                        worker_cursor, "communications", ["CommunicationID", "DateTime", "CommunicationType", "Note"],
+                        "CommunicationID", job_id, None, _JOB_ROWS_BATCH_SIZE
+                    ) if total_rows else []
+                    return total_rows, first_rows
+
+                def show(result):
+                    total_rows, first_rows = result
+                    comms_model.set_source(fetch_comms, total_rows, _JOB_ROWS_BATCH_SIZE, first_rows)
+
+                load_in_background(comms_table, fetch, show, "communications", fresh)
 
             # ✅ **Step 5: Delete Communication**
-            def delete_comm(comm_id):
-                self.cursor.execute("DELETE FROM communications WHERE CommunicationID = %s", (comm_id,))
-                self.conn.commit()
-                load_comms()
+            def delete_comm(row):
+                comm_id = comms_model.row_data(row)[0]
+                with transaction(conn):
+                    prepared_cursor("delete_comm").execute("DELETE FROM communications WHERE CommunicationID = %s", (comm_id,))
+                remove_deleted(comms_model, "communications", row)
 
             # ✅ **Step 6: Add Communication**
             def add_comm():
@@ -1162,23 +1818,22 @@ class DatabaseApp(QMainWindow):
 
                 # ✅ **Submit Button**
                 add_button = QPushButton("✅ Add Communication")
-                def submit_comm():
+                def read_comm():
                     comm_type = comm_type_dropdown.currentText().strip()
                     message = message_entry.toPlainText().strip()
 
                     if not comm_type or not message:
                         QMessageBox.warning(input_dialog, "⚠ Input Error", "All fields must be filled.")
-                        return
-
-                    self.cursor.execute(
-                        "INSERT INTO communications (JobID, CommunicationType, Note) VALUES (%s, %s, %s)",
-                        (job_id, comm_type, message)
-                    )
-                    self.conn.commit()
-                    input_dialog.close()
-                    load_comms()
-
-                add_button.clicked.connect(submit_comm)
+                        return None
+                    return (job_id, comm_type, message)
+
+                self._batch_form(
+                    input_dialog, input_layout, add_button, read_comm,
+                    is_blank=lambda: not message_entry.toPlainText().strip(),
+                    clear_form=message_entry.clear,
+                    insert_rows=lambda rows: insert_records(prepared_cursor("insert_comm"), conn, "communications", ["JobID", "CommunicationType", "Note"], rows),
+                    on_saved=lambda rows: append_saved(comms_model, "communications", len(rows)) or load_comms(fresh=True)
+                )
                 input_layout.addWidget(add_button)
 
                 input_dialog.setLayout(input_layout)
@@ -1192,12 +1847,12 @@ class DatabaseApp(QMainWindow):
 
             add_comm_button = QPushButton("➕ Add Communication")
             add_comm_button.clicked.connect(add_comm)
-            add_comm_button.setStyleSheet("background-color: #4CAF50; color: white; padding: 8px; border-radius: 5px;")
+            add_comm_button.setStyleSheet(_SMALL_ADD_BUTTON_CSS)
             button_layout.addWidget(add_comm_button)
 
             close_button = QPushButton("❌ Close")
             close_button.clicked.connect(comms_dialog.close)
-            close_button.setStyleSheet("background-color: #D9534F; color: white; padding: 8px; border-radius: 5px;")
+            close_button.setStyleSheet(_SMALL_CLOSE_BUTTON_CSS)
             button_layout.addWidget(close_button)
 
             comms_layout.addLayout(button_layout)
@@ -1215,11 +1870,21 @@ class DatabaseApp(QMainWindow):
             orders_layout = QVBoxLayout()
 
             # ✅ **Step 1: Create Orders Table**
-            orders_table = QTableWidget()
-            orders_table.setColumnCount(5)  # 7 columns + 1 new column for the Delivered button
-            orders_table.setHorizontalHeaderLabels(
-                ["Order ID", "Order Date", "Description", "Quantity", "Total Cost (£)", "🗑 Delete"]
-            )
+            orders_model = RowsTableModel([
+                ("Order ID", 0),
+                ("Order Date", lambda row: str(row[1])),
+                ("Description", 2),
+                ("Quantity", 3),
+                # Check if total_cost is None, and handle it
+                ("Total Cost (£)", lambda row: "0.00" if row[4] is None else f"£{row[4]:.2f}"),
+            ], ["🗑 Delete"])
+            orders_table = QTableView()
+            orders_table.setModel(orders_model)
+            orders_table.setSelectionBehavior(QTableView.SelectRows)
+            orders_table.setSelectionMode(QTableView.ExtendedSelection)  # Ctrl/Shift-click to delete several at once
+            orders_table.setItemDelegateForColumn(5, ButtonDelegate(
+                "🗑", "#D9534F", lambda row: delete_orders([row]), orders_table
+            ))
             orders_layout.addWidget(orders_table)
 
             # ✅ **Step 4: Add Order Function** (Move this here)
@@ -1252,83 +1917,93 @@ class DatabaseApp(QMainWindow):
 
                 # ✅ **Submit Button**
                 add_button = QPushButton("✅ Add Order")
-                def submit_order():
-                    """Validates and inserts the order record into the database."""
+                def read_order():
+                    """Validates the form and returns the order row to insert (None if invalid)."""
                     description = description_entry.text().strip()
                     quantity = quantity_entry.text().strip()
                     total_cost = total_cost_entry.text().strip()
 
                     if not description or not quantity or not total_cost:
                         QMessageBox.warning(input_dialog, "⚠ Input Error", "All fields must be filled.")
-                        return
+                        return None
 
                     try:
                         quantity = int(quantity)
                         total_cost = float(total_cost)
+                    except ValueError:
+                        QMessageBox.warning(input_dialog, "⚠ Input Error", "Quantity must be an integer and cost must be a number.")
+                        return None
+                    return (job_id, description, quantity, total_cost)
 
-                        self.cursor.execute(
-                            "INSERT INTO orders (JobID, OrderDate, Description, Quantity, TotalCost) VALUES (%s, NOW(), %s, %s, %s)",
-                            (job_id, description, quantity, total_cost)
-                        )
-                        self.conn.commit()
+                def clear_order():
+                    description_entry.clear()
+                    quantity_entry.clear()
+                    total_cost_entry.clear()
 
-                        QMessageBox.information(input_dialog, "✅ Success", "Order added successfully.")
-                        input_dialog.close()
+                def order_saved(rows):
+                    QMessageBox.information(orders_dialog, "✅ Success", "Order(s) added successfully.")
+                    if not orders_model.rows_added(len(rows)):
                         load_orders()  # ✅ Refresh orders list
-                    except ValueError:
-                        QMessageBox.warning(input_dialog, "⚠ Input Error", "Quantity must be an integer and cost must be a number.")
 
-                add_button.clicked.connect(submit_order)
+                self._batch_form(
+                    input_dialog, input_layout, add_button, read_order,
+                    is_blank=lambda: not (description_entry.text().strip() or quantity_entry.text().strip() or total_cost_entry.text().strip()),
+                    clear_form=clear_order,
+                    insert_rows=lambda rows: insert_records(
+                        prepared_cursor("insert_order"), conn, "orders", ["JobID", "Description", "Quantity", "TotalCost"], rows,
+                        _INSERT_ORDER_SQL
+                    ),
+                    on_saved=order_saved
+                )
                 input_layout.addWidget(add_button)
 
                 input_dialog.setLayout(input_layout)
                 input_dialog.exec_()
 
             # ✅ **Step 2: Load Orders Data**
-            def load_orders():
-                self.cursor.execute(
-                    "SELECT PartID, OrderDate, Description, Quantity, TotalCost FROM orders WHERE JOBID = %s", 
-                    (job_id,)
+            def fetch_orders(last_row, limit):
+                key = last_row[0] if last_row else None
+                return fetch_job_rows(
+                    prepared_cursor("orders", key is None), "orders", ["PartID", "OrderDate", "Description", "Quantity", "TotalCost"],
+                    "PartID", job_id, key, limit
                 )
-                orders = self.cursor.fetchall()
-                orders_table.setRowCount(len(orders))
-
-                for row_idx, row_data in enumerate(orders):
-                    order_id, order_date, description, quantity, total_cost = row_data
-                    orders_table.setItem(row_idx, 0, QTableWidgetItem(str(order_id)))
-                    orders_table.setItem(row_idx, 1, QTableWidgetItem(str(order_date)))
-                    orders_table.setItem(row_idx, 2, QTableWidgetItem(description))
-                    orders_table.setItem(row_idx, 3, QTableWidgetItem(str(quantity)))
-                    
-
-                    # Check if total_cost is None, and handle it
-                    if total_cost is None:
-                        total_cost_str = "0.00"  # You can change this to "0.00" or any default value you prefer
-                    else:
-                        total_cost_str = f"£{total_cost:.2f}"
 
-                    orders_table.setItem(row_idx, 4, QTableWidgetItem(total_cost_str))
-
-                    # ✅ **Delete Button**
-                    delete_button = QPushButton("🗑")
-                    delete_button.setStyleSheet("background-color: #D9534F; color: white; border-radius: 5px; padding: 5px;")
-                    delete_button.clicked.connect(lambda _, o_id=order_id: delete_order(o_id))
-                    orders_table.setCellWidget(row_idx, 5, delete_button)
+            def load_orders():
+                """Loads orders a batch at a time (more on scroll) instead of fetching every row up front."""
+                orders_count = prepared_cursor("orders_count")
+                orders_count.execute("SELECT COUNT(*) FROM orders WHERE JOBID = %s", (job_id,))
+                orders_model.set_source(fetch_orders, orders_count.fetchone()[0], _JOB_ROWS_BATCH_SIZE)
 
             # ✅ **Step 3: Delete Order Function**
-            def delete_order(order_id):
-                """Deletes an order entry and refreshes the table."""
+            def delete_orders(rows):
+                """
+                Deletes the orders shown in model `rows` with one DELETE ... IN and one commit,
+                then removes just those rows from the table.
+                """
+                rows = sorted(set(rows), reverse=True)  # Bottom-up so earlier rows keep their index
+                if not rows:
+                    QMessageBox.warning(orders_dialog, "⚠ No Selection", "Select the orders to delete first.")
+                    return
+                order_ids = tuple(orders_model.row_data(row)[0] for row in rows)
                 confirmation = QMessageBox.question(
                     orders_dialog, "🗑 Confirm Deletion",
-                    "Are you sure you want to delete this order?",
+                    "Are you sure you want to delete this order?" if len(rows) == 1
+                    else f"Are you sure you want to delete these {len(rows)} orders?",
                     QMessageBox.Yes | QMessageBox.No, QMessageBox.No
                 )
                 if confirmation == QMessageBox.Yes:
                     try:
-                        self.cursor.execute("DELETE FROM orders WHERE PartID = %s", (order_id,))
-                        self.conn.commit()
-                        QMessageBox.information(orders_dialog, "✅ Success", "Order deleted successfully.")
-                        load_orders()  # ✅ Refresh table after deletion
+                        placeholders = ", ".join(["%s"] * len(order_ids))
+                        with transaction(conn):
+                            prepared_cursor("delete_orders", len(order_ids)).execute(
+                                f"DELETE FROM orders WHERE PartID IN ({placeholders})", order_ids
+                            )
+                        for row in rows:
+                            orders_model.remove_row(row)
+                        QMessageBox.information(
+                            orders_dialog, "✅ Success",
+                            "Order deleted successfully." if len(rows) == 1 else f"{len(rows)} orders deleted successfully."
+                        )
                     except mariadb.Error as e:
                         QMessageBox.critical(orders_dialog, "❌ Database Error", f"An error occurred: {e}")
 
@@ -1340,6 +2015,12 @@ class DatabaseApp(QMainWindow):
             add_order_button.clicked.connect(add_order)  # Now this function is defined above
             orders_layout.addWidget(add_order_button)
 
+            delete_selected_button = QPushButton("🗑 Delete Selected")
+            delete_selected_button.clicked.connect(
+                lambda: delete_orders([index.row() for index in orders_table.selectionModel().selectedRows()])
+            )
+            orders_layout.addWidget(delete_selected_button)
+
             orders_dialog.setLayout(orders_layout)
             orders_dialog.exec_()
 
@@ -1349,54 +2030,23 @@ class DatabaseApp(QMainWindow):
             job_details_dialog = QDialog()
             job_details_dialog.setWindowTitle(f"🛠 Edit Job Details - Job {job_id}")
             job_details_dialog.setGeometry(600, 100, 700, 500)
-            job_details_dialog.setStyleSheet("""
-                QDialog {
-                    background-color: #1E1E1E;
-                    color: white;
-                    border-radius: 8px;
-                }
-                QLabel {
-                    font-size: 14px;
-                    font-weight: bold;
-                    color: #3A9EF5;
-                }
-                QLineEdit, QTextEdit, QComboBox {
-                    background-color: #333;
-                    color: white;
-                    border: 1px solid #3A9EF5;
-                    padding: 6px;
-                    border-radius: 5px;
-                }
-                QComboBox QAbstractItemView {
-                    background-color: #2A2A2A;
-                    selection-background-color: #3A9EF5;
-                    color: white;
-                }
-                QCheckBox {
-                    color: white;
-                }
-                QPushButton {
-                    background-color: #3A9EF5;
-                    color: white;
-                    border-radius: 5px;
-                    padding: 8px;
-                }
-                QPushButton:hover {
-                    background-color: #307ACC;
-                }
-            """)
+            job_details_dialog.setStyleSheet(_JOB_DETAILS_DIALOG_CSS)
 
             job_layout = QVBoxLayout()
 
-            # ✅ **Step 1: Fetch Column Names Dynamically (excluding JobID and EndDate)**
-            self.cursor.execute("SHOW COLUMNS FROM jobs")
-            columns = [col[0] for col in self.cursor.fetchall()]
-            excluded_columns = {"JobID", "EndDate", "CustomerID", "Notes", "Technician", "Status"}
+            # ✅ **Step 1: Column Names (excluding JobID and EndDate)**, from the schema cached per session
+            columns = list(self._column_types_for(cursor, "jobs"))
+            excluded_columns = {"JobID", "EndDate", "CustomerID", "Notes", "Technician", "Status", "StartDateDate"}
             display_columns = [col for col in columns if col not in excluded_columns]
 
+            # ✅ The column list is fixed for the session, so both statements keep the same text and prepare once
+            select_query = f"SELECT {', '.join(display_columns)} FROM jobs WHERE JOBID = %s"
+            update_query = f"UPDATE jobs SET {', '.join(f'{col} = %s' for col in display_columns)} WHERE JOBID = %s"
+
             # ✅ **Step 2: Fetch Current Job Data**
-            self.cursor.execute(f"SELECT {', '.join(display_columns)} FROM jobs WHERE JOBID = %s", (job_id,))
-            job_data = self.cursor.fetchone()
+            select_cursor = prepared_cursor("job_details")
+            select_cursor.execute(select_query, (job_id,))
+            job_data = select_cursor.fetchone()
 
             if not job_data:
                 QMessageBox.critical(None, "❌ Job Not Found", "No job details found.")
@@ -1450,9 +2100,8 @@ class DatabaseApp(QMainWindow):
 
                 try:
                     # ✅ **Update only if changes were made**
-                    update_query = f"UPDATE jobs SET {', '.join([f'{col} = %s' for col in display_columns])} WHERE JOBID = %s"
-                    self.cursor.execute(update_query, (*updated_values, job_id))
-                    self.conn.commit()
+                    with transaction(conn):
+                        prepared_cursor("save_job_details").execute(update_query, (*updated_values, job_id))
                     QMessageBox.information(job_details_dialog, "✅ Success", "Job details updated successfully.")
                     job_details_dialog.close()
                 except mariadb.Error as e:
@@ -1462,12 +2111,12 @@ class DatabaseApp(QMainWindow):
             button_layout = QHBoxLayout()
             
             save_button = QPushButton("💾 Save Changes")
-            save_button.setStyleSheet("background-color: #4CAF50; color: white; padding: 10px; font-weight: bold; border-radius: 5px;")
+            save_button.setStyleSheet(_FLAT_SAVE_BUTTON_CSS)
             save_button.clicked.connect(save_job_details)
             button_layout.addWidget(save_button)
 
             cancel_button = QPushButton("❌ Cancel")
-            cancel_button.setStyleSheet("background-color: #D9534F; color: white; padding: 10px; font-weight: bold; border-radius: 5px;")
+            cancel_button.setStyleSheet(_FLAT_CANCEL_BUTTON_CSS)
             cancel_button.clicked.connect(job_details_dialog.close)
             button_layout.addWidget(cancel_button)
 
@@ -1514,7 +2163,11 @@ class DatabaseApp(QMainWindow):
         main_layout.addLayout(button_layout)
 
         edit_dialog.setLayout(main_layout)
-        edit_dialog.exec_()
+        try:
+            edit_dialog.exec_()
+        finally:
+            for prepared_cur in prepared.values():
+                prepared_cur.close()
 
     def Customer_report(self): #UI + DATA_ACCESS
         # Step 1: Ask for Job ID
@@ -1527,13 +2180,42 @@ class DatabaseApp(QMainWindow):
             QMessageBox.warning(self, "Input Error", "Job ID cannot be empty.")
             return
 
-        # Step 2: Retrieve CustomerID
-        self.cursor.execute("SELECT CustomerID FROM Jobs WHERE JobID = %s", (job_id,))
-        result = self.cursor.fetchone()
-        if not result:
-            QMessageBox.critical(self, "Job Not Found", f"No job found with ID {job_id}.")
-            return
-        customer_id = result[0]
+        # Step 2: Read the whole report on its own pooled cursor, so it never shares a result set with another dialog
+        with pooled_cursor(self.pool) as cursor:
+            cursor.execute("SELECT CustomerID FROM Jobs WHERE JobID = %s", (job_id,))
+            result = cursor.fetchone()
+            if not result:
+                QMessageBox.critical(self, "Job Not Found", f"No job found with ID {job_id}.")
+                return
+            customer_id = result[0]
+
+            cursor.execute("SELECT * FROM Customers WHERE CustomerID = %s", (customer_id,))
+            customer_info = cursor.fetchone()
+            customer_columns = [desc[0] for desc in cursor.description]
+
+            cursor.execute("SELECT * FROM Jobs WHERE CustomerID = %s", (customer_id,))
+            all_jobs = cursor.fetchall()
+            job_columns = [desc[0] for desc in cursor.description]  # DESCRIBE also lists the invisible StartDateDate
+
+            # ✅ Tables with a JobID column, straight from the cached schema (no SHOW TABLES / DESCRIBE per report)
+            self._column_types_for(cursor, "jobs")
+            tables = [
+                table_name for table_name, column_types in self._schema_cache.items()
+                if "jobid" in (column.lower() for column in column_types)
+            ]
+
+        # ✅ The customer's job ids are already in hand, so each table is a plain IN list (NULL matches nothing
+        # but still returns the column names)
+        job_id_index = [column.lower() for column in job_columns].index("jobid")
+        job_ids = ", ".join(str(int(job[job_id_index])) for job in all_jobs) or "NULL"
+        table_queries = {
+            table_name: f"SELECT * FROM `{table_name}` WHERE JobID IN ({job_ids})"
+            for table_name in tables
+            if table_name.lower() not in ["customers", "jobs", "walkins"]
+        }
+
+        # ✅ table -> (columns, rows), filled as the rows stream in; the Excel export reuses these instead of querying again
+        job_tables = {}
 
         # Step 3: Create Customer Report Window
         customer_window = QDialog(self)
@@ -1543,84 +2225,95 @@ class DatabaseApp(QMainWindow):
         layout = QVBoxLayout()
         tab_widget = QTabWidget()
 
-        # Step 4: Customer Information Tab
-        self.cursor.execute("DESCRIBE Customers")
-        customer_columns = [col[0] for col in self.cursor.fetchall()]
-        self.cursor.execute("SELECT * FROM Customers WHERE CustomerID = %s", (customer_id,))
-        customer_info = self.cursor.fetchone()
+        # ✅ Columns are fitted to their contents once, when a tab is first shown, instead of for every tab up front
+        unfitted_views = {}  # tab index -> table view
 
+        def fit_tab(index):
+            view = unfitted_views.pop(index, None)
+            if view is not None:
+                view.resizeColumnsToContents()
+
+        def report_table(columns, rows):
+            view = rows_table_view(columns, rows)
+            view.horizontalHeader().setSectionResizeMode(QHeaderView.Interactive)
+            view.horizontalHeader().setDefaultSectionSize(120)
+            return view
+
+        # Step 4: Customer Information Tab
         customer_tab = QWidget()
         customer_layout = QVBoxLayout()
-        customer_table = QTableWidget()
-        customer_table.setColumnCount(2)
-        customer_table.setHorizontalHeaderLabels(["Field", "Value"])
-        customer_table.setRowCount(len(customer_columns))
-        
-        for row, (col, value) in enumerate(zip(customer_columns, customer_info)):
-            customer_table.setItem(row, 0, QTableWidgetItem(col))
-            customer_table.setItem(row, 1, QTableWidgetItem(str(value)))
-
-        customer_table.resizeColumnsToContents()
+        customer_table = report_table(["Field", "Value"], list(zip(customer_columns, customer_info)))
         customer_layout.addWidget(customer_table)
         customer_tab.setLayout(customer_layout)
-        tab_widget.addTab(customer_tab, "Customer Info")
+        unfitted_views[tab_widget.addTab(customer_tab, "Customer Info")] = customer_table
 
         # Step 5: Jobs Tab
-        self.cursor.execute("DESCRIBE Jobs")
-        job_columns = [col[0] for col in self.cursor.fetchall()]
-        self.cursor.execute("SELECT * FROM Jobs WHERE CustomerID = %s", (customer_id,))
-        all_jobs = self.cursor.fetchall()
-
         jobs_tab = QWidget()
         jobs_layout = QVBoxLayout()
-        jobs_table = QTableWidget()
-        jobs_table.setColumnCount(len(job_columns))
-        jobs_table.setHorizontalHeaderLabels(job_columns)
-        jobs_table.setRowCount(len(all_jobs))
-        
-        for row, job in enumerate(all_jobs):
-            for col, value in enumerate(job):
-                jobs_table.setItem(row, col, QTableWidgetItem(str(value)))
-
-        jobs_table.resizeColumnsToContents()
+        jobs_table = report_table(job_columns, all_jobs)  # ✅ Cells are formatted only when painted
         jobs_layout.addWidget(jobs_table)
         jobs_tab.setLayout(jobs_layout)
-        tab_widget.addTab(jobs_tab, "Jobs")
+        unfitted_views[tab_widget.addTab(jobs_tab, "Jobs")] = jobs_table
         
         # Step 6: Individual Tables as Tabs
-        self.cursor.execute("SHOW TABLES;")
-        tables = [table[0] for table in self.cursor.fetchall()]
-        
-        for table_name in tables:
-            if table_name.lower() in ["customers", "jobs", "walkins"]:
-                continue
+        # ✅ Each table is streamed through an unbuffered cursor on a worker thread: its tab appears with the
+        # first batch and grows as the rest arrive, so the window opens before the largest table is read
+        table_models = {}
+        report_closed = False
+
+        def stream_tables(cursor, conn):
+            for table_name, query in table_queries.items():
+                if report_closed:
+                    return
+                cursor.execute(query)
+                columns = [desc[0] for desc in cursor.description]
+                rows = cursor.fetchmany(_JOB_ROWS_BATCH_SIZE)
+                yield table_name, columns, rows
+                while rows and not report_closed:
+                    rows = cursor.fetchmany(_JOB_ROWS_BATCH_SIZE)
+                    if rows:
+                        yield table_name, columns, rows
+
+        def show_table_batch(chunk):
+            table_name, columns, rows = chunk
+            if table_name not in table_models:
+                job_tables[table_name] = (columns, [])
+
+                table_tab = QWidget()
+                table_layout = QVBoxLayout()
+
+                table_widget = report_table(columns, [])
+                table_layout.addWidget(table_widget)
+                table_tab.setLayout(table_layout)
+                unfitted_views[tab_widget.addTab(table_tab, table_name.capitalize())] = table_widget
+                table_models[table_name] = table_widget.model()
+
+            job_tables[table_name][1].extend(rows)
+            table_models[table_name].append_rows(rows)
+
+        def tables_loaded(_):
+            export_button.setEnabled(True)
+            export_button.setText("Export to Excel")
+
+        def tables_failed(message):
+            tables_loaded(None)
+            QMessageBox.critical(customer_window, "Database Error", f"❌ Failed to load the job tables: {message}")
+
+        def guarded(slot):
+            """Drops worker results that arrive after the report window was closed."""
+            def call(value):
+                if report_closed:
+                    return
+                try:
+                    slot(value)
+                except RuntimeError:
+                    pass  # The window's widgets are already gone
+            return call
 
-            self.cursor.execute(f"DESCRIBE `{table_name}`")
-            columns = [col[0] for col in self.cursor.fetchall()]
-            
-            table_tab = QWidget()
-            table_layout = QVBoxLayout()
-            
-            table_widget = QTableWidget()
-            table_widget.setColumnCount(len(columns))
-            table_widget.setHorizontalHeaderLabels(columns)
-            
-            self.cursor.execute(f"SELECT * FROM `{table_name}` WHERE JobID IN (SELECT JobID FROM Jobs WHERE CustomerID = %s)", (customer_id,))
-            table_data = self.cursor.fetchall()
-            table_widget.setRowCount(len(table_data))
-            
-            for row_idx, row in enumerate(table_data):
-                for col_idx, value in enumerate(row):
-                    table_widget.setItem(row_idx, col_idx, QTableWidgetItem(str(value)))
-            
-            table_widget.resizeColumnsToContents()
-            table_layout.addWidget(table_widget)
-            table_tab.setLayout(table_layout)
-            tab_widget.addTab(table_tab, table_name.capitalize())
-        
         # Step 7: Buttons
         button_layout = QHBoxLayout()
-        export_button = QPushButton("Export to Excel")
+        export_button = QPushButton("⏳ Loading...")
+        export_button.setEnabled(False)  # ✅ Enabled once every table has been read
         close_button = QPushButton("Close")
         button_layout.addWidget(export_button)
         button_layout.addWidget(close_button)
@@ -1630,32 +2323,53 @@ class DatabaseApp(QMainWindow):
             if not file_path:
                 return
 
-            report_data = {
-                "Customer Information": pd.DataFrame([customer_info], columns=customer_columns),
-                "Jobs": pd.DataFrame(all_jobs, columns=job_columns)
-            }
-            
-            for table_name in tables:
-                if table_name.lower() in ["customers", "jobs", "walkins"]:
-                    continue
-
-                self.cursor.execute(f"DESCRIBE `{table_name}`")
-                columns = [col[0] for col in self.cursor.fetchall()]
-                self.cursor.execute(f"SELECT * FROM `{table_name}` WHERE JobID IN (SELECT JobID FROM Jobs WHERE CustomerID = %s)", (customer_id,))
-                table_data = self.cursor.fetchall()
-                
-                if table_data:
-                    report_data[table_name] = pd.DataFrame(table_data, columns=columns)
-            
-            with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-                for sheet_name, df in report_data.items():
-                    df.to_excel(writer, sheet_name=sheet_name, index=False)
+            def report_sheets():
+                yield "Customer Information", customer_columns, [customer_info]
+                yield "Jobs", job_columns, all_jobs
+                for table_name, (columns, table_data) in job_tables.items():
+                    if table_data:
+                        yield table_name, columns, table_data
 
-            QMessageBox.information(customer_window, "Export Successful", f"Customer report exported to {file_path}")
+            def write_workbook():
+                write_excel_sheets(file_path, report_sheets())
+
+            def export_finished(message, succeeded):
+                try:
+                    export_button.setEnabled(True)
+                    export_button.setText("Export to Excel")
+                except RuntimeError:
+                    return  # The report window was closed meanwhile
+                if succeeded:
+                    QMessageBox.information(customer_window, "Export Successful", f"Customer report exported to {file_path}")
+                else:
+                    QMessageBox.critical(customer_window, "Export Failed", f"Failed to export the customer report:\n{message}")
+
+            # ✅ The workbook is written on a worker thread so the window keeps repainting during large exports
+            export_button.setEnabled(False)
+            export_button.setText("⏳ Exporting...")
+            run_task_in_background(
+                write_workbook,
+                lambda _: export_finished(None, True),
+                lambda message: export_finished(message, False)
+            )
 
         export_button.clicked.connect(export_to_excel)
         close_button.clicked.connect(customer_window.close)
+
+        tab_widget.currentChanged.connect(fit_tab)
+        QTimer.singleShot(0, lambda: fit_tab(tab_widget.currentIndex()))  # First tab, once the window is up
         
+        def report_finished(_):
+            nonlocal report_closed
+            report_closed = True  # ✅ Stops the worker before its next batch
+
+        customer_window.finished.connect(report_finished)
+        # ✅ The main pool: the dashboard expects every report_pool connection to be free
+        run_in_background(
+            self.pool, stream_tables,
+            guarded(tables_loaded), guarded(tables_failed), on_batch=guarded(show_table_batch), buffered=False
+        )
+
         layout.addWidget(tab_widget)
         layout.addLayout(button_layout)
         customer_window.setLayout(layout)
@@ -1663,7 +2377,11 @@ class DatabaseApp(QMainWindow):
 
     def dashboard_page(self): #UI + DATA_ACCESS
         """Displays the dashboard with income prediction and new features."""
-        
+        import numpy as np
+        import matplotlib.cm as cm
+        from matplotlib.figure import Figure
+        from matplotlib.backends.backend_qt5agg import FigureCanvasQTAgg as FigureCanvas
+
         self.dashboard_dialog = QDialog(self)
         self.dashboard_dialog.setWindowTitle("📊 Business Dashboard")
         self.dashboard_dialog.setGeometry(400, 400, 1500, 950)
@@ -1684,180 +2402,103 @@ class DatabaseApp(QMainWindow):
         layout.addWidget(QLabel("<h2>📊 Business Dashboard</h2>", alignment=Qt.AlignCenter))
         layout.addWidget(scroll_area)
 
-        def add_chart_to_layout(fig, title=""):
-            """Adds a chart to the scrollable layout with spacing and fixed size."""
-            fig.suptitle(title, fontsize=14, fontweight='bold')
-            canvas = FigureCanvas(fig)
+        charts_used = 0
+
+        def new_chart(figsize):
+            """
+            (fig, ax) for the next chart. Figures and canvases are kept across dashboard opens and
+            cleared for reuse, and are built without pyplot so nothing piles up in its figure registry.
+            """
+            nonlocal charts_used
+            if charts_used < len(self._dash_canvases):
+                fig = self._dash_canvases[charts_used].figure
+                fig.clear()
+                fig.set_size_inches(figsize)
+            else:
+                fig = Figure(figsize=figsize, constrained_layout=True)
+                self._dash_canvases.append(FigureCanvas(fig))
+            charts_used += 1
+            return fig, fig.add_subplot()
+
+        def show_canvas(canvas):
+            """Adds a chart canvas to the scrollable layout with spacing and fixed size."""
             canvas.setSizePolicy(QSizePolicy.Expanding, QSizePolicy.Fixed)
             canvas.setFixedHeight(400)
             scroll_layout.addWidget(canvas)
             scroll_layout.addSpacing(20)
 
+        def add_chart_to_layout(fig, title=""):
+            """Titles a freshly drawn chart, adds it to the layout and schedules its repaint."""
+            fig.suptitle(title, fontsize=14, fontweight='bold')
+            show_canvas(fig.canvas)
+            fig.canvas.draw_idle()
 
-        try:
+
+        def first_row(name):
+            """First row of one aggregate's result (or None)."""
+            rows = aggregates[name]
+            return rows[0] if rows else None
+
+        def label_values(name):
+            """
+            (labels, values) of a two-column aggregate; NULL groups are already filtered out in SQL,
+            and the values come back as one float array ready for matplotlib.
+            """
+            rows = aggregates[name]
+            return [row[0] for row in rows], np.fromiter((row[1] for row in rows), dtype=np.float64, count=len(rows))
+
+        def render_chart(name):
+            """Draws aggregate `name` as described by _DASHBOARD_CHARTS[name] (nothing when it has no rows)."""
+            spec = _DASHBOARD_CHARTS[name]
+            labels, values = label_values(name)
+            if not labels:
+                return
+            if spec.get("str_labels"):
+                labels = list(map(str, labels))  # e.g. CustomerIDs as categories, not positions
+
+            fig, ax = new_chart(spec["figsize"])
+            if spec["kind"] == "pie":
+                ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, colors=cm.Set2.colors)
+            else:
+                getattr(ax, spec["kind"])(labels, values, color=spec["color"])
+            ax.set(**spec["axes"])
+            if spec.get("rotate"):
+                ax.tick_params(axis='x', rotation=45)
+            add_chart_to_layout(fig, spec.get("suptitle", ""))
+
+        def draw_charts():
+            """Draws every chart from `aggregates` into the pooled figures."""
             ### CUSTOMER ACQUISITION ###
-            self.cursor.execute("SELECT HowHeard, COUNT(*) FROM howheard GROUP BY HowHeard;")
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from results
-                results = [(source, count) for source, count in results if source is not None and count is not None]
-                if results:
-                    labels, values = zip(*results)
-                    fig, ax = plt.subplots(figsize=(6, 4))
-                    ax.pie(values, labels=labels, autopct='%1.1f%%', startangle=90, colors=plt.cm.Set2.colors)
-                    add_chart_to_layout(fig, "Customer Acquisition by Referral Source")
+            render_chart("acquisition")
 
             ### TOP CUSTOMERS BY JOB COUNT ###
-            self.cursor.execute("SELECT CustomerID, COUNT(*) FROM JOBS GROUP BY CustomerID ORDER BY COUNT(*) DESC LIMIT 10;")
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from customers or job counts
-                results = [(cust, count) for cust, count in results if cust is not None and count is not None]
-                if results:
-                    customers, job_counts = zip(*results)
-                    customers = list(map(str, customers))  # Convert CustomerID to string if needed
-                    job_counts = np.array(job_counts, dtype=float)  # Ensure counts are numeric
-
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.bar(customers, job_counts, color="blue")
-                    ax.set_xlabel("Customer ID")
-                    ax.set_ylabel("Job Count")
-                    ax.tick_params(axis='x', rotation=45)  # Rotate x-axis labels for better readability
-                    add_chart_to_layout(fig, "Top Customers by Job Count")
+            render_chart("top_customers")
 
             ### MOST FREQUENT DEVICE Brands ###
-            self.cursor.execute("SELECT DeviceBrand, COUNT(*) FROM JOBS GROUP BY DeviceBrand ORDER BY COUNT(*) DESC LIMIT 10;")
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from issues or counts
-                results = [(issue, count) for issue, count in results if issue is not None and count is not None]
-                if results:
-                    issues, counts = zip(*results)
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.barh(issues, counts, color="orange")
-                    ax.set_xlabel("Count")
-                    ax.set_ylabel("Device Brand")
-                    add_chart_to_layout(fig, "Most Frequent Device Brands")
+            render_chart("device_brands")
 
             ### DEVICE AND ISSUE TRENDS ###
-            self.cursor.execute("""
-                SELECT DeviceType, COUNT(*) 
-                FROM JOBS
-                GROUP BY DeviceType
-                ORDER BY COUNT(*) DESC
-                LIMIT 10;
-            """)
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from device types or job counts
-                results = [(device, count) for device, count in results if device is not None and count is not None]
-                if results:
-                    device_types, job_counts = zip(*results)
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.bar(device_types, job_counts, color="orange")
-                    ax.set_xlabel("Device Type")
-                    ax.set_ylabel("Job Count")
-                    ax.set_title("Most Common Device Types")
-                    ax.tick_params(axis='x', rotation=45)
-                    plt.subplots_adjust(bottom=0.3)  # Increases space at the bottom
-                    add_chart_to_layout(fig)
+            render_chart("device_types")
 
-            
             ### JOB STATUS DISTRIBUTION ###
-            self.cursor.execute("SELECT Status, COUNT(*) FROM JOBS GROUP BY Status;")
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from results
-                results = [(status, count) for status, count in results if status is not None and count is not None]
-                if results:
-                    labels, values = zip(*results)
-                    fig, ax = plt.subplots(figsize=(6, 4))
-                    ax.bar(labels, values, color=["blue", "green", "red", "purple", "yellow"])
-                    ax.set_xlabel("Job Status")
-                    ax.set_ylabel("Count")
-                    add_chart_to_layout(fig, "Job Status Distribution")
+            render_chart("job_status")
 
             ### JOB DURATION ANALYSIS (in Days) ###
-            self.cursor.execute("""
-                SELECT Technician, AVG(TIMESTAMPDIFF(DAY, StartDate, EndDate)) 
-                FROM JOBS 
-                WHERE StartDate IS NOT NULL AND EndDate IS NOT NULL
-                GROUP BY Technician;
-            """)
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from technicians or average durations
-                results = [(technician, avg_duration) for technician, avg_duration in results if technician is not None and avg_duration is not None]
-                if results:
-                    technicians, avg_durations = zip(*results)
-                    
-                    # Create the bar plot with days as the unit
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.bar(technicians, avg_durations, color="purple")
-                    
-                    # Set axis labels and title
-                    ax.set_xlabel("Technician")
-                    ax.set_ylabel("Average Duration (Days)")  # Change label to 'Days'
-                    ax.set_title("Average Job Duration by Technician (in Days)")  # Title adjusted for days
-                    ax.tick_params(axis='x', rotation=45)  # Rotate x-axis labels for better readability
-                    add_chart_to_layout(fig)
-
+            render_chart("technician_durations")
 
-            
-
-            self.cursor.execute("""
-                SELECT Issue, COUNT(*) 
-                FROM JOBS
-                GROUP BY Issue
-                ORDER BY COUNT(*) DESC
-                LIMIT 10;
-            """)
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from issues or issue counts
-                results = [(issue, count) for issue, count in results if issue is not None and count is not None]
-                if results:
-                    issues, issue_counts = zip(*results)
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.barh(issues, issue_counts, color="blue")
-                    ax.set_xlabel("Count")
-                    ax.set_ylabel("Device Issue")
-                    ax.set_title("Most Frequent Device Issues")
-                    add_chart_to_layout(fig)
+            ### MOST FREQUENT DEVICE ISSUES ###
+            render_chart("issues")
 
             ### WORKLOAD DISTRIBUTION ###
-            self.cursor.execute("""
-                SELECT Technician, COUNT(*) 
-                FROM JOBS
-                GROUP BY Technician
-                ORDER BY COUNT(*) DESC;
-            """)
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from technicians or job counts
-                results = [(technician, count) for technician, count in results if technician is not None and count is not None]
-                if results:
-                    technicians, job_counts = zip(*results)
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.bar(technicians, job_counts, color="cyan")
-                    ax.set_xlabel("Technician")
-                    ax.set_ylabel("Job Count")
-                    ax.set_title("Technician Workload Distribution")
-                    ax.tick_params(axis='x', rotation=45)
-                    add_chart_to_layout(fig)
+            render_chart("workload")
 
             ### JOB COMPLETION TIME ANALYSIS (in Days) ###
-            self.cursor.execute("""
-                SELECT AVG(TIMESTAMPDIFF(DAY, StartDate, EndDate)) 
-                FROM JOBS
-                WHERE StartDate IS NOT NULL AND EndDate IS NOT NULL;
-            """)
-            result = self.cursor.fetchone()
+            result = first_row("avg_duration")
             if result and result[0] is not None:
                 avg_duration = result[0]
                 
                 # Create a bar chart for average job duration in days
-                fig, ax = plt.subplots(figsize=(6, 4))
+                fig, ax = new_chart((6, 4))
                 ax.bar(["Average Job Duration"], [avg_duration], color="red")
                 
                 # Set axis labels and title
@@ -1868,183 +2509,120 @@ class DatabaseApp(QMainWindow):
 
 
             ### WALK-IN VOLUME & TRENDS ###
-            self.cursor.execute("""
-                SELECT DATE(WalkinDate), COUNT(*) 
-                FROM walkins
-                GROUP BY DATE(WalkinDate)
-                ORDER BY DATE(WalkinDate);
-            """)
-            results = self.cursor.fetchall()
+            # ✅ One point per week (its Monday, as days since the epoch), so years of walk-ins stay a few
+            # hundred points and the dates convert in one NumPy cast
+            results = aggregates["walkin_volume"]
             if results:
-                # Filter out None values from dates or walkin counts
-                results = [(date, count) for date, count in results if date is not None and count is not None]
-                if results:
-                    dates, walkin_counts = zip(*results)
-                    fig, ax = plt.subplots(figsize=(8, 4))
+                day_nums = np.fromiter((row[0] for row in results), dtype=np.int64, count=len(results))
+                walkin_counts = np.fromiter((row[1] for row in results), dtype=np.int64, count=len(results))
+                dates = day_nums.astype("datetime64[D]")
+                if len(dates):
+                    fig, ax = new_chart((8, 4))
                     ax.plot(dates, walkin_counts, marker="o", color="brown")
-                    ax.set_xlabel("Date")
-                    ax.set_ylabel("Walk-In Count")
-                    ax.set_title("Walk-In Volume Over Time")
+                    ax.set_xlabel("Week Starting")
+                    ax.set_ylabel("Walk-Ins per Week")
+                    ax.set_title("Weekly Walk-In Volume")
                     ax.tick_params(axis='x', rotation=45)
                     add_chart_to_layout(fig)
 
             ### WALK-IN SERVICE TYPE ###
-            self.cursor.execute("""
-                SELECT Description, COUNT(*) 
-                FROM walkins
-                GROUP BY Description
-                ORDER BY COUNT(*) DESC
-                LIMIT 10;
-            """)
-            results = self.cursor.fetchall()
-            if results:
-                # Filter out None values from descriptions or service counts
-                results = [(desc, count) for desc, count in results if desc is not None and count is not None]
-                if results:
-                    descriptions, service_counts = zip(*results)
-                    fig, ax = plt.subplots(figsize=(8, 4))
-                    ax.barh(descriptions, service_counts, color="pink")
-                    ax.set_xlabel("Count")
-                    ax.set_ylabel("Walk-In Service Description")
-                    ax.set_title("Most Common Walk-In Services")
-                    add_chart_to_layout(fig)
+            render_chart("walkin_services")
 
             
 
 
             # SQL to calculate the average jobs per day per week
-            self.cursor.execute("""
-                SELECT WEEK(StartDate) AS WeekNumber, DAYOFWEEK(StartDate) AS DayOfWeek, COUNT(*) AS JobCount
-                FROM JOBS
-                WHERE StartDate IS NOT NULL AND DAYOFWEEK(StartDate) != 1  -- Exclude Sunday
-                GROUP BY WeekNumber, DayOfWeek
-                ORDER BY WeekNumber, DayOfWeek;
-            """)
-            results = self.cursor.fetchall()
+            results = aggregates["weekly_jobs"]
 
             if results:
                 # Map day numbers to names
                 days_of_week = ["Sunday", "Monday", "Tuesday", "Wednesday", "Thursday", "Friday", "Saturday"]
                 
-                # Initialize data structures to hold weekly job counts
-                weekly_job_counts = {}
-                
-                # Populate the weekly job counts
-                for week_number, day_of_week, job_count in results:
-                    if week_number not in weekly_job_counts:
-                        weekly_job_counts[week_number] = [0] * 6  # We only need Monday-Saturday
-                    weekly_job_counts[week_number][day_of_week - 2] = job_count  # Map day to 0-based index (Mon=0, Sat=5)
-                
-                # Calculate the average jobs per day for each week
-                avg_jobs_per_day_per_week = {}
-                for week_number, job_counts in weekly_job_counts.items():
-                    avg_jobs_per_day_per_week[week_number] = sum(job_counts) / len([job_count for job_count in job_counts if job_count > 0])  # Exclude days with no jobs
+                # ✅ Build the (week x Monday-Saturday) count grid in NumPy: np.unique gives each week its row,
+                # and one bincount over row * 6 + day scatters every count without a Python loop
+                weekly = np.asarray(results, dtype=np.int64)  # (WeekNumber, DayIdx, JobCount) rows
+                weeks, week_rows = np.unique(weekly[:, 0], return_inverse=True)
+                weekly_job_counts = np.bincount(
+                    week_rows * 6 + weekly[:, 1],  # WEEKDAY() is already 0-based (Mon=0, Sat=5)
+                    weights=weekly[:, 2],
+                    minlength=len(weeks) * 6
+                ).astype(np.int64).reshape(len(weeks), 6)
                 
                 # Plot the job counts and averages
-                fig, ax = plt.subplots(figsize=(10, 6))
+                fig, ax = new_chart((10, 6))
                 
-                # Plot the job counts for each week
-                for week_number, job_counts in weekly_job_counts.items():
-                    ax.plot(days_of_week[1:7], job_counts, marker="o", label=f"Week {week_number}")
+                # ✅ One ax.plot call draws every week (one line per column of the transposed grid);
+                # rasterized: one bitmap per week instead of vector strokes on every repaint
+                lines = ax.plot(days_of_week[1:7], weekly_job_counts.T, marker="o", rasterized=True)
 
                 ax.set_xlabel("Day of the Week")
                 ax.set_ylabel("Job Count")
                 ax.set_title("Job Counts Per Day (Excluding Sunday) for Each Week")
-                ax.legend(title="Weeks")
+                ax.legend(lines, [f"{week_number // 100} W{week_number % 100:02}" for week_number in weeks], title="Weeks")
                 
                 add_chart_to_layout(fig)
 
                 # Query for the average job intake per day of the week, excluding Sundays
-                # Get the earliest job date from the database
-                self.cursor.execute("""
-                    SELECT MIN(StartDate) 
-                    FROM jobs;
-                """)
-                earliest_record = self.cursor.fetchone()
-
-                # Extract the earliest job date from the result
-                start_date = earliest_record[0] if earliest_record and earliest_record[0] else '2000-01-01'  # Default to a very old date if no record is found
-
-                # Average job intake per day (excluding Sunday)
-                self.cursor.execute("""
-                    SELECT DAYOFWEEK(StartDate) AS DayOfWeek, COUNT(*) / COUNT(DISTINCT WEEK(StartDate)) AS AvgJobCount
-                    FROM jobs
-                    WHERE DAYOFWEEK(StartDate) != 1 AND StartDate >= %s
-                    GROUP BY DayOfWeek
-                    ORDER BY DayOfWeek;
-                """, (start_date,))
-
-                results = self.cursor.fetchall()
-
-                if results:
-                    # Filter out None values
-                    results = [(day_of_week, avg_count) for day_of_week, avg_count in results if day_of_week is not None and avg_count is not None]
-
-                    if results:
-                        # Map days of the week to their corresponding names (excluding Sunday)
-                        days_of_week = {
-                            2: "Monday",
-                            3: "Tuesday",
-                            4: "Wednesday",
-                            5: "Thursday",
-                            6: "Friday",
-                            7: "Saturday"
-                        }
-
-                        # Prepare data for plotting
-                        days, avg_counts = zip(*results)
-                        days = [days_of_week[day] for day in days]
-
-                        # Create a bar chart
-                        fig1, ax1 = plt.subplots(figsize=(8, 4))
-                        ax1.bar(days, avg_counts, color="blue")
-                        ax1.set_xlabel("Day of the Week")
-                        ax1.set_ylabel("Average Job Count")
-                        ax1.set_title("Average Job Intake per Day of Week (Excluding Sunday)")
-                        ax1.tick_params(axis='x', rotation=45)
-                        plt.tight_layout()
-                        add_chart_to_layout(fig1)
+                days, avg_counts = label_values("weekday_averages")
+
+                if days:
+                    # Map days of the week to their corresponding names (excluding Sunday)
+                    days_of_week = {
+                        0: "Monday",
+                        1: "Tuesday",
+                        2: "Wednesday",
+                        3: "Thursday",
+                        4: "Friday",
+                        5: "Saturday"
+                    }
+                    days = [days_of_week[day] for day in days]
+
+                    # Create a bar chart
+                    fig1, ax1 = new_chart((8, 4))
+                    ax1.bar(days, avg_counts, color="blue")
+                    ax1.set_xlabel("Day of the Week")
+                    ax1.set_ylabel("Average Job Count")
+                    ax1.set_title("Average Job Intake per Day of Week (Excluding Sunday)")
+                    ax1.tick_params(axis='x', rotation=45)
+                    add_chart_to_layout(fig1)
 
                 
-                # Step 1: Extract the time of day (in minutes) from the startdate for all jobs
-                # Step 1: Extract the time of day (in minutes) from the startdate for all jobs
-                self.cursor.execute("""
-                    SELECT TIMESTAMPDIFF(SECOND, DATE(StartDate), StartDate)
-                    FROM JOBS
-                    WHERE StartDate IS NOT NULL;
-                """)
-                times_in_seconds = [row[0] for row in self.cursor.fetchall() if row[0] is not None]
+                # Step 1: Aggregate job start times per hour of day on the server
+                # ✅ One GROUP BY HOUR row per hour replaces fetching every job's start time
+                hourly_rows = aggregates["start_hours"]
 
-                # Convert to minutes for easier readability
-                times_in_minutes = [time / 60 for time in times_in_seconds]
+                # (StartHour, JobCount, TotalSeconds) rows as one array; counts are scattered by hour in one step
+                hourly = np.asarray(hourly_rows, dtype=np.float64).reshape(-1, 3)
+                counts = np.zeros(24, dtype=np.int64)
+                counts[hourly[:, 0].astype(np.int64)] = hourly[:, 1]
 
                 # Step 2: Plot the histogram of time distribution (overall)
-                fig, ax = plt.subplots(figsize=(10, 6))
-                counts, bins, patches = ax.hist(times_in_minutes, bins=24, color='orange', edgecolor='black')  # 24 bins for each hour
+                fig, ax = new_chart((10, 6))
+                ax.bar(_HOUR_TICKS, counts, width=60, align='edge', color='orange', edgecolor='black')  # One bar per hour
                 ax.set_xlabel('Time of Day (minutes from midnight)')
                 ax.set_ylabel('Number of Jobs')
                 ax.set_title('Overall Job Start Time Distribution')
 
                 # Format the x-axis labels to show time in HH:MM format
-                ax.set_xticks(range(0, 1440, 60))
-                ax.set_xticklabels([f'{i//60:02}:{i%60:02}' for i in range(0, 1440, 60)])
+                ax.set_xticks(_HOUR_TICKS)
+                ax.set_xticklabels(_HOUR_LABELS)
 
                 # Step 3: Calculate the overall average time of day (in minutes)
-                avg_time_minutes = sum(times_in_minutes) / len(times_in_minutes)
+                avg_time_minutes = float(hourly[:, 2].sum()) / 60 / counts.sum()
 
                 # Step 4: Add a vertical line for the average time
                 ax.axvline(avg_time_minutes, color='red', linestyle='dashed', linewidth=2, 
                             label=f'Avg: {avg_time_minutes//60:02}:{avg_time_minutes%60:02} ({avg_time_minutes/60:.2f} hrs)')
 
-                # Step 5: Find the busiest time interval (bin with the maximum count)
-                max_count_bin_index = counts.argmax()  # Get the index of the bin with the most jobs
-                max_count_bin_start = bins[max_count_bin_index]
-                max_count_bin_end = bins[max_count_bin_index + 1]
+                # Step 5: Find the busiest hour (bar with the maximum count)
+                busiest_hour = int(counts.argmax())  # Get the hour with the most jobs
+                max_count_bin_start = busiest_hour * 60
+                max_count_bin_end = max_count_bin_start + 60
 
                 # Label the busiest time period on the plot
                 ax.text(
                     max_count_bin_start + (max_count_bin_end - max_count_bin_start) / 2,  # Position at the center of the bin
-                    counts[max_count_bin_index] + 1,  # Position a little above the highest bar
+                    counts[busiest_hour] + 1,  # Position a little above the highest bar
                     f'Busiest: {int(max_count_bin_start // 60):02}:{int(max_count_bin_start % 60):02} - {int(max_count_bin_end // 60):02}:{int(max_count_bin_end % 60):02}',
                     color='blue', ha='center', fontsize=10, fontweight='bold'
                 )
@@ -2065,52 +2643,152 @@ class DatabaseApp(QMainWindow):
 )
 
                 # Step 7: Adjust layout and add to your layout
-                plt.tight_layout()
 
                 # Assuming add_chart_to_layout is a function that takes in a matplotlib figure
                 add_chart_to_layout(fig)  # Adding the figure to your layout
 
+        try:
+            # ✅ Group on the indexed StartDateDate column once the migration has run (see login)
+            start_day = "StartDateDate" if self.has_start_date_index else "DATE(StartDate)"
+
+            # ✅ Every chart's aggregate is independent: they are split over the report connections,
+            # each sending its share in one round-trip, and run at the same time
+            queries = {
+                "acquisition": "SELECT HowHeard, COUNT(*) FROM howheard WHERE HowHeard IS NOT NULL GROUP BY HowHeard",
+                "top_customers": "SELECT CustomerID, COUNT(*) FROM JOBS WHERE CustomerID IS NOT NULL GROUP BY CustomerID ORDER BY COUNT(*) DESC LIMIT 10",
+                "device_brands": "SELECT DeviceBrand, COUNT(*) FROM JOBS WHERE DeviceBrand IS NOT NULL GROUP BY DeviceBrand ORDER BY COUNT(*) DESC LIMIT 10",
+                "device_types": """
+                    SELECT DeviceType, COUNT(*) 
+                    FROM JOBS
+                    WHERE DeviceType IS NOT NULL
+                    GROUP BY DeviceType
+                    ORDER BY COUNT(*) DESC
+                    LIMIT 10
+                """,
+                "job_status": "SELECT Status, COUNT(*) FROM JOBS WHERE Status IS NOT NULL GROUP BY Status",
+                "technician_durations": """
+                    SELECT Technician, AVG(TIMESTAMPDIFF(DAY, StartDate, EndDate)) 
+                    FROM JOBS 
+                    WHERE StartDate IS NOT NULL AND EndDate IS NOT NULL AND Technician IS NOT NULL
+                    GROUP BY Technician
+                """,
+                "issues": """
+                    SELECT Issue, COUNT(*) 
+                    FROM JOBS
+                    WHERE Issue IS NOT NULL
+                    GROUP BY Issue
+                    ORDER BY COUNT(*) DESC
+                    LIMIT 10
+                """,
+                "workload": """
+                    SELECT Technician, COUNT(*) 
+                    FROM JOBS
+                    WHERE Technician IS NOT NULL
+                    GROUP BY Technician
+                    ORDER BY COUNT(*) DESC
+                """,
+                "avg_duration": """
+                    SELECT AVG(TIMESTAMPDIFF(DAY, StartDate, EndDate)) 
+                    FROM JOBS
+                    WHERE StartDate IS NOT NULL AND EndDate IS NOT NULL
+                """,
+                "walkin_volume": """
+                    SELECT DATEDIFF(WalkinDate, '1970-01-01') - WEEKDAY(WalkinDate) AS WeekStart, COUNT(*) 
+                    FROM walkins
+                    WHERE WalkinDate IS NOT NULL
+                    GROUP BY WeekStart
+                    ORDER BY WeekStart
+                """,
+                "walkin_services": """
+                    SELECT Description, COUNT(*) 
+                    FROM walkins
+                    WHERE Description IS NOT NULL
+                    GROUP BY Description
+                    ORDER BY COUNT(*) DESC
+                    LIMIT 10
+                """,
+                "weekly_jobs": f"""
+                    SELECT YEARWEEK({start_day}) AS WeekNumber, WEEKDAY({start_day}) AS DayIdx, COUNT(*) AS JobCount
+                    FROM JOBS
+                    WHERE {start_day} IS NOT NULL AND WEEKDAY({start_day}) < 6  -- Exclude Sunday
+                    GROUP BY WeekNumber, DayIdx
+                    ORDER BY WeekNumber, DayIdx
+                """,
+                "weekday_averages": f"""
+                    SELECT WEEKDAY({start_day}) AS DayIdx, COUNT(*) / COUNT(DISTINCT YEARWEEK({start_day})) AS AvgJobCount
+                    FROM jobs
+                    WHERE WEEKDAY({start_day}) < 6
+                    GROUP BY DayIdx
+                    ORDER BY DayIdx
+                """,
+                "start_hours": """
+                    SELECT HOUR(StartDate) AS StartHour, COUNT(*) AS JobCount,
+                           SUM(TIMESTAMPDIFF(SECOND, DATE(StartDate), StartDate)) AS TotalSeconds
+                    FROM JOBS
+                    WHERE StartDate IS NOT NULL
+                    GROUP BY StartHour
+                    ORDER BY StartHour
+                """,
+                # ✅ The three summary counts come back as one row of one statement
+                "summary_counts": """
+                    SELECT (SELECT COUNT(*) FROM customers),
+                           (SELECT COUNT(*) FROM jobs),
+                           (SELECT COUNT(*) FROM Walkins)
+                """,
+            }
+            # ✅ Aggregates read within the last _DASHBOARD_CACHE_SECONDS are reused; only stale ones are queried
+            now = time.monotonic()
+            stale = {
+                name: sql for name, sql in queries.items()
+                if sql not in self._dash_cache or now - self._dash_cache[sql][0] >= _DASHBOARD_CACHE_SECONDS
+            }
+            if stale:
+                report_pool = getattr(self, "report_pool", None)
+                if report_pool is not None:
+                    fresh = run_aggregates_parallel(report_pool, stale, min(report_pool.pool_size, len(stale)))
+                else:
+                    fresh = run_aggregates_parallel(self.pool, stale, 1, multi_statements=False)
+                for name, rows in fresh.items():
+                    self._dash_cache[stale[name]] = (now, rows)
+            aggregates = {name: self._dash_cache[sql][1] for name, sql in queries.items()}
+
+            # ✅ Same data as the charts already drawn (e.g. reopened within the cache window): show those
+            # canvases again as they are instead of clearing and redrawing every figure
+            if aggregates == self._dash_drawn[0]:
+                for canvas in self._dash_canvases[:self._dash_drawn[1]]:
+                    show_canvas(canvas)
+            else:
+                self._dash_drawn = (None, 0)  # The pooled figures are about to be overwritten
+                draw_charts()
+                self._dash_drawn = (aggregates, charts_used)
+
+            # Fetch the number of customers, jobs and walk-ins
+            customer_count, job_count, walkin_count = first_row("summary_counts")
+
+            # Format the output nicely
+            info_text = f"""
+            <b>📌 Database Summary:</b><br>
+            ✔ <b>Number of Customers:</b> {customer_count}<br>
+            ✔ <b>Number of Jobs:</b> {job_count}<br>
+            ✔ <b>Number of Walkins:</b> {walkin_count}
+            """
 
+            # Create QLabel for displaying the counts
+            self.database_summary_label = QLabel(info_text)
+            self.database_summary_label.setAlignment(Qt.AlignCenter)
+            self.database_summary_label.setStyleSheet("""
+                QLabel {
+                    font-size: 16px;
+                    font-weight: bold;
+                    color: #2c3e50;
+                    background-color: #ecf0f1;
+                    padding: 10px;
+                    border-radius: 8px;
+                }
+            """)
 
-
-
-            
-
-
-                # Fetch the number of customers and jobs
-                self.cursor.execute("SELECT COUNT(*) FROM customers;")
-                customer_count = self.cursor.fetchone()[0]  # Fetch customer count
-
-                self.cursor.execute("SELECT COUNT(*) FROM jobs;")
-                job_count = self.cursor.fetchone()[0]  # Fetch job count
-
-                self.cursor.execute("SELECT COUNT(*) FROM Walkins;")
-                walkin_count = self.cursor.fetchone()[0]  # Fetch Walkin count
-
-                # Format the output nicely
-                info_text = f"""
-                <b>📌 Database Summary:</b><br>
-                ✔ <b>Number of Customers:</b> {customer_count}<br>
-                ✔ <b>Number of Jobs:</b> {job_count}<br>
-                ✔ <b>Number of Walkins:</b> {walkin_count}
-                """
-
-                # Create QLabel for displaying the counts
-                self.database_summary_label = QLabel(info_text)
-                self.database_summary_label.setAlignment(Qt.AlignCenter)
-                self.database_summary_label.setStyleSheet("""
-                    QLabel {
-                        font-size: 16px;
-                        font-weight: bold;
-                        color: #2c3e50;
-                        background-color: #ecf0f1;
-                        padding: 10px;
-                        border-radius: 8px;
-                    }
-                """)
-
-                # Add label to the layout (replace add_chart_to_layout)
-                scroll_layout.addWidget(self.database_summary_label, alignment=Qt.AlignCenter)
+            # Add label to the layout (replace add_chart_to_layout)
+            scroll_layout.addWidget(self.database_summary_label, alignment=Qt.AlignCenter)
 
 
 
@@ -2131,8 +2809,7 @@ class DatabaseApp(QMainWindow):
         back_button.setStyleSheet("background-color: #3A9EF5; color: white; padding: 10px; border-radius: 5px;")
 
         def close_graphs_and_return():
-            """Closes all open Matplotlib figures and returns to the main menu."""
-            plt.close('all')
+            """Returns to the main menu (the chart canvases are kept for the next open)."""
             reset_window_size(self)
 
         back_button.clicked.connect(close_graphs_and_return)
@@ -2141,6 +2818,11 @@ class DatabaseApp(QMainWindow):
         layout.addLayout(button_layout)
         self.dashboard_dialog.setLayout(layout)
         self.dashboard_dialog.exec_()
+
+        # ✅ Detach the pooled canvases so they outlive this dialog, then release the dialog itself
+        for canvas in self._dash_canvases:
+            canvas.setParent(None)
+        self.dashboard_dialog.deleteLater()
    
 if __name__ == "__main__": #MAIN
     try:
@@ -2158,10 +2840,6 @@ if __name__ == "__main__": #MAIN
         splashscreen.show()
         app.processEvents()  # ✅ Ensure UI updates before proceeding
 
-        # ✅ Start Loading Thread
-        loading_thread = InitializationThread()
-        loading_thread.progress.connect(splashscreen.update_progress)
-
         def start_main_app():
             """ Called when initialization is complete """
             splashscreen.close()  # ✅ Close splash screen first
@@ -2171,8 +2849,13 @@ if __name__ == "__main__": #MAIN
             window = DatabaseApp()
             window.show()
 
-        loading_thread.finished.connect(start_main_app)
-        loading_thread.start()  # Start loading process
+        # ✅ Run the independent start-up tasks side by side on the thread pool; the parsed
+        # files stay cached, so DatabaseApp() reuses them instead of reading them again
+        run_startup_tasks(
+            [load_settings, lambda: load_schedule_from_json(SCHEDULE_FILE_PATH)],
+            splashscreen.update_progress,
+            start_main_app
+        )
 
         sys.exit(app.exec_())
 
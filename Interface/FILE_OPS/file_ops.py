@@ -2,11 +2,7 @@
 # 📦 Standard Library
 import json
 import os
-import time
-
-# ─────────────────────────────────────────────────────────────────────────────
-# 📊 Data Handling
-import pandas as pd
+import threading
 
 # ─────────────────────────────────────────────────────────────────────────────
 # 🔁 Scheduling
@@ -17,13 +13,24 @@ import schedule
 from PyQt5.QtWidgets import QMessageBox, QFileDialog
 
 
-from db_utils import backup_database
+from db_utils import backup_file_path, write_database_backup
+from data_access import pooled_cursor, write_excel_sheets
+from UI.dbworker import run_in_background
 
 
 
 SETTINGS_FILE = "settings.json"
 SCHEDULE_FILE_PATH = "backup_schedule.json"
 
+# ✅ Rows pulled from the server per fetchmany() while exporting a table
+EXPORT_BATCH_SIZE = 5000
+
+# ✅ Parsed JSON files by path, reused until the file's mtime/size changes (see _read_json)
+_json_cache = {}
+
+# ✅ Set whenever the schedule changes (or the app closes) so the scheduler re-plans its next wake-up
+_schedule_changed = threading.Event()
+
 
 def save_database_config(database_config, settings_file):
     """
@@ -36,12 +43,27 @@ def save_database_config(database_config, settings_file):
     except Exception as e:
         return f"❌ Failed to save settings: {e}"
 
+def _read_json(path):
+    """
+    Parses the JSON file at `path`, re-reading it only when its modification time or size changed.
+    The returned object is shared between callers, so treat it as read-only.
+    """
+    stat = os.stat(path)
+    key = (stat.st_mtime_ns, stat.st_size)
+    cached = _json_cache.get(path)
+    if cached is None or cached[0] != key:
+        with open(path, "r") as file:
+            cached = (key, json.load(file))
+        _json_cache[path] = cached
+    return cached[1]
+
 def load_settings():
     """Loads the database settings from a JSON file, including SSL settings."""
     default_config = {
         "host": "localhost",
         "database": "",
         "password": "",
+        "pool_size": 10,
         "ssl": {
             "enabled": False,
             "cert_path": ""
@@ -50,31 +72,32 @@ def load_settings():
 
     if os.path.exists(SETTINGS_FILE):
         try:
-            with open(SETTINGS_FILE, "r") as file:
-                loaded_config = json.load(file)
+            loaded_config = _read_json(SETTINGS_FILE)
 
-                # Update top-level fields
-                default_config["host"] = loaded_config.get("host", "localhost")
-                default_config["database"] = loaded_config.get("database", "")
-                default_config["password"] = loaded_config.get("password", "")
+            # Update top-level fields
+            default_config["host"] = loaded_config.get("host", "localhost")
+            default_config["database"] = loaded_config.get("database", "")
+            default_config["password"] = loaded_config.get("password", "")
+            default_config["pool_size"] = loaded_config.get("pool_size", 10)
 
-                # Update nested SSL config
-                ssl_config = loaded_config.get("ssl", {})
-                default_config["ssl"]["enabled"] = ssl_config.get("enabled", False)
-                default_config["ssl"]["cert_path"] = ssl_config.get("cert_path", "")
+            # Update nested SSL config
+            ssl_config = loaded_config.get("ssl", {})
+            default_config["ssl"]["enabled"] = ssl_config.get("enabled", False)
+            default_config["ssl"]["cert_path"] = ssl_config.get("cert_path", "")
 
         except Exception as e:
             print(f"⚠️ Failed to load settings: {e}")
 
     return default_config
 
-def export_database_to_excel(parent, cursor):
+def export_database_to_excel(parent, button=None):
     """
     Exports all tables from the connected database to an Excel file.
+    The export runs on a worker thread; `button` (optional) shows a busy state meanwhile.
 
     Args:
-        parent: QWidget or QMainWindow to use for QFileDialog and QMessageBox.
-        cursor: A database cursor object connected to the target database.
+        parent: The main app, used for QFileDialog and QMessageBox; must have `pool` (the connection pool).
+        button: The QPushButton that started the export.
     """
     file_path, _ = QFileDialog.getSaveFileName(
         parent,
@@ -86,27 +109,66 @@ def export_database_to_excel(parent, cursor):
     if not file_path:
         return
 
-    try:
-        if not file_path.endswith(".xlsx"):
-            file_path += ".xlsx"
-
-        # Get all table names
-        cursor.execute("SHOW TABLES;")
-        tables = [table[0] for table in cursor.fetchall()]
-
-        # Export each table to its own Excel sheet
-        with pd.ExcelWriter(file_path, engine="openpyxl") as writer:
-            for table in tables:
-                cursor.execute(f"SELECT * FROM {table};")
-                data = cursor.fetchall()
-                columns = [desc[0] for desc in cursor.description]
-                df = pd.DataFrame(data, columns=columns)
-                df.to_excel(writer, sheet_name=table, index=False)
-
-        QMessageBox.information(parent, "✅ Success", f"Database exported successfully to:\n{file_path}")
-    
-    except Exception as e:
-        QMessageBox.critical(parent, "❌ Error", f"Failed to export database:\n{e}")
+    if not file_path.endswith(".xlsx"):
+        file_path += ".xlsx"
+
+    def export_job(cursor, conn):
+        # ✅ One read-only snapshot for the whole export: every sheet reflects the same moment
+        cursor.execute("SET TRANSACTION ISOLATION LEVEL REPEATABLE READ")
+        cursor.execute("START TRANSACTION WITH CONSISTENT SNAPSHOT, READ ONLY")
+        try:
+            _write_database_sheets(cursor, file_path)
+        finally:
+            conn.rollback()  # Ends the read-only transaction before the pool reuses it
+
+    def export_finished(message, succeeded):
+        if button is not None:
+            try:
+                button.setEnabled(True)
+                button.setText(idle_text)
+            except RuntimeError:
+                pass  # The window was closed meanwhile
+        if succeeded:
+            QMessageBox.information(parent, "✅ Success", f"Database exported successfully to:\n{file_path}")
+        else:
+            QMessageBox.critical(parent, "❌ Error", f"Failed to export database:\n{message}")
+
+    if button is not None:
+        idle_text = button.text()
+        button.setEnabled(False)
+        button.setText("⏳ Exporting...")
+
+    # ✅ Stream on an unbuffered pooled cursor, so rows go from the server to the sheet
+    # in EXPORT_BATCH_SIZE batches instead of a whole table at a time; the worker thread
+    # keeps the window responsive meanwhile
+    run_in_background(
+        parent.pool, export_job,
+        lambda _: export_finished(None, True),
+        lambda message: export_finished(message, False),
+        buffered=False
+    )
+
+def _write_database_sheets(cursor, file_path):
+    """Writes every table of the database to its own sheet of `file_path`."""
+    # Get all table names
+    cursor.execute("SHOW TABLES;")
+    tables = [table[0] for table in cursor.fetchall()]
+
+    def stream_rows():
+        while True:
+            rows = cursor.fetchmany(EXPORT_BATCH_SIZE)
+            if not rows:
+                return
+            yield from rows
+
+    def table_sheets():
+        for table in tables:
+            cursor.execute(f"SELECT * FROM `{table}`;")
+            columns = [desc[0] for desc in cursor.description]
+            yield table, columns, stream_rows()  # Fully written before the next table is queried
+
+    # Export each table to its own Excel sheet
+    write_excel_sheets(file_path, table_sheets())
 
 def load_schedule_on_startup(parent):
     """
@@ -231,8 +293,7 @@ def load_schedule_from_json(schedule_path, parent=None):
     """
     if os.path.exists(schedule_path):
         try:
-            with open(schedule_path, "r") as f:
-                return json.load(f)
+            return _read_json(schedule_path)
         except Exception as e:
             if parent:
                 QMessageBox.critical(parent, "Error", f"Failed to load backup schedule:\n{e}")
@@ -261,6 +322,7 @@ def schedule_backup(interval="daily", time_of_day="00:00", backup_directory=None
             return
 
     print(f"✅ Backup scheduled: {interval} at {time_of_day} to → {backup_directory}")
+    wake_scheduler()
 
 def clear_current_schedule(parent):
     """
@@ -299,23 +361,34 @@ def view_current_schedule(parent):
     else:
         QMessageBox.information(parent, "No Schedule", "⚠️ No backup schedule is set.")
 
+def wake_scheduler():
+    """Wakes run_scheduled_backups() early, e.g. after a job was added or to let it stop."""
+    _schedule_changed.set()
+
 def run_scheduled_backups(stop_event):
     """
     Continuously runs scheduled tasks until the stop_event is set.
+    Sleeps until the next job is due instead of polling every second;
+    wake_scheduler() interrupts the sleep when the schedule changes.
 
     Args:
         stop_event (threading.Event): An event that can be triggered to stop the loop.
     """
     while not stop_event.is_set():
         schedule.run_pending()
-        time.sleep(1)
+
+        idle_seconds = schedule.idle_seconds()  # None when nothing is scheduled
+        timeout = None if idle_seconds is None else max(idle_seconds, 0)
+
+        _schedule_changed.wait(timeout)
+        _schedule_changed.clear()
 
 def trigger_backup(app_instance, backup_directory):
     """
     Triggers the backup process at the scheduled time.
 
     Args:
-        app_instance: The main application instance (must have a `cursor` and an `is_backup_running` attribute).
+        app_instance: The main application instance (must have a `pool` or `cursor` and an `is_backup_running` attribute).
         backup_directory (str): The directory to save the backup to.
     """
     if not backup_directory:
@@ -329,9 +402,16 @@ def trigger_backup(app_instance, backup_directory):
     app_instance.is_backup_running = True
 
     try:
-        # Call the actual backup function using app_instance's cursor
-        backup_database(app_instance.cursor, backup_directory)
-        print(f"✅ Backup successfully triggered for directory: {backup_directory}")
+        # ✅ Runs on the scheduler thread, so it borrows its own pooled cursor rather than sharing the GUI's
+        pool = getattr(app_instance, "pool", None)
+        if pool is None:
+            print("⚠️ Not logged in, skipping scheduled backup.")
+            return
+        # ✅ Writes the file only: message boxes can't be shown from the scheduler thread
+        backup_file = backup_file_path(backup_directory)
+        with pooled_cursor(pool) as cursor:
+            write_database_backup(cursor, backup_file)
+        print(f"✅ Scheduled backup saved to {backup_file}")
     except Exception as e:
         print(f"❌ Backup trigger failed: {e}")
     finally:
@@ -0,0 +1,117 @@
+import types
+from PyQt5.QtCore import QObject, QRunnable, QThreadPool, pyqtSignal
+
+# DBWorker Class
+# --------------
+# This class runs one piece of database work on a QThreadPool thread
+# so that slow queries don't freeze the Qt event loop.
+#
+# The work is a plain function taking (cursor, conn). The worker
+# borrows a connection from the MariaDB connection pool, calls the
+# function with it, and hands the connection back to the pool.
+#
+# The function's return value is emitted through the 'finished'
+# signal, or the error message through 'error'. A job may instead be
+# a generator: each value it yields is emitted through 'batch' as it
+# is produced (e.g. fetchmany() chunks from an unbuffered cursor),
+# followed by 'finished' with None. All signals are delivered on the
+# GUI thread, so the connected slots can safely update widgets.
+#
+# run_in_background() is the usual entry point: it wires the slots
+# and keeps the worker alive until one of its signals has fired.
+# run_task_in_background() does the same for work that needs no
+# database connection (e.g. writing an export file).
+
+class DBWorkerSignals(QObject): #UI
+    """ Signals emitted by a DBWorker (QRunnable can't define its own). """
+    finished = pyqtSignal(object)
+    error = pyqtSignal(str)
+    batch = pyqtSignal(object)
+
+
+class DBWorker(QRunnable): #UI
+    """ Runs `job(cursor, conn)` on a pooled connection off the GUI thread. """
+
+    def __init__(self, pool, job, buffered=True):
+        super().__init__()
+        self.pool = pool
+        self.job = job
+        self.buffered = buffered
+        self.signals = DBWorkerSignals()
+
+    def run(self):
+        """ Borrows a connection, runs the job and emits the outcome """
+        try:
+            conn = self.pool.get_connection()
+            try:
+                cursor = conn.cursor(buffered=self.buffered)
+                result = self.job(cursor, conn)
+                if isinstance(result, types.GeneratorType):
+                    for chunk in result:
+                        self.signals.batch.emit(chunk)
+                    result = None
+                cursor.close()
+            finally:
+                conn.close()  # Returns the connection to the pool
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
+
+
+class TaskWorker(QRunnable): #UI
+    """ Runs `task()` off the GUI thread; no database connection is borrowed. """
+
+    def __init__(self, task):
+        super().__init__()
+        self.task = task
+        self.signals = DBWorkerSignals()
+
+    def run(self):
+        """ Runs the task and emits the outcome """
+        try:
+            result = self.task()
+        except Exception as e:
+            self.signals.error.emit(str(e))
+            return
+
+        self.signals.finished.emit(result)
+
+
+# Workers still waiting to report back; dropping the last Python
+# reference would delete their signals object before delivery.
+_active_workers = set()
+
+
+def run_in_background(pool, job, on_done, on_error=None, on_batch=None, buffered=True):
+    """
+    Submits `job(cursor, conn)` to the global QThreadPool.
+    `on_done(result)` / `on_error(message)` / `on_batch(chunk)` are called on the GUI thread.
+    Pass buffered=False to stream a large result through an unbuffered cursor.
+    """
+    return _start(DBWorker(pool, job, buffered), on_done, on_error, on_batch)
+
+
+def run_task_in_background(task, on_done, on_error=None):
+    """
+    Submits `task()` to the global QThreadPool.
+    `on_done(result)` / `on_error(message)` are called on the GUI thread.
+    """
+    return _start(TaskWorker(task), on_done, on_error)
+
+
+def _start(worker, on_done, on_error=None, on_batch=None):
+    """ Wires the callbacks, keeps the worker alive until it reports back and starts it """
+    _active_workers.add(worker)
+
+    worker.signals.finished.connect(lambda result: _active_workers.discard(worker))
+    worker.signals.error.connect(lambda message: _active_workers.discard(worker))
+    worker.signals.finished.connect(on_done)
+    if on_error:
+        worker.signals.error.connect(on_error)
+    if on_batch:
+        worker.signals.batch.connect(on_batch)
+
+    QThreadPool.globalInstance().start(worker)
+    return worker
@@ -1,29 +1,42 @@
-import time
-from PyQt5.QtCore import QThread, pyqtSignal
+from UI.dbworker import run_task_in_background
 
-# InitializationThread Class
-# ---------------------------
-# This class simulates the initialization process of an application
-# using a background thread. It extends QThread to run the loading
-# process in a separate thread, so the main UI remains responsive.
+# run_startup_tasks
+# -----------------
+# Runs the application's start-up work while the splash screen is
+# shown. Each task is an independent callable (e.g. reading the
+# settings or the backup schedule file) and all of them are started
+# at once on Qt's global QThreadPool, so start-up takes as long as the
+# slowest task instead of the sum of all of them, and the GUI thread
+# only has to keep the splash screen painted.
 #
-# The run() method simulates a task by emitting progress values from
-# 0 to 100, with a small delay (0.05 seconds) between each value 
-# to mimic work being done (such as loading or initializing resources).
+# Progress is reported as the share of finished tasks (0-100) through
+# `on_progress`, which can be connected to a UI element such as the
+# splash screen's progress bar. `on_finished` is called once every
+# task is done. A task that fails is printed and counted as done, so
+# one unreadable file cannot keep the application from opening.
 #
-# The progress values are emitted through the 'progress' signal 
-# (pyqtSignal), which can be connected to a UI element such as a 
-# progress bar to show the user the current loading status.
-#
-# The InitializationThread class is useful for showing loading 
-# progress without freezing the main user interface.
+# Both callbacks are delivered on the GUI thread through the worker
+# signals (see UI/dbworker.py), so they may touch widgets directly.
+
+def run_startup_tasks(tasks, on_progress, on_finished): #UI
+    """ Runs `tasks` side by side on the thread pool, reporting progress and completion. """
+    tasks = list(tasks)
+    if not tasks:
+        on_progress(100)
+        on_finished()
+        return
+
+    remaining = [len(tasks)]
+
+    def task_done(_=None):
+        remaining[0] -= 1
+        on_progress(int(100 * (len(tasks) - remaining[0]) / len(tasks)))
+        if remaining[0] == 0:
+            on_finished()
 
-class InitializationThread(QThread): #UI
-    """ Simulates application initialization with a progress signal. """
-    progress = pyqtSignal(int)
+    def task_failed(message):
+        print(f"⚠️ Start-up task failed: {message}")
+        task_done()
 
-    def run(self):
-        """ Simulates the application startup process """
-        for i in range(101):  # Simulating a loading process
-            time.sleep(0.05)  # Simulate work being done
-            self.progress.emit(i)  # Emit progress value
+    for task in tasks:
+        run_task_in_background(task, task_done, task_failed)
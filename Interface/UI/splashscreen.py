@@ -18,7 +18,7 @@ from PyQt5.QtCore import Qt
 # The update_progress() method is used to update the value of 
 # the progress bar. It takes an integer value (0-100) to represent 
 # the progress of the initialization process. This can be connected 
-# to a background thread (e.g., InitializationThread) to reflect 
+# to the start-up tasks (e.g., run_startup_tasks) to reflect 
 # real-time progress during application startup.
 
 
@@ -0,0 +1,189 @@
+from decimal import Decimal
+
+from PyQt5.QtCore import QAbstractTableModel, QEvent, QModelIndex, Qt, pyqtSignal
+from PyQt5.QtGui import QColor, QPainter
+from PyQt5.QtWidgets import QStyledItemDelegate, QTableView
+
+# RowsTableModel / ButtonDelegate
+# -------------------------------
+# Light-weight replacements for filling a QTableWidget cell by cell.
+#
+# RowsTableModel keeps the rows fetched from the database as a plain
+# list of tuples and formats a cell only when the view asks to paint
+# it, so reloading a table is one model reset instead of building a
+# QTableWidgetItem per cell. Columns given as a plain index hand the
+# raw value to Qt, which formats numbers itself instead of Python
+# building a string per cell. Streamed results grow the model batch by
+# batch (append_rows). Given a batch fetcher (set_source), it
+# loads rows lazily: the view calls fetchMore() as it scrolls towards
+# the end, so only what has been looked at is ever fetched.
+#
+# ButtonDelegate paints a button-looking cell (e.g. "🗑") in a column
+# and reports clicks (on_click(row) and the `clicked` signal), replacing
+# one QPushButton widget per row set through setCellWidget(). One
+# delegate can serve several action columns via setItemDelegateForColumn.
+
+class RowsTableModel(QAbstractTableModel): #UI
+    """ Read-only model over a list of row tuples. """
+
+    def __init__(self, columns, action_headers=(), parent=None):
+        """
+        `columns` is a list of (header, formatter) pairs; formatter(row) returns the cell text,
+        or formatter is a row index whose raw value is displayed as-is (Decimal as float).
+        `action_headers` adds trailing columns whose cells are painted by a ButtonDelegate.
+        """
+        super().__init__(parent)
+        self._columns = list(columns)
+        self._headers = [header for header, _ in self._columns] + list(action_headers)
+        self._rows = []
+        self._fetch_batch = None
+        self._total = 0
+        self._batch_size = 0
+
+    def set_rows(self, rows):
+        """ Replaces every row in one reset """
+        self.beginResetModel()
+        self._rows = list(rows)
+        self._fetch_batch = None
+        self.endResetModel()
+
+    def append_rows(self, rows):
+        """ Adds `rows` after the current ones (e.g. the next batch of a streamed result) """
+        if not rows:
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def set_source(self, fetch_batch, total, batch_size=200, first_rows=None):
+        """
+        Lazy mode: `fetch_batch(last_row, limit)` returns the rows after `last_row`
+        (None for the first batch); `total` is the row count to expect.
+        Pass `first_rows` when the first batch was already fetched (e.g. on a worker thread).
+        """
+        self.beginResetModel()
+        self._fetch_batch = fetch_batch
+        self._total = total
+        self._batch_size = batch_size
+        if first_rows is not None:
+            self._rows = list(first_rows)
+        else:
+            self._rows = list(fetch_batch(None, batch_size)) if total else []
+        if not self._rows:
+            self._total = 0
+        self.endResetModel()
+
+    def canFetchMore(self, parent=QModelIndex()):
+        return not parent.isValid() and self._fetch_batch is not None and len(self._rows) < self._total
+
+    def fetchMore(self, parent=QModelIndex()):
+        if not self.canFetchMore(parent):
+            return
+        rows = list(self._fetch_batch(self._rows[-1] if self._rows else None, self._batch_size))
+        if not rows:
+            self._total = len(self._rows)  # Rows were deleted meanwhile
+            return
+        first = len(self._rows)
+        self.beginInsertRows(QModelIndex(), first, first + len(rows) - 1)
+        self._rows.extend(rows)
+        self.endInsertRows()
+
+    def rows_added(self, count):
+        """
+        Lazy mode: expects `count` new rows after the last key (e.g. just inserted) and, if the view
+        already reached the end, loads them now. Returns False when not in lazy mode (reload instead).
+        """
+        if self._fetch_batch is None:
+            return False
+        at_end = len(self._rows) >= self._total
+        self._total = max(self._total, len(self._rows)) + count
+        if at_end:
+            self.fetchMore()
+        return True
+
+    def remove_row(self, row):
+        """ Drops view row `row` (e.g. just deleted) without touching the others """
+        self.beginRemoveRows(QModelIndex(), row, row)
+        del self._rows[row]
+        self._total = max(self._total - 1, 0)
+        self.endRemoveRows()
+
+    def row_data(self, row):
+        """ The original tuple behind view row `row` """
+        return self._rows[row]
+
+    def rowCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._rows)
+
+    def columnCount(self, parent=QModelIndex()):
+        return 0 if parent.isValid() else len(self._headers)
+
+    def data(self, index, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole or not index.isValid() or index.column() >= len(self._columns):
+            return None
+        _, formatter = self._columns[index.column()]
+        if isinstance(formatter, int):
+            value = self._rows[index.row()][formatter]
+            return float(value) if isinstance(value, Decimal) else value
+        return formatter(self._rows[index.row()])
+
+    def headerData(self, section, orientation, role=Qt.DisplayRole):
+        if role != Qt.DisplayRole:
+            return None
+        if orientation == Qt.Horizontal:
+            return self._headers[section]
+        return str(section + 1)
+
+
+def rows_table_view(columns, rows): #UI
+    """
+    Read-only QTableView over `rows` (tuples) with `columns` as headers; each cell is
+    str(value), formatted only when painted.
+    """
+    view = QTableView()
+    model = RowsTableModel([(column, lambda row, i=i: str(row[i])) for i, column in enumerate(columns)], parent=view)
+    model.set_rows(rows)
+    view.setModel(model)
+    return view
+
+
+class ButtonDelegate(QStyledItemDelegate): #UI
+    """ Paints a coloured button in every cell of a column and reports clicks by row. """
+
+    clicked = pyqtSignal(QModelIndex)
+
+    def __init__(self, text, color, on_click=None, parent=None):
+        """
+        `text`/`color` are either a single value or a {column: value} dict when the
+        delegate is installed on several columns. `on_click(row)` is optional; the
+        `clicked` signal carries the full index for dispatching on the column.
+        """
+        super().__init__(parent)
+        self.text = text
+        self.color = {column: QColor(c) for column, c in color.items()} if isinstance(color, dict) else QColor(color)
+        self.on_click = on_click
+
+    def paint(self, painter, option, index):
+        text = self.text[index.column()] if isinstance(self.text, dict) else self.text
+        color = self.color[index.column()] if isinstance(self.color, dict) else self.color
+
+        painter.save()
+        painter.setRenderHint(QPainter.Antialiasing)
+        rect = option.rect.adjusted(4, 3, -4, -3)
+        painter.setPen(Qt.NoPen)
+        painter.setBrush(color)
+        painter.drawRoundedRect(rect, 5, 5)
+        painter.setPen(Qt.white)
+        painter.drawText(rect, Qt.AlignCenter, text)
+        painter.restore()
+
+    def editorEvent(self, event, model, option, index):
+        if (event.type() == QEvent.MouseButtonRelease
+                and event.button() == Qt.LeftButton
+                and option.rect.contains(event.pos())):
+            if self.on_click:
+                self.on_click(index.row())
+            self.clicked.emit(index)
+            return True
+        return False
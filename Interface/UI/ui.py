@@ -1,6 +1,7 @@
 # ─────────────────────────────────────────────────────────────────────────────
 # 📦 Standard Library
 import os
+from contextlib import contextmanager
 from functools import partial
 
 # ─────────────────────────────────────────────────────────────────────────────
@@ -23,14 +24,16 @@ from PyQt5.QtWidgets import (
 # ─────────────────────────────────────────────────────────────────────────────
 # 🧩 Project Modules
 from data_access import (
-    close_connection, fetch_table_data, fetch_primary_key_column,
+    close_pool, fetch_table_data, fetch_primary_key_column,
+    fetch_table_data_after, fetch_table_data_at_offset,
     execute_sql_query, export_query_results_to_excel
 )
 from FILE_OPS.file_ops import (
     view_current_schedule, clear_current_schedule,
     save_backup_schedule, export_database_to_excel, save_database_config
 )
-from db_utils import restore_database, change_db_password, backup_database
+from db_utils import restore_database, change_db_password, backup_file_path, write_database_backup
+from UI.dbworker import run_in_background
 from datetime import datetime
 
 
@@ -671,6 +674,23 @@ def event_filter(parent, source, event):
     # Fallback to the default eventFilter behavior of the parent
     return super(type(parent), parent).eventFilter(source, event)
 
+@contextmanager
+def bulk_table_update(table_widget):
+    """
+    Suspends repaints, signals and sorting while many cells are written,
+    so Qt lays the table out once at the end instead of once per row.
+    """
+    was_sorting = table_widget.isSortingEnabled()
+    was_blocked = table_widget.blockSignals(True)
+    table_widget.setUpdatesEnabled(False)
+    table_widget.setSortingEnabled(False)
+    try:
+        yield table_widget
+    finally:
+        table_widget.setSortingEnabled(was_sorting)
+        table_widget.setUpdatesEnabled(True)
+        table_widget.blockSignals(was_blocked)
+
 def populate_table(table_widget, table_name, data, status_update_callback):
     """Populates the table with fresh data without triggering unnecessary updates."""
 
@@ -679,9 +699,21 @@ def populate_table(table_widget, table_name, data, status_update_callback):
         return
 
     table_widget.blockSignals(True)  # ✅ Prevent unwanted `itemChanged` triggers
-
     table_widget.clearContents()  # 🔥 Ensure old data is cleared
-    table_widget.setRowCount(len(data))  # ✅ Ensure all rows are displayed
+    table_widget.setRowCount(0)
+    table_widget.blockSignals(False)
+
+    append_table_rows(table_widget, table_name, data, status_update_callback)
+
+    table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
+    table_widget.verticalHeader().setVisible(False)
+
+def append_table_rows(table_widget, table_name, data, status_update_callback):
+    """Appends rows below the ones already shown (used to stream results in batches)."""
+
+    if not table_widget:
+        QMessageBox.critical(None, "Error", "Table widget not initialized.")
+        return
 
     # Detect status column index
     status_column_index = None
@@ -691,7 +723,14 @@ def populate_table(table_widget, table_name, data, status_update_callback):
                 status_column_index = col_idx
                 break
 
-    for row_idx, row_data in enumerate(data):
+    with bulk_table_update(table_widget):  # ✅ No `itemChanged` triggers or repaints while filling
+        first_row = table_widget.rowCount()
+        table_widget.setRowCount(first_row + len(data))  # ✅ Preallocate every new row at once
+        _fill_rows(table_widget, data, first_row, status_column_index, status_update_callback)
+
+def _fill_rows(table_widget, data, first_row, status_column_index, status_update_callback):
+    """Writes `data` into preallocated rows starting at `first_row`."""
+    for row_idx, row_data in enumerate(data, start=first_row):
         for col_idx, value in enumerate(row_data):
             if col_idx == status_column_index:  # ✅ Apply dropdown if it's the status column
                 status_combo = QComboBox()
@@ -709,7 +748,7 @@ def populate_table(table_widget, table_name, data, status_update_callback):
                 table_widget.setCellWidget(row_idx, col_idx, status_combo)
 
                 status_combo.currentTextChanged.connect(
-                lambda text, row=row_idx: status_update_callback(row, text)
+                lambda text, combo=status_combo: status_update_callback(table_widget.indexAt(combo.pos()).row(), text)
             )
 
             else:
@@ -717,11 +756,6 @@ def populate_table(table_widget, table_name, data, status_update_callback):
                 item.setData(Qt.UserRole, item.text())  # ✅ Store original value for change detection
                 table_widget.setItem(row_idx, col_idx, item)
 
-    table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
-    table_widget.verticalHeader().setVisible(False)
-
-    table_widget.blockSignals(False)  # ✅ Allow actual edits to be detected
-
 def main_menu_page(parent, username ="User"):
     """Creates and displays the upgraded main menu UI with user profile header and unified dark theme."""
 
@@ -848,7 +882,7 @@ def main_menu_page(parent, username ="User"):
     button_data = [
         ("📁  Tables", parent.view_tables),
         ("📝  Add Job Notes", lambda: ask_for_job_id(parent)),
-        ("🔍  Query", lambda: run_query(parent.cursor, parent.conn, parent)),
+        ("🔍  Query", lambda: run_query(parent.pool, parent)),
         ("📑  Customer Lookup", parent.Customer_report),
         ("📊  Dashboard", parent.dashboard_page),
         ("⚙️  Settings", lambda: options_page(parent))
@@ -879,15 +913,73 @@ def main_menu_page(parent, username ="User"):
     parent.central_widget.addWidget(parent.main_menu)
     parent.central_widget.setCurrentWidget(parent.main_menu)
  
+def _keeping_database(job): #UI
+    """
+    Wraps `job(cursor, conn)` so the connection is switched back to its database afterwards,
+    before the pool reuses it (user queries and restores may run USE).
+    """
+    def run(cursor, conn):
+        cursor.execute("SELECT DATABASE()")
+        database = cursor.fetchone()[0]
+        try:
+            return job(cursor, conn)
+        finally:
+            if database:
+                cursor.execute(f"USE `{database}`")
+    return run
+
+def _on_pooled_connection(parent, action): #UI
+    """
+    Calls `action(conn, cursor)` on a connection borrowed from `parent.pool` for as long as it runs
+    (e.g. a modal dialog).
+    """
+    with parent._conn() as conn:
+        cursor = conn.cursor()
+        try:
+            _keeping_database(lambda cursor, conn: action(conn, cursor))(cursor, conn)
+        finally:
+            cursor.close()
+
+def _backup_in_background(parent, button): #UI
+    """ Asks for a directory and writes the backup there on a worker thread; `button` shows a busy state meanwhile """
+    backup_directory = QFileDialog.getExistingDirectory(parent, "Select Backup Directory")
+    if not backup_directory:
+        return
+    backup_file = backup_file_path(backup_directory)
+    idle_text = button.text()
+
+    def backup_finished(message, succeeded):
+        try:
+            button.setEnabled(True)
+            button.setText(idle_text)
+        except RuntimeError:
+            pass  # The window was closed meanwhile
+        if succeeded:
+            QMessageBox.information(parent, "Success", f"Database backup saved to {backup_file}.")
+        else:
+            QMessageBox.critical(parent, "Error", f"Failed to back up database: {message}")
+
+    button.setEnabled(False)
+    button.setText("⏳ Backing up...")
+    run_in_background(
+        parent.pool, lambda cursor, conn: write_database_backup(cursor, backup_file),
+        lambda _: backup_finished(None, True),
+        lambda message: backup_finished(message, False)
+    )
+
 def options_page(parent):
-    """Creates a visually enhanced settings/options page in PyQt."""
+    """Creates a visually enhanced settings/options page in PyQt; built once, then shown again."""
 
-    parent.settings_page = QWidget()
-    layout = QVBoxLayout(parent.settings_page)
+    if hasattr(parent, "options_widget"):
+        parent.central_widget.setCurrentWidget(parent.options_widget)
+        return
+
+    parent.options_widget = QWidget()
+    layout = QVBoxLayout(parent.options_widget)
     layout.setContentsMargins(60, 50, 60, 50)
     layout.setSpacing(30)
 
-    parent.settings_page.setStyleSheet("""
+    parent.options_widget.setStyleSheet("""
         QWidget {
             background-color: #2E2E2E;
             color: white;
@@ -953,11 +1045,11 @@ def options_page(parent):
     group_layout.setSpacing(20)
 
     export_button = QPushButton("📥 Export Entire Database to Excel")
-    export_button.clicked.connect(lambda: export_database_to_excel(parent, parent.cursor))
+    export_button.clicked.connect(lambda: export_database_to_excel(parent, export_button))
     group_layout.addWidget(export_button)
 
     backup_button = QPushButton("💾 Backup Database")
-    backup_button.clicked.connect(lambda: backup_database(parent.cursor))
+    backup_button.clicked.connect(lambda: _backup_in_background(parent, backup_button))
     group_layout.addWidget(backup_button)
 
     scheduling_options_button = QPushButton("⏰ Backup Schedule Options")
@@ -965,12 +1057,14 @@ def options_page(parent):
     group_layout.addWidget(scheduling_options_button)
 
     restore_button = QPushButton("🔄 Create from Backup")
-    restore_button.clicked.connect(lambda: restore_database(parent.conn, parent.cursor, parent))
+    restore_button.clicked.connect(
+        lambda: _on_pooled_connection(parent, lambda conn, cursor: restore_database(conn, cursor, parent))
+    )
     group_layout.addWidget(restore_button)
 
     change_password_button = QPushButton("🔑 Change Password")
     change_password_button.clicked.connect(
-        lambda: change_db_password(parent.database_config, parent.conn)
+        lambda: _on_pooled_connection(parent, lambda conn, cursor: change_db_password(parent.database_config, conn))
     )
     group_layout.addWidget(change_password_button)
 
@@ -985,9 +1079,9 @@ def options_page(parent):
     layout.addWidget(back_button, alignment=Qt.AlignCenter)
 
     # Final layout setup
-    parent.settings_page.setLayout(layout)
-    parent.central_widget.addWidget(parent.settings_page)
-    parent.central_widget.setCurrentWidget(parent.settings_page)
+    parent.options_widget.setLayout(layout)
+    parent.central_widget.addWidget(parent.options_widget)
+    parent.central_widget.setCurrentWidget(parent.options_widget)
 
 def apply_button_hover_animation(parent, button):
         """Applies a hover animation effect to a QPushButton."""
@@ -1083,22 +1177,6 @@ def keyPressEvent(parent, event):
     if event.key() == Qt.Key_Return:  # Check if the "Enter" key is pressed
         parent.login()  # Call the login method
 
-def refresh_page(parent, offset=None):
-    parent.table_widget.blockSignals(True)
-    parent.table_widget.setRowCount(0)
-    
-    load_table(
-        table_widget=parent.table_widget,
-        cursor=parent.cursor,
-        table_name=parent.current_table_name,
-        update_status_callback=parent.update_status_and_database,
-        table_offset=offset if offset is not None else parent.table_offset,
-        limit=parent.table_limit,
-        event_filter=parent
-    )
-
-    parent.table_widget.blockSignals(False)
-
 def exit_app(parent):
     """
     Closes the main application window.
@@ -1256,9 +1334,11 @@ def display_tables_ui(tables, on_table_select_callback):
 
     dialog.exec_()
 
-def handle_login(ui_instance, database_config, connect_func, on_success_callback):
+def handle_login(ui_instance, database_config, pool_func, on_success_callback):
     """
     Handles login interaction, connection attempt, and page transition.
+    The connection pools made by `pool_func` (`ui_instance.pool` / `ui_instance.report_pool`) are the
+    app's only connections; creating them is also what checks the credentials.
     """
 
     username = ui_instance.username_entry.text().strip()
@@ -1280,13 +1360,18 @@ def handle_login(ui_instance, database_config, connect_func, on_success_callback
         return
 
     try:
-        conn, cursor = connect_func(
-            username, password, host, database, ssl_enabled, ssl_cert_path
+        ui_instance.pool = pool_func(
+            username, password, host, database, ssl_enabled, ssl_cert_path,
+            pool_size=database_config.get("pool_size", 10)
+        )
+        # ✅ Multi-statement connections for fixed report SQL (dashboard), kept apart from the main pool;
+        # the dashboard runs one batch per connection in parallel
+        ui_instance.report_pool = pool_func(
+            username, password, host, database, ssl_enabled, ssl_cert_path,
+            pool_name="dbdoc_reports", pool_size=4, multi_statements=True
         )
 
         # Store connection info
-        ui_instance.conn = conn
-        ui_instance.cursor = cursor
         ui_instance.username = username
         ui_instance.role = "Technician"  # Swap for actual role lookup if available
 
@@ -1309,6 +1394,10 @@ def handle_login(ui_instance, database_config, connect_func, on_success_callback
         on_success_callback(ui_instance)
 
     except Exception as e:
+        # ✅ Release the pool names too, or every later login fails with "Pool 'dbdoc' already exists"
+        ui_instance.pool = close_pool(getattr(ui_instance, "pool", None))
+        ui_instance.report_pool = close_pool(getattr(ui_instance, "report_pool", None))
+
         # Avoid leaking technical errors unless debugging
         error_msg = QMessageBox(ui_instance)
         error_msg.setWindowTitle("⚠️ Connection Failed")
@@ -1359,84 +1448,46 @@ def handle_logout(ui_instance):
     ui_instance.username_entry.clear()
     ui_instance.password_entry.clear()
 
-    # 🔄 Recreate the settings page (fresh)
-    ui_instance.settings_page, ui_instance.host_entry, ui_instance.database_entry, ui_instance.ssl_checkbox, ui_instance.ssl_path_entry = create_settings_page(
-        ui_instance.database_config,
-        lambda: save_settings(
-            ui_instance.database_config,
-            ui_instance.host_entry,
-            ui_instance.database_entry,
-            ui_instance.password_entry,
-            ui_instance.ssl_checkbox,
-            ui_instance.ssl_path_entry,
-            ui_instance.SETTINGS_FILE,
-            ui_instance.central_widget,
-            ui_instance.login_page
-        ),
-        lambda: ui_instance.central_widget.setCurrentWidget(ui_instance.login_page)
-    )
-
-    ui_instance.settings_page.setStyleSheet("""
-        QWidget {
-            background-color: #2E2E2E;
-            color: white;
-        }
-        QLabel {
-            font-size: 16px;
-            font-weight: bold;
-            color: #3A9EF5;
-        }
-        QLineEdit {
-            background-color: #444;
-            color: white;
-            border: 1px solid #3A9EF5;
-            border-radius: 5px;
-            padding: 8px;
-        }
-        QPushButton {
-            background-color: #3A9EF5;
-            color: white;
-            padding: 10px;
-            font-weight: bold;
-            border-radius: 5px;
-        }
-        QPushButton:hover {
-            background-color: #1E7BCC;
-        }
-        QPushButton#backButton {
-            background-color: #666;
-        }
-        QPushButton#backButton:hover {
-            background-color: #888;
-        }
-    """)
-
-    ui_instance.central_widget.addWidget(ui_instance.settings_page)
-
-    # ❌ Close the DB connection (securely)
-    ui_instance.conn = close_connection(getattr(ui_instance, "conn", None))
-    ui_instance.cursor = None
+    # ❌ Close the DB connections (securely)
+    ui_instance.pool = close_pool(getattr(ui_instance, "pool", None))
+    ui_instance.report_pool = close_pool(getattr(ui_instance, "report_pool", None))
 
     # ✅ Let the user know they're out
     QMessageBox.information(ui_instance, "Logged Out", "✅ You have been successfully logged out.")
 
-def load_table(table_widget, cursor, table_name, update_status_callback, table_offset=0, limit=50, event_filter=None):
+def fetch_table_page(cursor, table_name, table_offset=0, limit=50, after_pk=None, primary_key_column=None):
+    """
+    Fetches one page of rows ordered by the primary key.
+    Pages after the first are found by keyset (`after_pk` = last key of the previous page);
+    OFFSET is only used when no key is known for a page past the first.
+    Pass a cached `primary_key_column` to skip the SHOW KEYS lookup.
+    Touches no widgets, so it is safe to run on a DBWorker thread.
+    """
 
         # ✅ Refresh the connection
     if hasattr(cursor, "connection"):
         cursor.connection.commit()  # Pull latest committed data
         cursor = cursor.connection.cursor()  # Create a fresh cursor
 
-    data = fetch_table_data(cursor, table_name, limit, table_offset)
-    total_rows = len(data)
+    if primary_key_column is None:
+        primary_key_column = fetch_primary_key_column(cursor, table_name)
+    if not primary_key_column:
+        data = fetch_table_data(cursor, table_name, limit, table_offset)
+    elif after_pk is not None or table_offset == 0:
+        data = fetch_table_data_after(cursor, table_name, primary_key_column, after_pk, limit)
+    else:
+        data = fetch_table_data_at_offset(cursor, table_name, primary_key_column, limit, table_offset)
+    return data, primary_key_column
 
-    primary_key_column = fetch_primary_key_column(cursor, table_name)
-    data = fetch_table_data(cursor, table_name, limit, table_offset, order_by=primary_key_column)
+def fill_table_page(table_widget, table_name, data, primary_key_column, update_status_callback, event_filter=None):
+    """Fills the table widget with rows returned by fetch_table_page()."""
 
     if not primary_key_column:
         print(f"❌ ERROR: No primary key found for table {table_name}.")
         return
 
+    total_rows = len(data)
+
     # Determine primary key column index
     primary_key_index = next(
         (i for i in range(table_widget.columnCount())
@@ -1444,9 +1495,6 @@ def load_table(table_widget, cursor, table_name, update_status_callback, table_o
         None
     )
 
-    table_widget.clearContents()
-    table_widget.setRowCount(total_rows)
-
     # Optional: handle 'jobs' specific logic
     status_column_index = None
     if table_name == "jobs":
@@ -1456,27 +1504,60 @@ def load_table(table_widget, cursor, table_name, update_status_callback, table_o
             None
         )
 
-    for row_idx, row_data in enumerate(data):
-        for col_idx, value in enumerate(row_data):
-            if col_idx == status_column_index:
-                combo = QComboBox()
-                combo.addItems(["Waiting for Parts", "In Progress", "Completed", "Picked Up"])
-                options = [combo.itemText(i) for i in range(combo.count())]
-                combo.setCurrentText(value if value in options else "In Progress")
-                combo.setEditable(False)
-                if event_filter:
-                    combo.installEventFilter(event_filter)
-                combo.currentTextChanged.connect(lambda text, row=row_idx: update_status_callback(row, text))
-                table_widget.setCellWidget(row_idx, col_idx, combo)
-            else:
-                item = QTableWidgetItem(str(value) if value is not None else "")
-                if col_idx == primary_key_index:
-                    item.setData(Qt.UserRole, str(value))
-                table_widget.setItem(row_idx, col_idx, item)
+    with bulk_table_update(table_widget):  # ✅ No `itemChanged` triggers or repaints while filling
+        table_widget.clearContents()
+        table_widget.setRowCount(total_rows)
+
+        for row_idx, row_data in enumerate(data):
+            _fill_page_row(table_widget, row_idx, row_data, primary_key_index, status_column_index,
+                           update_status_callback, event_filter)
 
     table_widget.horizontalHeader().setSectionResizeMode(QHeaderView.Stretch)
     table_widget.verticalHeader().setVisible(False)
 
+def insert_table_row(table_widget, table_name, row_idx, row_data, primary_key_column, update_status_callback, event_filter=None):
+    """Inserts one record at `row_idx` in place, e.g. after an INSERT, instead of reloading the page."""
+    primary_key_index = next(
+        (i for i in range(table_widget.columnCount())
+         if table_widget.horizontalHeaderItem(i).text() == primary_key_column),
+        None
+    )
+
+    status_column_index = None
+    if table_name == "jobs":
+        status_column_index = next(
+            (i for i in range(table_widget.columnCount())
+             if table_widget.horizontalHeaderItem(i).text().lower() == "status"),
+            None
+        )
+
+    with bulk_table_update(table_widget):
+        table_widget.insertRow(row_idx)
+        _fill_page_row(table_widget, row_idx, row_data, primary_key_index, status_column_index,
+                       update_status_callback, event_filter)
+
+def _fill_page_row(table_widget, row_idx, row_data, primary_key_index, status_column_index, update_status_callback, event_filter):
+    """Writes one fetched record into row `row_idx` (status dropdown for jobs)."""
+    for col_idx, value in enumerate(row_data):
+        if col_idx == status_column_index:
+            combo = QComboBox()
+            combo.addItems(["Waiting for Parts", "In Progress", "Completed", "Picked Up"])
+            options = [combo.itemText(i) for i in range(combo.count())]
+            combo.setCurrentText(value if value in options else "In Progress")
+            combo.setEditable(False)
+            if event_filter:
+                combo.installEventFilter(event_filter)
+            # ✅ Resolve the row when the status changes; rows shift as records are inserted/removed in place
+            combo.currentTextChanged.connect(
+                lambda text, combo=combo: update_status_callback(table_widget.indexAt(combo.pos()).row(), text)
+            )
+            table_widget.setCellWidget(row_idx, col_idx, combo)
+        else:
+            item = QTableWidgetItem(str(value) if value is not None else "")
+            if col_idx == primary_key_index:
+                item.setData(Qt.UserRole, str(value))
+            table_widget.setItem(row_idx, col_idx, item)
+
 def update_table_offset_ui(
     table_widget,
     pagination_label,
@@ -1490,20 +1571,26 @@ def update_table_offset_ui(
     refresh_callback,
     parent=None
 ):
-    # ✅ Fetch new page data based on fixed offset
-    data = fetch_function(table_name, limit, current_offset)
+    """
+    Fetches the page at `current_offset` and shows it through `refresh_callback(page)`.
+    `fetch_function` returns a (rows, primary key column) page.
+    Returns False (leaving the table as it was) when there is no such page.
+    """
+    # ✅ Fetch new page data (keyset or offset is decided by fetch_function)
+    page = fetch_function(table_name, limit, current_offset)
+    data = page[0]
     total_rows = len(data)
 
     # ✅ Stop if you're at the end
     if not data and current_offset > 0:
         if parent:
             QMessageBox.information(parent, "End of Data", "No more records to load.")
-        return
+        return False
 
     # ✅ Clear and refill table
     table_widget.clearContents()
     table_widget.setRowCount(total_rows)
-    refresh_callback()
+    refresh_callback(page)
 
     # ✅ Reset scroll bar
     table_widget.verticalScrollBar().setValue(0)
@@ -1515,6 +1602,115 @@ def update_table_offset_ui(
     # ✅ Update buttons
     prev_button.setEnabled(current_offset > 0)
     next_button.setEnabled(total_rows == limit)
+    return True
+
+# ✅ Table view stylesheets, shared by every create_table_view_dialog() call
+_SEARCH_ENTRY_CSS = """
+    background-color: #2A2A2A;
+    color: #E0E0E0;
+    padding: 6px;
+    border-radius: 5px;
+    border: 1px solid #3A3A3A;
+"""
+
+_REFRESH_BUTTON_CSS = """
+    QPushButton {
+        background-color: #2D9CDB;
+        color: white;
+        border-radius: 5px;
+        padding: 4px 12px;
+    }
+    QPushButton:hover {
+        background-color: #2385BA;
+    }
+"""
+
+_FILTER_BUTTON_CSS = """
+    QPushButton {
+        background-color: #2A2A2A;
+        color: #2D9CDB;
+        border: 1px solid #2D9CDB;
+        border-radius: 5px;
+        padding: 4px 12px;
+    }
+    QPushButton:hover {
+        background-color: #1A1A1A;
+    }
+"""
+
+_FILTER_POPUP_CSS = """
+    QFrame {
+        background-color: #1F1F1F;
+        border: 1px solid #3A3A3A;
+        border-radius: 8px;
+    }
+"""
+
+_COLUMN_LIST_CSS = """
+    QListWidget {
+        background-color: #2A2A2A;
+        color: #E0E0E0;
+        border: none;
+    }
+    QListWidget::item:selected {
+        background-color: #2D9CDB;
+        color: white;
+    }
+    QListWidget::item:hover {
+        background-color: #333333;
+    }
+    QScrollBar:vertical {
+        background: #2A2A2A;
+        width: 8px;
+        margin: 0px;
+    }
+    QScrollBar::handle:vertical {
+        background: #555555;
+        border-radius: 4px;
+    }
+    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
+        height: 0;
+    }
+"""
+
+_TABLE_WIDGET_CSS = """
+    QTableWidget {
+        background-color: #2A2A2A;
+        color: #E0E0E0;
+        gridline-color: #3A3A3A;
+        selection-background-color: #2D9CDB;
+        selection-color: #FFFFFF;
+        font-size: 10pt;
+    }
+    QTableWidget::item {
+        background-color: #2E2E2E;
+    }
+    QHeaderView::section {
+        background-color: #2D2D2D;
+        color: #E0E0E0;
+        font-weight: bold;
+        padding: 8px;
+        border: 0px;
+    }
+"""
+
+_PAGINATION_BUTTON_CSS = """
+    QPushButton {
+        background-color: #2D9CDB;
+        color: white;
+        border-radius: 5px;
+    }
+    QPushButton:hover {
+        background-color: #2385BA;
+    }
+"""
+
+_STATUS_BAR_CSS = """
+    background-color: #2A2A2A;
+    color: #AAAAAA;
+    padding: 8px 12px;
+    border-top: 1px solid #3A3A3A;
+"""
 
 def create_table_view_dialog(
     table_name,
@@ -1551,13 +1747,7 @@ def create_table_view_dialog(
     search_entry = QLineEdit()
     search_entry.setPlaceholderText("Enter search query...")
     search_entry.setFont(QFont("Segoe UI", 10))
-    search_entry.setStyleSheet("""
-        background-color: #2A2A2A;
-        color: #E0E0E0;
-        padding: 6px;
-        border-radius: 5px;
-        border: 1px solid #3A3A3A;
-    """)
+    search_entry.setStyleSheet(_SEARCH_ENTRY_CSS)
 
     clear_action = QAction(search_entry)
     clear_action.setIcon(search_entry.style().standardIcon(QStyle.SP_DialogCloseButton))
@@ -1568,45 +1758,18 @@ def create_table_view_dialog(
     refresh_button.clicked.connect(refresh_handler)
     refresh_button.setFont(QFont("Segoe UI", 10))
     refresh_button.setFixedHeight(32)
-    refresh_button.setStyleSheet("""
-        QPushButton {
-            background-color: #2D9CDB;
-            color: white;
-            border-radius: 5px;
-            padding: 4px 12px;
-        }
-        QPushButton:hover {
-            background-color: #2385BA;
-        }
-    """)
+    refresh_button.setStyleSheet(_REFRESH_BUTTON_CSS)
 
     # ───── Filter Button
     filter_toggle_btn = QPushButton("🔍 Filter Columns ▾")
     filter_toggle_btn.setFont(QFont("Segoe UI", 10))
     filter_toggle_btn.setFixedHeight(32)
-    filter_toggle_btn.setStyleSheet("""
-        QPushButton {
-            background-color: #2A2A2A;
-            color: #2D9CDB;
-            border: 1px solid #2D9CDB;
-            border-radius: 5px;
-            padding: 4px 12px;
-        }
-        QPushButton:hover {
-            background-color: #1A1A1A;
-        }
-    """)
+    filter_toggle_btn.setStyleSheet(_FILTER_BUTTON_CSS)
 
     # ───── Floating Filter Panel
     filter_popup = QFrame(dialog)
     filter_popup.setFrameShape(QFrame.StyledPanel)
-    filter_popup.setStyleSheet("""
-        QFrame {
-            background-color: #1F1F1F;
-            border: 1px solid #3A3A3A;
-            border-radius: 8px;
-        }
-    """)
+    filter_popup.setStyleSheet(_FILTER_POPUP_CSS)
     filter_popup.setFixedSize(220, 250)
     filter_popup.setVisible(False)
 
@@ -1615,32 +1778,7 @@ def create_table_view_dialog(
 
     column_list = QListWidget(filter_popup)
     column_list.setSelectionMode(QAbstractItemView.MultiSelection)
-    column_list.setStyleSheet("""
-    QListWidget {
-        background-color: #2A2A2A;
-        color: #E0E0E0;
-        border: none;
-    }
-    QListWidget::item:selected {
-        background-color: #2D9CDB;
-        color: white;
-    }
-    QListWidget::item:hover {
-        background-color: #333333;
-    }
-    QScrollBar:vertical {
-        background: #2A2A2A;
-        width: 8px;
-        margin: 0px;
-    }
-    QScrollBar::handle:vertical {
-        background: #555555;
-        border-radius: 4px;
-    }
-    QScrollBar::add-line:vertical, QScrollBar::sub-line:vertical {
-        height: 0;
-    }
-""")
+    column_list.setStyleSheet(_COLUMN_LIST_CSS)
 
     column_list.setAlternatingRowColors(False)
 
@@ -1653,6 +1791,12 @@ def create_table_view_dialog(
 
     popup_layout.addWidget(column_list)
 
+    # Off: tokens match anywhere in a value. On: a FULLTEXT index is used when one covers the
+    # checked columns, matching word starts only
+    word_prefix_checkbox = QCheckBox("⚡ Word-start search", filter_popup)
+    word_prefix_checkbox.setToolTip("Uses a FULLTEXT index when one covers the checked columns; matches word starts only")
+    popup_layout.addWidget(word_prefix_checkbox)
+
     def toggle_filter_popup():
         if filter_popup.isVisible():
             filter_popup.setVisible(False)
@@ -1675,7 +1819,10 @@ def create_table_view_dialog(
 
 
     search_entry.textChanged.connect(
-        lambda text: search_handler(get_checked_columns(), text)
+        lambda text: search_handler(get_checked_columns(), text, word_prefix_checkbox.isChecked())
+    )
+    word_prefix_checkbox.toggled.connect(
+        lambda checked: search_handler(get_checked_columns(), search_entry.text(), checked)
     )
 
     # Layout: search bar row
@@ -1691,26 +1838,7 @@ def create_table_view_dialog(
     scroll_area = QScrollArea()
     scroll_area.setWidgetResizable(True)
 
-    table_widget.setStyleSheet("""
-        QTableWidget {
-            background-color: #2A2A2A;
-            color: #E0E0E0;
-            gridline-color: #3A3A3A;
-            selection-background-color: #2D9CDB;
-            selection-color: #FFFFFF;
-            font-size: 10pt;
-        }
-        QTableWidget::item {
-            background-color: #2E2E2E;
-        }
-        QHeaderView::section {
-            background-color: #2D2D2D;
-            color: #E0E0E0;
-            font-weight: bold;
-            padding: 8px;
-            border: 0px;
-        }
-    """)
+    table_widget.setStyleSheet(_TABLE_WIDGET_CSS)
 
     table_widget.setAlternatingRowColors(False)
     scroll_area.setWidget(table_widget)
@@ -1729,16 +1857,7 @@ def create_table_view_dialog(
     for btn in [prev_button, next_button]:
         btn.setFont(QFont("Segoe UI", 10))
         btn.setFixedSize(120, 40)
-        btn.setStyleSheet("""
-            QPushButton {
-                background-color: #2D9CDB;
-                color: white;
-                border-radius: 5px;
-            }
-            QPushButton:hover {
-                background-color: #2385BA;
-            }
-        """)
+        btn.setStyleSheet(_PAGINATION_BUTTON_CSS)
 
     pagination_label.setFont(QFont("Segoe UI", 10))
     pagination_label.setAlignment(Qt.AlignCenter)
@@ -1784,19 +1903,15 @@ def create_table_view_dialog(
     # ───────────────────── Status Bar
     status_bar = QLabel("✅ Ready")
     status_bar.setFont(QFont("Segoe UI", 9))
-    status_bar.setStyleSheet("""
-        background-color: #2A2A2A;
-        color: #AAAAAA;
-        padding: 8px 12px;
-        border-top: 1px solid #3A3A3A;
-    """)
+    status_bar.setStyleSheet(_STATUS_BAR_CSS)
     main_layout.addWidget(status_bar)
 
     dialog.setLayout(main_layout)
 
     return dialog, prev_button, next_button, refresh_button, status_bar
 
-def run_query(cursor, conn, parent=None):
+def run_query(pool, parent=None):
+    """ SQL query window; each query runs on a pooled connection off the GUI thread. """
     query_window = QDialog(parent)
     query_window.setWindowTitle("📊 Run SQL Query")
     query_window.setGeometry(100, 100, 800, 650)
@@ -1877,31 +1992,54 @@ def run_query(cursor, conn, parent=None):
     layout.addWidget(results_table)
 
     query_results = []
+    query_headers = []
+    execute_button = None
+    window_closed = False
+
+    def show_result(query, result):
+        if result["type"] != "select":
+            if query.lower().startswith(("create", "alter", "drop", "rename")) and hasattr(parent, "forget_schema"):
+                parent.forget_schema()  # ✅ Cached column/key lookups are stale now
+            if hasattr(parent, "_job_rows_cache"):
+                parent._job_rows_cache.clear()  # ✅ Any write may have touched the rows the job dialogs show
+        if window_closed:
+            return
+        execute_button.setEnabled(True)
+        if result["type"] == "select":
+            query_results[:] = result["results"]
+            headers = query_headers[:] = result["headers"]
+
+            results_table.setRowCount(len(query_results))
+            results_table.setColumnCount(len(headers))
+            results_table.setHorizontalHeaderLabels(headers)
+
+            for row_idx, row in enumerate(query_results):
+                for col_idx, value in enumerate(row):
+                    item = QTableWidgetItem(str(value))
+                    results_table.setItem(row_idx, col_idx, item)
+
+            results_table.resizeColumnsToContents()
+            QMessageBox.information(query_window, "✅ Success", "Query executed successfully.")
+        else:
+            QMessageBox.information(query_window, "✅ Success", f"{result['rowcount']} rows affected.")
+
+    def show_error(message):
+        if window_closed:
+            return
+        execute_button.setEnabled(True)
+        QMessageBox.critical(query_window, "⚠ Error", f"Failed to execute query:\n{message}")
 
     def execute_query():
-        nonlocal query_results
         query = query_input.toPlainText().strip()
-        try:
-            result = execute_sql_query(cursor, conn, query)
-            if result["type"] == "select":
-                query_results[:] = result["results"]
-                headers = result["headers"]
-
-                results_table.setRowCount(len(query_results))
-                results_table.setColumnCount(len(headers))
-                results_table.setHorizontalHeaderLabels(headers)
-
-                for row_idx, row in enumerate(query_results):
-                    for col_idx, value in enumerate(row):
-                        item = QTableWidgetItem(str(value))
-                        results_table.setItem(row_idx, col_idx, item)
-
-                results_table.resizeColumnsToContents()
-                QMessageBox.information(query_window, "✅ Success", "Query executed successfully.")
-            else:
-                QMessageBox.information(query_window, "✅ Success", f"{result['rowcount']} rows affected.")
-        except Exception as e:
-            QMessageBox.critical(query_window, "⚠ Error", f"Failed to execute query:\n{e}")
+        if not query:
+            show_error("Query is empty")
+            return
+        # ✅ The query runs on a worker thread, so the window keeps repainting during slow queries
+        execute_button.setEnabled(False)
+        run_in_background(
+            pool, _keeping_database(lambda cursor, conn: execute_sql_query(cursor, conn, query)),
+            lambda result: show_result(query, result), show_error
+        )
 
     def export_to_excel():
         if not query_results:
@@ -1911,12 +2049,15 @@ def run_query(cursor, conn, parent=None):
         file_path, _ = QFileDialog.getSaveFileName(query_window, "Save File", "", "Excel Files (*.xlsx);;All Files (*)")
         if file_path:
             try:
-                headers = [desc[0] for desc in cursor.description]
-                export_query_results_to_excel(query_results, headers, file_path)
+                export_query_results_to_excel(query_results, query_headers, file_path)
                 QMessageBox.information(query_window, "✅ Success", f"Results exported to {file_path}")
             except Exception as e:
                 QMessageBox.critical(query_window, "⚠ Error", f"Export failed:\n{e}")
 
+    def window_finished(_):
+        nonlocal window_closed
+        window_closed = True  # ✅ A query still running reports back to nobody
+
     def clear_query():
         query_input.clear()
 
@@ -1934,6 +2075,8 @@ def run_query(cursor, conn, parent=None):
     ]:
         btn = QPushButton(label)
         btn.clicked.connect(func)
+        if func is execute_query:
+            execute_button = btn
         btn.setStyleSheet(f"""
             QPushButton {{
                 background-color: {color};
@@ -1949,9 +2092,14 @@ def run_query(cursor, conn, parent=None):
 
     layout.addLayout(button_layout)
     query_window.setLayout(layout)
+    query_window.finished.connect(window_finished)
     query_window.exec_()
 
-def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh_callback, parent=None):
+def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh_callback, parent=None, cache=None):
+    """
+    Opens the "Add Record" form for `table_name`.
+    Pass a `cache` dict to keep the built dialog per table: later opens only reset the fields.
+    """
     from PyQt5.QtGui import QIcon
     from PyQt5.QtWidgets import (
         QDialog, QVBoxLayout, QHBoxLayout, QLabel, QPushButton,
@@ -1961,6 +2109,12 @@ def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh
     from PyQt5.QtCore import Qt
     from datetime import datetime
 
+    if cache is not None and table_name in cache:
+        add_window, reset_entries = cache[table_name]
+        reset_entries()
+        add_window.exec_()
+        return
+
     add_window = QDialog(parent)
     add_window.setWindowTitle(f"➕ Add Record to {table_name}")
     add_window.setFixedSize(640, 740)
@@ -2006,6 +2160,7 @@ def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh
     form_grid.setVerticalSpacing(16)
 
     entry_widgets = {}
+    entry_defaults = {}  # column -> callable giving the field's initial text
     non_auto_columns = [col for col in columns if col != columns[0]]
     row = 0
 
@@ -2029,11 +2184,13 @@ def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh
             entry.setCurrentText("In Progress")
 
         elif col.lower() == "datasave":
-            entry = QLineEdit("1")
+            entry = QLineEdit()
+            entry_defaults[col] = lambda: "1"
 
         elif col.lower() in ["startdate", "date"] or ("date" in col_type and col.lower() != "enddate"):
-            entry = QLineEdit(datetime.now().strftime(
-                "%Y-%m-%d %H:%M:%S") if "time" in col_type else datetime.now().strftime("%Y-%m-%d"))
+            entry = QLineEdit()
+            date_format = "%Y-%m-%d %H:%M:%S" if "time" in col_type else "%Y-%m-%d"
+            entry_defaults[col] = lambda date_format=date_format: datetime.now().strftime(date_format)
             entry.setPlaceholderText("YYYY-MM-DD or timestamp")
 
         elif col.lower() == "enddate":
@@ -2117,6 +2274,32 @@ def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh
 
     layout.addWidget(card)
 
+    # ───── Success message (built once with the dialog and reused on every save)
+    msg = QMessageBox(parent)
+    msg.setWindowTitle("✅ Success")
+    msg.setText("Record added successfully!")
+    msg.setStyleSheet("""
+        QMessageBox {
+            background-color: #1E1E1E;
+            color: white;
+            border-radius: 10px;
+        }
+        QLabel {
+            color: white;
+            font-size: 14px;
+            font-weight: bold;
+        }
+        QPushButton {
+            background-color: #3A9EF5;
+            color: white;
+            padding: 8px;
+            border-radius: 5px;
+        }
+        QPushButton:hover {
+            background-color: #307ACC;
+        }
+    """)
+
     # ───── Save Logic
     def save():
         values = []
@@ -2131,30 +2314,6 @@ def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh
 
         success = db_insert_func(table_name, non_auto_columns, values)
         if success:
-            msg = QMessageBox(parent)
-            msg.setWindowTitle("✅ Success")
-            msg.setText("Record added successfully!")
-            msg.setStyleSheet("""
-                QMessageBox {
-                    background-color: #1E1E1E;
-                    color: white;
-                    border-radius: 10px;
-                }
-                QLabel {
-                    color: white;
-                    font-size: 14px;
-                    font-weight: bold;
-                }
-                QPushButton {
-                    background-color: #3A9EF5;
-                    color: white;
-                    padding: 8px;
-                    border-radius: 5px;
-                }
-                QPushButton:hover {
-                    background-color: #307ACC;
-                }
-            """)
             msg.exec_()
             refresh_callback()
             add_window.accept()
@@ -2164,10 +2323,24 @@ def add_record_dialog(table_name, columns, column_types, db_insert_func, refresh
     save_button.clicked.connect(save)
     cancel_button.clicked.connect(add_window.reject)
 
-    # Auto focus first field
-    if entry_widgets:
-        first_widget = next(iter(entry_widgets.values()))
-        if hasattr(first_widget, "setFocus"):
-            first_widget.setFocus()
+    def reset_entries():
+        """Puts every field back to its initial value (used on each open)."""
+        for col, widget in entry_widgets.items():
+            if isinstance(widget, QComboBox):
+                widget.setCurrentText("In Progress")
+            elif isinstance(widget, QTextEdit):
+                widget.clear()
+            else:
+                widget.setText(entry_defaults.get(col, str)())
+
+        # Auto focus first field
+        if entry_widgets:
+            first_widget = next(iter(entry_widgets.values()))
+            if hasattr(first_widget, "setFocus"):
+                first_widget.setFocus()
+
+    reset_entries()
+    if cache is not None:
+        cache[table_name] = (add_window, reset_entries)
 
     add_window.exec_()
@@ -1,6 +1,8 @@
 import mariadb
+from mariadb.constants import CLIENT
+from concurrent.futures import ThreadPoolExecutor
+from contextlib import contextmanager
 from datetime import datetime
-import pandas as pd
 
 
 def fetch_tables(cursor):
@@ -14,64 +16,137 @@ def fetch_tables(cursor):
     except mariadb.Error as e:
         raise Exception(f"Failed to retrieve tables: {e}")
 
-def connect_to_database(username, password, host, database, ssl_enabled=False, ssl_cert_path=None):
+def _connection_kwargs(username, password, host, database, ssl_enabled=False, ssl_cert_path=None):
+    """Builds the keyword arguments shared by single connections and pools."""
+    connection_kwargs = {
+        "user": username,
+        "password": password,
+        "host": host,
+        "database": database
+    }
+
+    if ssl_enabled and ssl_cert_path:
+        connection_kwargs.update({
+            "ssl_ca": ssl_cert_path,
+            "ssl_cert": ssl_cert_path,
+            "ssl_key": ssl_cert_path
+        })
+
+    return connection_kwargs
+
+def create_connection_pool(username, password, host, database, ssl_enabled=False, ssl_cert_path=None,
+                           pool_name="dbdoc", pool_size=10, multi_statements=False,
+                           pool_validation_interval=1000):
     """
-    Attempts to connect to the database with optional SSL.
-    Returns connection and cursor objects if successful.
-    Raises an exception if connection fails.
+    Creates a MariaDB connection pool with the given credentials and optional SSL.
+    Idle connections are validated by the pool before being handed out, at most once per second
+    (pool_validation_interval, in ms) so back-to-back borrows skip the extra ping.
+    multi_statements=True lets one execute() carry several ';'-separated statements (see run_aggregates);
+    keep it to a separate pool used only for fixed, trusted SQL.
+    Raises an exception if the pool cannot be created.
     """
+    connection_kwargs = _connection_kwargs(username, password, host, database, ssl_enabled, ssl_cert_path)
+    if multi_statements:
+        connection_kwargs["client_flag"] = CLIENT.MULTI_STATEMENTS
     try:
-        connection_kwargs = {
-            "user": username,
-            "password": password,
-            "host": host,
-            "database": database
-        }
-
-        if ssl_enabled and ssl_cert_path:
-            connection_kwargs.update({
-                "ssl_ca": ssl_cert_path,
-                "ssl_cert": ssl_cert_path,
-                "ssl_key": ssl_cert_path
-            })
-
-        conn = mariadb.connect(**connection_kwargs)
-        cursor = conn.cursor()
-        return conn, cursor
-
+        return mariadb.ConnectionPool(
+            pool_name=pool_name,
+            pool_size=pool_size,
+            pool_validation_interval=pool_validation_interval,
+            **connection_kwargs
+        )
     except mariadb.Error as e:
-        raise Exception(f"Database connection failed: {e}")
+        raise Exception(f"Connection pool creation failed: {e}")
 
-def fetch_data(cursor, table_name, limit=50, offset=0):
+@contextmanager
+def pooled_cursor(pool, buffered=True):
     """
-    Fetch data in batches from the specified table in the database.
-
-    Args:
-        cursor (mariadb.cursor): The database cursor.
-        table_name (str): Name of the table to fetch data from.
-        limit (int): Number of records to fetch.
-        offset (int): Offset for pagination.
-
-    Returns:
-        list: Fetched records or an empty list on error.
+    Borrows a connection from the pool and yields a cursor on it.
+    Pass buffered=False to stream large result sets instead of holding them client-side.
+    The connection goes back to the pool when the block exits.
     """
+    conn = pool.get_connection()
     try:
-        query = f"SELECT * FROM {table_name} ORDER BY 1 DESC LIMIT %s OFFSET %s"
-        cursor.execute(query, (limit, offset))
-        return cursor.fetchall()
-    except mariadb.Error as e:
-        print(f"Database Error: {e}")
-        return []
+        cursor = conn.cursor(buffered=buffered)
+        try:
+            yield cursor
+        finally:
+            cursor.close()
+    finally:
+        conn.close()  # Returns the connection to the pool
+
+@contextmanager
+def transaction(conn):
+    """
+    Runs the statements of the block as one transaction: one commit when it exits normally,
+    a rollback if anything in it raises (so a failed write never lingers into the next commit).
+    """
+    try:
+        yield conn
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
 
-def close_connection(conn):
-    """Safely closes a database connection if it exists."""
-    if conn:
+def run_aggregates(cursor, queries, multi_statements=True, with_columns=False):
+    """
+    Runs independent read-only queries and returns {name: rows} for `queries` ({name: sql}).
+    With multi_statements (the connection needs CLIENT.MULTI_STATEMENTS) they go to the server
+    as one ';'-joined execute() and the results are read back with nextset(): one round-trip.
+    Otherwise they run one after another on the same cursor.
+    with_columns=True returns {name: (column_names, rows)} instead.
+    """
+    def read_result():
+        rows = cursor.fetchall()
+        if with_columns:
+            return [desc[0] for desc in cursor.description], rows
+        return rows
+
+    if not multi_statements:
+        results = {}
+        for name, query in queries.items():
+            cursor.execute(query)
+            results[name] = read_result()
+        return results
+
+    names = list(queries)
+    if not names:
+        return {}
+    cursor.execute(";\n".join(queries[name].strip().rstrip(";") for name in names))
+    results = {}
+    for i, name in enumerate(names):
+        results[name] = read_result()
+        if i < len(names) - 1:
+            cursor.nextset()
+    return results
+
+def run_aggregates_parallel(pool, queries, workers, multi_statements=True, with_columns=False):
+    """
+    Splits `queries` into up to `workers` groups and runs each group through run_aggregates()
+    on its own pooled connection at the same time; returns the merged {name: rows}.
+    `workers` must not exceed the connections the pool can hand out at once.
+    """
+    names = list(queries)
+    groups = [names[i::workers] for i in range(min(workers, len(names)))]
+
+    def run_group(group):
+        with pooled_cursor(pool) as cursor:
+            return run_aggregates(cursor, {name: queries[name] for name in group}, multi_statements, with_columns)
+
+    results = {}
+    with ThreadPoolExecutor(max_workers=max(len(groups), 1)) as executor:
+        for group_results in executor.map(run_group, groups):
+            results.update(group_results)
+    return {name: results[name] for name in names}
+
+def close_pool(pool):
+    """Safely closes a connection pool if it exists."""
+    if pool:
         try:
-            conn.close()
+            pool.close()
         except Exception:
             pass
-        return None
-    return conn
+    return None
 
 def fetch_table_data(cursor, table_name, limit=50, offset=0, order_by=None, descending=True):
     order_clause = ""
@@ -82,6 +157,33 @@ def fetch_table_data(cursor, table_name, limit=50, offset=0, order_by=None, desc
     cursor.execute(query)
     return cursor.fetchall()
 
+def fetch_table_data_after(cursor, table_name, pk_column, after_pk=None, limit=50):
+    """
+    Keyset pagination: fetches the next `limit` rows below `after_pk`, newest first.
+    Walks the primary key index instead of scanning and discarding OFFSET rows.
+    Pass after_pk=None for the first page.
+    """
+    where_clause = f"WHERE `{pk_column}` < %s" if after_pk is not None else ""
+    params = (after_pk, limit) if after_pk is not None else (limit,)
+    cursor.execute(
+        f"SELECT * FROM `{table_name}` {where_clause} ORDER BY `{pk_column}` DESC LIMIT %s",
+        params
+    )
+    return cursor.fetchall()
+
+def fetch_table_data_at_offset(cursor, table_name, pk_column, limit=50, offset=0):
+    """
+    OFFSET fallback for jumping to an arbitrary page.
+    The offset is walked on the primary key alone and the full rows are joined back afterwards.
+    """
+    cursor.execute(
+        f"SELECT t.* FROM `{table_name}` AS t "
+        f"JOIN (SELECT `{pk_column}` FROM `{table_name}` ORDER BY `{pk_column}` DESC LIMIT %s OFFSET %s) AS page "
+        f"USING (`{pk_column}`) ORDER BY t.`{pk_column}` DESC",
+        (limit, offset)
+    )
+    return cursor.fetchall()
+
 def fetch_table_data_with_columns(cursor, table_name, limit=50, offset=0, order_by=None, descending=True):
     """
     Fetches rows and column names from a table. Use for UI rendering.
@@ -90,41 +192,165 @@ def fetch_table_data_with_columns(cursor, table_name, limit=50, offset=0, order_
     columns = [desc[0] for desc in cursor.description]
     return rows, columns
 
+def fetch_fulltext_indexes(cursor, table_name):
+    """
+    Returns the column sets of every FULLTEXT index on a table.
+    MATCH() can only use an index whose columns are exactly the ones searched.
+    """
+    cursor.execute(f"SHOW INDEX FROM `{table_name}` WHERE Index_type = 'FULLTEXT'")
+    indexes = {}
+    for row in cursor.fetchall():
+        indexes.setdefault(row[2], set()).add(row[4])  # Key_name -> Column_name
+    return [frozenset(columns) for columns in indexes.values()]
+
+# InnoDB's default FULLTEXT stopwords: never indexed, so a required "+word*" on one matches nothing
+_FULLTEXT_STOPWORDS = frozenset((
+    "a", "about", "an", "are", "as", "at", "be", "by", "com", "de", "en", "for", "from", "how", "i",
+    "in", "is", "it", "la", "of", "on", "or", "that", "the", "this", "to", "was", "what", "when",
+    "where", "who", "will", "with", "und", "www"
+))
+
+def fulltext_searchable(tokens):
+    """
+    True if every token can be a required word prefix in a boolean MATCH: whole words of 3+
+    characters (FULLTEXT's minimum) that are not stopwords. Anything else needs the LIKE path.
+    """
+    return all(token.isalnum() and len(token) >= 3 and token.lower() not in _FULLTEXT_STOPWORDS
+               for token in tokens)
+
+def build_search_query(table_name, columns, token_count, fulltext=False):
+    """
+    Builds the SQL template for a multi-token search across `columns`.
+    FULLTEXT: one MATCH ... AGAINST in boolean mode (one parameter); matches word starts only.
+    LIKE: every token must match at least one column anywhere in the value
+    (token_count * len(columns) parameters).
+    The last parameter is always the row LIMIT.
+    """
+    if fulltext:
+        match_columns = ", ".join(f"`{col}`" for col in columns)
+        where_clause = f"MATCH({match_columns}) AGAINST (%s IN BOOLEAN MODE)"
+    else:
+        token_condition = "(" + " OR ".join(f"`{col}` LIKE %s" for col in columns) + ")"
+        where_clause = " AND ".join([token_condition] * token_count)
+
+    return f"SELECT * FROM `{table_name}` WHERE {where_clause} LIMIT %s;"
+
+def ensure_start_date_index(cursor, conn):
+    """
+    One-off migration: adds an indexed, stored `StartDateDate` column to jobs so the
+    dashboard's weekly/day-of-week GROUP BYs read the index instead of scanning JOBS.
+    The column is INVISIBLE so `SELECT *` and inserts are unaffected.
+    Returns True if the column is available, False if the migration could not run.
+    """
+    try:
+        cursor.execute("SHOW INDEX FROM jobs WHERE Key_name = 'idx_jobs_startdatedate'")
+        if cursor.fetchall():
+            return True
+
+        cursor.execute("SHOW COLUMNS FROM jobs LIKE 'StartDateDate'")
+        if not cursor.fetchall():
+            cursor.execute(
+                "ALTER TABLE jobs ADD COLUMN StartDateDate DATE "
+                "GENERATED ALWAYS AS (DATE(StartDate)) STORED INVISIBLE"
+            )
+        cursor.execute("ALTER TABLE jobs ADD INDEX idx_jobs_startdatedate (StartDateDate)")
+        conn.commit()
+        return True
+    except mariadb.Error as e:
+        print(f"⚠️ StartDateDate migration skipped: {e}")
+        return False
+
+def fetch_column_types(cursor):
+    """
+    Returns {table: {column_name: column_type}} for every table of the current database,
+    columns in table order, from one information_schema query instead of a DESCRIBE per table.
+    """
+    cursor.execute(
+        "SELECT TABLE_NAME, COLUMN_NAME, COLUMN_TYPE FROM information_schema.columns "
+        "WHERE TABLE_SCHEMA = DATABASE() ORDER BY TABLE_NAME, ORDINAL_POSITION"
+    )
+    schema = {}
+    for table_name, column_name, column_type in cursor.fetchall():
+        schema.setdefault(table_name, {})[column_name] = column_type
+    return schema
+
 def fetch_primary_key_column(cursor, table_name):
+    """Returns the table's primary key column name, or None. Callers cache it (see DatabaseApp._primary_key_for)."""
     cursor.execute(f"SHOW KEYS FROM {table_name} WHERE Key_name = 'PRIMARY'")
     pk_info = cursor.fetchone()
     return pk_info[4] if pk_info else None
 
-def paginate_table_data(fetch_function, table_name, limit, offset):
-    """Handles pagination logic and returns the new offset and data."""
-    new_offset = max(0, offset)
-    data = fetch_function(table_name, limit, new_offset)
-    return new_offset, data
+def quote_identifier(name):
+    """Backtick-quotes a table/column name for SQL, escaping embedded backticks."""
+    if not isinstance(name, str) or not name:
+        raise ValueError(f"Invalid SQL identifier: {name!r}")
+    return "`" + name.replace("`", "``") + "`"
 
-def get_primary_key_column(cursor, table_name):
-    cursor.execute(f"SHOW KEYS FROM {table_name} WHERE Key_name = 'PRIMARY'")
-    result = cursor.fetchone()
-    return result[4] if result else None
-
-def check_primary_key_exists(cursor, table_name, pk_column, pk_value):
-    cursor.execute(f"SELECT {pk_column} FROM {table_name} WHERE {pk_column} = %s", (pk_value,))
+def build_table_sql(table_name, pk_column, columns):
+    """
+    Builds the parameterized statements the table view runs against one table.
+    `columns` must come from the table's own result set; identifiers outside it are rejected.
+    Built once per opened table so every edit/delete reuses the exact same SQL string.
+    """
+    if pk_column not in columns:
+        raise ValueError(f"Primary key '{pk_column}' is not a column of {table_name}")
+
+    table = quote_identifier(table_name)
+    pk = quote_identifier(pk_column)
+    return {
+        "select_pk": f"SELECT {pk} FROM {table} WHERE {pk} = %s",
+        "select_row": f"SELECT * FROM {table} WHERE {pk} = %s",
+        "count_pk": f"SELECT COUNT(*) FROM {table} WHERE {pk} = %s",
+        "update_pk": f"UPDATE {table} SET {pk} = %s WHERE {pk} = %s",
+        "update_col": {
+            column: f"UPDATE {table} SET {quote_identifier(column)} = %s WHERE {pk} = %s"
+            for column in columns
+        },
+        "delete": f"DELETE FROM {table} WHERE {pk} = %s",
+    }
+
+def check_primary_key_exists(cursor, table_name, pk_column, pk_value, query=None):
+    cursor.execute(query or f"SELECT {pk_column} FROM {table_name} WHERE {pk_column} = %s", (pk_value,))
     result = cursor.fetchone()
     return result[0] if result else None
 
-def check_duplicate_primary_key(cursor, table_name, pk_column, new_pk_value):
-    cursor.execute(f"SELECT COUNT(*) FROM {table_name} WHERE {pk_column} = %s", (new_pk_value,))
+def check_duplicate_primary_key(cursor, table_name, pk_column, new_pk_value, query=None):
+    cursor.execute(query or f"SELECT COUNT(*) FROM {table_name} WHERE {pk_column} = %s", (new_pk_value,))
     return cursor.fetchone()[0] > 0
 
-def update_column(cursor, conn, table_name, column_name, new_value, pk_column, pk_value):
+def update_column(cursor, conn, table_name, column_name, new_value, pk_column, pk_value, query=None):
     cursor.execute(
-        f"UPDATE {table_name} SET {column_name} = %s WHERE {pk_column} = %s",
+        query or f"UPDATE {table_name} SET {column_name} = %s WHERE {pk_column} = %s",
         (new_value, pk_value)
     )
     conn.commit()
 
-def update_primary_key(cursor, conn, table_name, pk_column, old_pk, new_pk):
+def update_columns_bulk(cursor, conn, table_name, pk_column, changes):
+    """
+    Writes many cell edits in one transaction.
+    `changes` maps column -> [(pk_value, new_value), ...]; each column is a single
+    UPDATE ... SET col = CASE pk WHEN ... THEN ... END WHERE pk IN (...).
+    """
+    table = quote_identifier(table_name)
+    pk = quote_identifier(pk_column)
+    try:
+        for column_name, rows in changes.items():
+            cases = " ".join(["WHEN %s THEN %s"] * len(rows))
+            keys = ", ".join(["%s"] * len(rows))
+            params = [value for row in rows for value in row] + [pk_value for pk_value, _ in rows]
+            cursor.execute(
+                f"UPDATE {table} SET {quote_identifier(column_name)} = CASE {pk} {cases} END "
+                f"WHERE {pk} IN ({keys})",
+                params
+            )
+        conn.commit()
+    except Exception:
+        conn.rollback()
+        raise
+
+def update_primary_key(cursor, conn, table_name, pk_column, old_pk, new_pk, query=None):
     cursor.execute(
-        f"UPDATE {table_name} SET {pk_column} = %s WHERE {pk_column} = %s",
+        query or f"UPDATE {table_name} SET {pk_column} = %s WHERE {pk_column} = %s",
         (new_pk, old_pk)
     )
     conn.commit()
@@ -173,6 +399,23 @@ def update_status(cursor, conn, table_name, pk_column, pk_value, new_status):
         print(f"❌ ERROR in update_status: {e}")
         return False
 
+def fetch_job_rows(cursor, table_name, columns, key_column, job_id, after_key=None, limit=200):
+    """
+    Fetches one batch of a job's child rows (costs, payments, ...) ordered by `key_column`.
+    Pass the last key of the previous batch as `after_key` (keyset paging).
+    """
+    where_clause = "JOBID = %s"
+    params = (job_id,)
+    if after_key is not None:
+        where_clause += f" AND {key_column} > %s"
+        params += (after_key,)
+
+    cursor.execute(
+        f"SELECT {', '.join(columns)} FROM {table_name} WHERE {where_clause} ORDER BY {key_column} LIMIT %s",
+        params + (limit,)
+    )
+    return cursor.fetchall()
+
 def execute_sql_query(cursor, conn, query):
     if not query:
         raise ValueError("Query is empty")
@@ -189,20 +432,57 @@ def execute_sql_query(cursor, conn, query):
         return {"type": "update", "rowcount": cursor.rowcount}
 
 def export_query_results_to_excel(results, headers, file_path):
-    df = pd.DataFrame(results, columns=headers)
-    df.to_excel(file_path, index=False)
+    write_excel_sheets(file_path, [("Sheet1", headers, results)])
 
-def insert_record(cursor, conn, table_name, columns, values):
+def write_excel_sheets(file_path, sheets):
+    """
+    Writes each (sheet_name, columns, rows) of `sheets` to its own worksheet.
+    Rows are streamed straight from the fetched tuples with xlsxwriter (no DataFrame).
+    `sheets` and each `rows` may be generators; a sheet's rows are consumed in full
+    before the next sheet is requested, so a cursor can be streamed table by table.
+    """
+    import xlsxwriter  # Only needed for exports; keeps it off the startup path
+
+    # constant_memory flushes each row as soon as the next one starts
+    with xlsxwriter.Workbook(file_path, {"constant_memory": True,
+                                         "default_date_format": "yyyy-mm-dd hh:mm:ss"}) as workbook:
+        header_format = workbook.add_format({"bold": True})
+        for sheet_name, columns, rows in sheets:
+            worksheet = workbook.add_worksheet(sheet_name)
+            worksheet.write_row(0, 0, columns, header_format)
+            for row_number, row in enumerate(rows, 1):
+                worksheet.write_row(row_number, 0, row)
+
+def build_insert_query(table_name, columns):
+    """Builds the parameterized INSERT statement for `columns` of a table."""
+    placeholders = ", ".join(["%s"] * len(columns))
+    return f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
+
+def insert_record(cursor, conn, table_name, columns, values, query=None):
     """
     Inserts a record into the database.
+    Pass a prebuilt `query` (see build_insert_query) to skip rebuilding the statement.
     Returns True on success, False on failure.
     """
     try:
-        placeholders = ", ".join(["%s"] * len(columns))
-        query = f"INSERT INTO {table_name} ({', '.join(columns)}) VALUES ({placeholders})"
-        cursor.execute(query, values)
+        cursor.execute(query or build_insert_query(table_name, columns), values)
         conn.commit()
         return True
     except Exception as e:
         print(f"❌ DB Insert Failed: {e}")
         return False
+
+def insert_records(cursor, conn, table_name, columns, rows, query=None):
+    """
+    Inserts many records in one transaction.
+    executemany() sends all rows in a single bulk request instead of one round-trip per row.
+    Returns True on success, False on failure (nothing is inserted).
+    """
+    try:
+        cursor.executemany(query or build_insert_query(table_name, columns), rows)
+        conn.commit()
+        return True
+    except Exception as e:
+        conn.rollback()
+        print(f"❌ DB Bulk Insert Failed: {e}")
+        return False